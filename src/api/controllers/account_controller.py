@@ -6,7 +6,7 @@ from infrastructure.databases.mssql import session
 from services.account_service import AccountService
 from services.role_service import RoleService
 from api.responses import success_response, error_response, not_found_response, validation_error_response
-from api.schemas import AccountCreateRequestSchema, AccountUpdateRequestSchema, AccountResponseSchema
+from api.schemas import AccountCreateRequestSchema, AccountUpdateRequestSchema, AccountResponseSchema, fast_dump, fast_load
 from datetime import datetime
 
 account_bp = Blueprint('account', __name__, url_prefix='/api/accounts')
@@ -19,6 +19,12 @@ role_repo = RoleRepository(session)
 account_service = AccountService(account_repo)
 role_service = RoleService(role_repo)
 
+# Initialize schemas once (reused across requests)
+_account_create_request_schema = AccountCreateRequestSchema()
+_account_response_schema = AccountResponseSchema()
+_account_response_many_schema = AccountResponseSchema(many=True)
+_account_update_request_schema = AccountUpdateRequestSchema()
+
 
 @account_bp.route('/health', methods=['GET'])
 def health_check():
@@ -91,8 +97,7 @@ def create_account():
     """
     try:
         # Validate request data with schema
-        schema = AccountCreateRequestSchema()
-        data = schema.load(request.get_json())
+        data = fast_load(_account_create_request_schema, request.get_json())
         
         # Check if email already exists via SERVICE ✅
         if account_service.check_email_exists(data['email']):
@@ -113,8 +118,7 @@ def create_account():
         )
         
         # Serialize response with schema
-        response_schema = AccountResponseSchema()
-        return success_response(response_schema.dump(account), 'Account created successfully', 201)
+        return success_response(fast_dump(_account_response_schema, account), 'Account created successfully', 201)
         
     except ValidationError as e:
         return validation_error_response(e.messages)
@@ -149,8 +153,7 @@ def get_account(account_id):
             return not_found_response('Account not found')
         
         # Serialize response with schema
-        schema = AccountResponseSchema()
-        return success_response(schema.dump(account))
+        return success_response(fast_dump(_account_response_schema, account))
         
     except Exception as e:
         return error_response(f'Internal server error: {str(e)}', 500)
@@ -181,8 +184,7 @@ def get_account_by_email(email):
             return not_found_response('Account not found')
         
         # Serialize response with schema
-        schema = AccountResponseSchema()
-        return success_response(schema.dump(account))
+        return success_response(fast_dump(_account_response_schema, account))
         
     except Exception as e:
         return error_response(f'Internal server error: {str(e)}', 500)
@@ -209,11 +211,10 @@ def get_accounts_by_role(role_id):
         accounts = account_service.get_accounts_by_role(role_id)
         
         # Serialize response with schema
-        schema = AccountResponseSchema(many=True)
         return success_response({
             'role_id': role_id,
             'count': len(accounts),
-            'accounts': schema.dump(accounts)
+            'accounts': fast_dump(_account_response_many_schema, accounts)
         })
         
     except Exception as e:
@@ -241,11 +242,10 @@ def get_accounts_by_clinic(clinic_id):
         accounts = account_service.get_accounts_by_clinic(clinic_id)
         
         # Serialize response with schema
-        schema = AccountResponseSchema(many=True)
         return success_response({
             'clinic_id': clinic_id,
             'count': len(accounts),
-            'accounts': schema.dump(accounts)
+            'accounts': fast_dump(_account_response_many_schema, accounts)
         })
         
     except Exception as e:
@@ -274,11 +274,10 @@ def get_accounts_by_status(status):
         accounts = account_service.get_accounts_by_status(status)
         
         # Serialize response with schema
-        schema = AccountResponseSchema(many=True)
         return success_response({
             'status': status,
             'count': len(accounts),
-            'accounts': schema.dump(accounts)
+            'accounts': fast_dump(_account_response_many_schema, accounts)
         })
         
     except Exception as e:
@@ -300,10 +299,9 @@ def get_all_accounts():
         accounts = account_service.list_all_accounts()
         
         # Serialize response with schema
-        schema = AccountResponseSchema(many=True)
         return success_response({
             'count': len(accounts),
-            'accounts': schema.dump(accounts)
+            'accounts': fast_dump(_account_response_many_schema, accounts)
         })
         
     except Exception as e:
@@ -368,8 +366,7 @@ def update_account(account_id):
     """
     try:
         # Validate request data with schema
-        schema = AccountUpdateRequestSchema()
-        data = schema.load(request.get_json())
+        data = fast_load(_account_update_request_schema, request.get_json())
         
         # If updating email, check if it already exists via SERVICE ✅
         if data.get('email'):
@@ -382,8 +379,7 @@ def update_account(account_id):
             return not_found_response('Account not found')
         
         # Serialize response with schema
-        response_schema = AccountResponseSchema()
-        return success_response(response_schema.dump(account), 'Account updated successfully')
+        return success_response(fast_dump(_account_response_schema, account), 'Account updated successfully')
         
     except ValidationError as e:
         return validation_error_response(e.messages)
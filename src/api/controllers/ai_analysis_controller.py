@@ -6,7 +6,7 @@ from infrastructure.databases.mssql import session
 from services.ai_analysis_service import AiAnalysisService
 from services.retinal_image_service import RetinalImageService
 from api.responses import success_response, error_response, not_found_response, validation_error_response
-from api.schemas import AiAnalysisCreateRequestSchema, AiAnalysisUpdateRequestSchema, AiAnalysisResponseSchema
+from api.schemas import AiAnalysisCreateRequestSchema, AiAnalysisUpdateRequestSchema, AiAnalysisResponseSchema, fast_dump, fast_load
 from domain.exceptions import NotFoundException, ValidationException
 
 ai_analysis_bp = Blueprint('ai_analysis', __name__, url_prefix='/api/ai-analysis')
@@ -19,6 +19,11 @@ image_repo = RetinalImageRepository(session)
 analysis_service = AiAnalysisService(analysis_repo)
 image_service = RetinalImageService(image_repo)
 
+# Initialize schemas once (reused across requests)
+_ai_analysis_create_request_schema = AiAnalysisCreateRequestSchema()
+_ai_analysis_response_schema = AiAnalysisResponseSchema()
+_ai_analysis_response_many_schema = AiAnalysisResponseSchema(many=True)
+
 
 @ai_analysis_bp.route('/health', methods=['GET'])
 def health_check():
@@ -86,8 +91,7 @@ def create_analysis():
     """
     try:
         # Validate request data with schema
-        schema = AiAnalysisCreateRequestSchema()
-        data = schema.load(request.get_json())
+        data = fast_load(_ai_analysis_create_request_schema, request.get_json())
         
         # Check if image exists (via SERVICE) ✅
         image = image_service.get_image_by_id(data['image_id'])
@@ -103,8 +107,7 @@ def create_analysis():
         )
         
         # Serialize response with schema
-        response_schema = AiAnalysisResponseSchema()
-        return success_response(response_schema.dump(analysis), 'Analysis created successfully', 201)
+        return success_response(fast_dump(_ai_analysis_response_schema, analysis), 'Analysis created successfully', 201)
         
     except ValidationError as e:
         return validation_error_response(e.messages)
@@ -143,8 +146,7 @@ def get_analysis(analysis_id):
             return not_found_response('Analysis not found')
         
         # Serialize response with schema
-        schema = AiAnalysisResponseSchema()
-        return success_response(schema.dump(analysis))
+        return success_response(fast_dump(_ai_analysis_response_schema, analysis))
         
     except Exception as e:
         return error_response(f'Internal server error: {str(e)}', 500)
@@ -261,11 +263,10 @@ def get_patient_analyses(patient_id):
             end_date=end_date
         )
         
-        schema = AiAnalysisResponseSchema(many=True)
         return success_response({
             'patient_id': patient_id,
             'count': len(analyses),
-            'analyses': schema.dump(analyses)
+            'analyses': fast_dump(_ai_analysis_response_many_schema, analyses)
         })
         
     except ValidationException as e:
@@ -299,8 +300,7 @@ def get_analysis_by_image(image_id):
             return not_found_response('Analysis not found for this image')
         
         # Serialize response with schema
-        schema = AiAnalysisResponseSchema()
-        return success_response(schema.dump(analysis))
+        return success_response(fast_dump(_ai_analysis_response_schema, analysis))
         
     except Exception as e:
         return error_response(f'Internal server error: {str(e)}', 500)
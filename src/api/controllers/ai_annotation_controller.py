@@ -6,7 +6,7 @@ from infrastructure.databases.mssql import session
 from services.ai_annotation_service import AiAnnotationService
 from services.ai_analysis_service import AiAnalysisService
 from api.responses import success_response, error_response, not_found_response, validation_error_response
-from api.schemas import AiAnnotationCreateRequestSchema, AiAnnotationUpdateRequestSchema, AiAnnotationResponseSchema
+from api.schemas import AiAnnotationCreateRequestSchema, AiAnnotationUpdateRequestSchema, AiAnnotationResponseSchema, fast_dump, fast_load
 
 ai_annotation_bp = Blueprint('ai_annotation', __name__, url_prefix='/api/ai-annotations')
 
@@ -18,6 +18,10 @@ analysis_repo = AiAnalysisRepository(session)
 annotation_service = AiAnnotationService(annotation_repo)
 analysis_service = AiAnalysisService(analysis_repo)
 
+# Initialize schemas once (reused across requests)
+_ai_annotation_create_request_schema = AiAnnotationCreateRequestSchema()
+_ai_annotation_response_schema = AiAnnotationResponseSchema()
+
 
 @ai_annotation_bp.route('/health', methods=['GET'])
 def health_check():
@@ -78,8 +82,7 @@ def create_annotation():
         description: Invalid input
     """
     try:
-        schema = AiAnnotationCreateRequestSchema()
-        data = schema.load(request.get_json())
+        data = fast_load(_ai_annotation_create_request_schema, request.get_json())
         
         analysis = analysis_service.get_analysis_by_id(data['analysis_id'])
         if not analysis:
@@ -91,8 +94,7 @@ def create_annotation():
             description=data.get('description')
         )
         
-        response_schema = AiAnnotationResponseSchema()
-        return success_response(response_schema.dump(annotation), 'Annotation created successfully', 201)
+        return success_response(fast_dump(_ai_annotation_response_schema, annotation), 'Annotation created successfully', 201)
         
     except ValidationError as e:
         return validation_error_response(e.messages)
@@ -126,8 +128,7 @@ def get_annotation(annotation_id):
         if not annotation:
             return not_found_response('Annotation not found')
         
-        schema = AiAnnotationResponseSchema()
-        return success_response(schema.dump(annotation))
+        return success_response(fast_dump(_ai_annotation_response_schema, annotation))
         
     except Exception as e:
         return error_response(f'Internal server error: {str(e)}', 500)
@@ -157,8 +158,7 @@ def get_annotation_by_analysis(analysis_id):
         if not annotation:
             return not_found_response('Annotation not found for this analysis')
         
-        schema = AiAnnotationResponseSchema()
-        return success_response(schema.dump(annotation))
+        return success_response(fast_dump(_ai_annotation_response_schema, annotation))
         
     except Exception as e:
         return error_response(f'Internal server error: {str(e)}', 500)
@@ -4,7 +4,7 @@ from infrastructure.repositories.ai_model_version_repository import AiModelVersi
 from infrastructure.databases.mssql import session
 from services.ai_model_version_service import AiModelVersionService
 from api.responses import success_response, error_response, not_found_response, validation_error_response
-from api.schemas import AiModelVersionCreateRequestSchema, AiModelVersionUpdateRequestSchema, AiModelVersionResponseSchema
+from api.schemas import AiModelVersionCreateRequestSchema, AiModelVersionUpdateRequestSchema, AiModelVersionResponseSchema, fast_dump, fast_load
 from datetime import datetime
 
 ai_model_version_bp = Blueprint('ai_model_version', __name__, url_prefix='/api/ai-model-versions')
@@ -15,6 +15,11 @@ model_repo = AiModelVersionRepository(session)
 # Initialize SERVICE (Business Logic Layer) ✅
 model_service = AiModelVersionService(model_repo)
 
+# Initialize schemas once (reused across requests)
+_ai_model_version_create_request_schema = AiModelVersionCreateRequestSchema()
+_ai_model_version_response_schema = AiModelVersionResponseSchema()
+_ai_model_version_response_many_schema = AiModelVersionResponseSchema(many=True)
+
 
 @ai_model_version_bp.route('/health', methods=['GET'])
 def health_check():
@@ -84,8 +89,7 @@ def create_model_version():
         description: Invalid input
     """
     try:
-        schema = AiModelVersionCreateRequestSchema()
-        data = schema.load(request.get_json())
+        data = fast_load(_ai_model_version_create_request_schema, request.get_json())
         
         model_version = model_service.create_model_version(
             model_name=data['model_name'],
@@ -95,8 +99,7 @@ def create_model_version():
             active_flag=data.get('active_flag', True)
         )
         
-        response_schema = AiModelVersionResponseSchema()
-        return success_response(response_schema.dump(model_version), 'Model version created successfully', 201)
+        return success_response(fast_dump(_ai_model_version_response_schema, model_version), 'Model version created successfully', 201)
         
     except ValidationError as e:
         return validation_error_response(e.messages)
@@ -130,8 +133,7 @@ def get_model_version(model_version_id):
         if not model_version:
             return not_found_response('Model version not found')
         
-        schema = AiModelVersionResponseSchema()
-        return success_response(schema.dump(model_version))
+        return success_response(fast_dump(_ai_model_version_response_schema, model_version))
         
     except Exception as e:
         return error_response(f'Internal server error: {str(e)}', 500)
@@ -160,7 +162,7 @@ def get_versions_by_name(model_name):
         return success_response({
             'model_name': model_name,
             'count': len(versions),
-            'versions': AiModelVersionResponseSchema(many=True).dump(versions)
+            'versions': fast_dump(_ai_model_version_response_many_schema, versions)
         })
         
     except Exception as e:
@@ -8,7 +8,7 @@ from infrastructure.databases.mssql import session
 from services.ai_result_service import AiResultService
 from services.ai_analysis_service import AiAnalysisService
 from api.responses import success_response, error_response, not_found_response, validation_error_response
-from api.schemas import AiResultCreateRequestSchema, AiResultUpdateRequestSchema, AiResultResponseSchema
+from api.schemas import AiResultCreateRequestSchema, AiResultUpdateRequestSchema, AiResultResponseSchema, fast_dump, fast_load
 
 ai_result_bp = Blueprint('ai_result', __name__, url_prefix='/api/ai-results')
 
@@ -27,6 +27,11 @@ result_service = AiResultService(
 )
 analysis_service = AiAnalysisService(analysis_repo)
 
+# Initialize schemas once (reused across requests)
+_ai_result_create_request_schema = AiResultCreateRequestSchema()
+_ai_result_response_schema = AiResultResponseSchema()
+_ai_result_response_many_schema = AiResultResponseSchema(many=True)
+
 
 @ai_result_bp.route('/health', methods=['GET'])
 def health_check():
@@ -94,8 +99,7 @@ def create_result():
         description: Invalid input
     """
     try:
-        schema = AiResultCreateRequestSchema()
-        data = schema.load(request.get_json())
+        data = fast_load(_ai_result_create_request_schema, request.get_json())
         
         analysis = analysis_service.get_analysis_by_id(data['analysis_id'])
         if not analysis:
@@ -108,8 +112,7 @@ def create_result():
             confidence_score=float(data['confidence_score'])
         )
         
-        response_schema = AiResultResponseSchema()
-        return success_response(response_schema.dump(result), 'Result created successfully', 201)
+        return success_response(fast_dump(_ai_result_response_schema, result), 'Result created successfully', 201)
         
     except ValidationError as e:
         return validation_error_response(e.messages)
@@ -143,8 +146,7 @@ def get_result(result_id):
         if not result:
             return not_found_response('Result not found')
         
-        schema = AiResultResponseSchema()
-        return success_response(schema.dump(result))
+        return success_response(fast_dump(_ai_result_response_schema, result))
         
     except Exception as e:
         return error_response(f'Internal server error: {str(e)}', 500)
@@ -212,11 +214,10 @@ def get_results_by_analysis(analysis_id):
         results = result_service.get_results_by_analysis(analysis_id)
         
         # Serialize response with schema
-        schema = AiResultResponseSchema(many=True)
         return success_response({
             'analysis_id': analysis_id,
             'count': len(results),
-            'results': schema.dump(results)
+            'results': fast_dump(_ai_result_response_many_schema, results)
         })
         
     except Exception as e:
@@ -11,7 +11,7 @@ from infrastructure.repositories.medical_report_repository import MedicalReportR
 from infrastructure.databases.mssql import session
 from services.clinic_service import ClinicService
 from api.responses import success_response, error_response, not_found_response, validation_error_response
-from api.schemas import ClinicCreateRequestSchema, ClinicUpdateRequestSchema, ClinicResponseSchema
+from api.schemas import ClinicCreateRequestSchema, ClinicUpdateRequestSchema, ClinicResponseSchema, fast_dump, fast_load
 
 clinic_bp = Blueprint('clinic', __name__, url_prefix='/api/clinics')
 
@@ -37,6 +37,11 @@ clinic_service = ClinicService(
     report_repository=report_repo
 )
 
+# Initialize schemas once (reused across requests)
+_clinic_create_request_schema = ClinicCreateRequestSchema()
+_clinic_response_schema = ClinicResponseSchema()
+_clinic_response_many_schema = ClinicResponseSchema(many=True)
+
 
 @clinic_bp.route('/health', methods=['GET'])
 def health_check():
@@ -105,8 +110,7 @@ def create_clinic():
     """
     try:
         # STEP 1: Validate request data with schema
-        schema = ClinicCreateRequestSchema()
-        data = schema.load(request.get_json())
+        data = fast_load(_clinic_create_request_schema, request.get_json())
         
         # STEP 2: Call SERVICE to register clinic ✅
         clinic = clinic_service.register_clinic(
@@ -118,8 +122,7 @@ def create_clinic():
         )
         
         # STEP 3: Serialize response with schema
-        response_schema = ClinicResponseSchema()
-        return success_response(response_schema.dump(clinic), 'Clinic registered successfully. Pending verification.', 201)
+        return success_response(fast_dump(_clinic_response_schema, clinic), 'Clinic registered successfully. Pending verification.', 201)
         
     except ValidationError as e:
         return validation_error_response(e.messages)
@@ -155,8 +158,7 @@ def get_clinic(clinic_id):
             return not_found_response('Clinic not found')
         
         # Serialize response with schema
-        schema = ClinicResponseSchema()
-        return success_response(schema.dump(clinic))
+        return success_response(fast_dump(_clinic_response_schema, clinic))
         
     except Exception as e:
         return error_response(f'Internal server error: {str(e)}', 500)
@@ -189,7 +191,7 @@ def search_clinics():
         
         return success_response({
             'count': len(clinics),
-            'clinics': ClinicResponseSchema(many=True).dump(clinics)
+            'clinics': fast_dump(_clinic_response_many_schema, clinics)
         })
         
     except Exception as e:
@@ -222,7 +224,7 @@ def get_all_clinics():
         
         return success_response({
             'count': len(clinics),
-            'clinics': ClinicResponseSchema(many=True).dump(clinics)
+            'clinics': fast_dump(_clinic_response_many_schema, clinics)
         })
         
     except Exception as e:
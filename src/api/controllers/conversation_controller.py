@@ -10,7 +10,8 @@ from services.message_service import MessageService
 from services.patient_profile_service import PatientProfileService
 from services.doctor_profile_service import DoctorProfileService
 from api.responses import success_response, error_response, not_found_response, validation_error_response
-from api.schemas import ConversationCreateRequestSchema, ConversationUpdateRequestSchema, ConversationResponseSchema, MessageResponseSchema
+from api.schemas import ConversationCreateRequestSchema, ConversationUpdateRequestSchema, ConversationResponseSchema, MessageResponseSchema, fast_dump, fast_load
+from api.requests import get_bool_arg
 
 conversation_bp = Blueprint('conversation', __name__, url_prefix='/api/conversations')
 
@@ -26,6 +27,13 @@ message_service = MessageService(message_repo)
 patient_service = PatientProfileService(patient_repo)
 doctor_service = DoctorProfileService(doctor_repo)
 
+# Initialize schemas once (reused across requests)
+_conversation_create_request_schema = ConversationCreateRequestSchema()
+_conversation_response_schema = ConversationResponseSchema()
+_conversation_response_many_schema = ConversationResponseSchema(many=True)
+_message_response_many_schema = MessageResponseSchema(many=True)
+_message_response_schema = MessageResponseSchema()
+
 
 @conversation_bp.route('/health', methods=['GET'])
 def health_check():
@@ -87,8 +95,7 @@ def create_conversation():
     """
     try:
         # STEP 1: Validate request data with schema
-        schema = ConversationCreateRequestSchema()
-        data = schema.load(request.get_json())
+        data = fast_load(_conversation_create_request_schema, request.get_json())
         
         # STEP 2: Validate patient and doctor exist via SERVICES ✅
         patient = patient_service.get_patient_by_id(data['patient_id'])
@@ -106,8 +113,7 @@ def create_conversation():
         )
         
         # STEP 4: Serialize response with schema
-        response_schema = ConversationResponseSchema()
-        return success_response(response_schema.dump(conversation), 'Conversation started successfully', 201)
+        return success_response(fast_dump(_conversation_response_schema, conversation), 'Conversation started successfully', 201)
         
     except ValidationError as e:
         return validation_error_response(e.messages)
@@ -143,8 +149,7 @@ def get_conversation(conversation_id):
             return not_found_response('Conversation not found')
         
         # Serialize response with schema
-        schema = ConversationResponseSchema()
-        return success_response(schema.dump(conversation))
+        return success_response(fast_dump(_conversation_response_schema, conversation))
         
     except Exception as e:
         return error_response(f'Internal server error: {str(e)}', 500)
@@ -174,7 +179,7 @@ def get_conversations_by_patient(patient_id):
         description: List of conversations
     """
     try:
-        active_only = request.args.get('active_only', 'false').lower() == 'true'
+        active_only = get_bool_arg('active_only')
         
         # Call SERVICE ✅
         if active_only:
@@ -183,11 +188,10 @@ def get_conversations_by_patient(patient_id):
             conversations = conversation_service.get_conversations_by_patient(patient_id)
         
         # Serialize response with schema
-        schema = ConversationResponseSchema(many=True)
         return success_response({
             'patient_id': patient_id,
             'count': len(conversations),
-            'conversations': schema.dump(conversations)
+            'conversations': fast_dump(_conversation_response_many_schema, conversations)
         })
         
     except Exception as e:
@@ -218,7 +222,7 @@ def get_conversations_by_doctor(doctor_id):
         description: List of conversations
     """
     try:
-        active_only = request.args.get('active_only', 'false').lower() == 'true'
+        active_only = get_bool_arg('active_only')
         
         # Call SERVICE ✅
         if active_only:
@@ -227,11 +231,10 @@ def get_conversations_by_doctor(doctor_id):
             conversations = conversation_service.get_conversations_by_doctor(doctor_id)
         
         # Serialize response with schema
-        schema = ConversationResponseSchema(many=True)
         return success_response({
             'doctor_id': doctor_id,
             'count': len(conversations),
-            'conversations': schema.dump(conversations)
+            'conversations': fast_dump(_conversation_response_many_schema, conversations)
         })
         
     except Exception as e:
@@ -263,8 +266,7 @@ def close_conversation(conversation_id):
         if not conversation:
             return not_found_response('Conversation not found')
         
-        schema = ConversationResponseSchema()
-        return success_response(schema.dump(conversation), 'Conversation closed successfully')
+        return success_response(fast_dump(_conversation_response_schema, conversation), 'Conversation closed successfully')
         
     except ValueError as e:
         return error_response(str(e), 400)
@@ -297,8 +299,7 @@ def reopen_conversation(conversation_id):
         if not conversation:
             return not_found_response('Conversation not found')
         
-        schema = ConversationResponseSchema()
-        return success_response(schema.dump(conversation), 'Conversation reopened successfully')
+        return success_response(fast_dump(_conversation_response_schema, conversation), 'Conversation reopened successfully')
         
     except ValueError as e:
         return error_response(str(e), 400)
@@ -347,7 +348,7 @@ def get_messages(conversation_id):
         return success_response({
             'conversation_id': conversation_id,
             'count': len(messages),
-            'messages': MessageResponseSchema(many=True).dump(messages)
+            'messages': fast_dump(_message_response_many_schema, messages)
         })
         
     except Exception as e:
@@ -434,8 +435,7 @@ def send_message(conversation_id):
             content=data['content']
         )
         
-        response_schema = MessageResponseSchema()
-        return success_response(response_schema.dump(message), 'Message sent successfully', 201)
+        return success_response(fast_dump(_message_response_schema, message), 'Message sent successfully', 201)
         
     except ValidationError as e:
         return validation_error_response(e.messages)
@@ -484,7 +484,7 @@ def search_messages(conversation_id):
             'conversation_id': conversation_id,
             'query': query,
             'count': len(messages),
-            'messages': MessageResponseSchema(many=True).dump(messages)
+            'messages': fast_dump(_message_response_many_schema, messages)
         })
         
     except Exception as e:
@@ -521,8 +521,7 @@ def get_last_message(conversation_id):
         if not message:
             return not_found_response('No messages found in this conversation')
         
-        schema = MessageResponseSchema()
-        return success_response(schema.dump(message))
+        return success_response(fast_dump(_message_response_schema, message))
         
     except Exception as e:
         return error_response(f'Internal server error: {str(e)}', 500)
@@ -9,7 +9,7 @@ from infrastructure.databases.mssql import session
 from services.doctor_profile_service import DoctorProfileService
 from services.account_service import AccountService
 from api.responses import success_response, error_response, not_found_response, validation_error_response
-from api.schemas import DoctorProfileCreateRequestSchema, DoctorProfileUpdateRequestSchema, DoctorProfileResponseSchema
+from api.schemas import DoctorProfileCreateRequestSchema, DoctorProfileUpdateRequestSchema, DoctorProfileResponseSchema, fast_dump, fast_load
 from domain.exceptions import NotFoundException, ValidationException
 
 doctor_bp = Blueprint('doctor', __name__, url_prefix='/api/doctors')
@@ -31,6 +31,12 @@ doctor_service = DoctorProfileService(
 )
 account_service = AccountService(account_repo)
 
+# Initialize schemas once (reused across requests)
+_doctor_profile_create_request_schema = DoctorProfileCreateRequestSchema()
+_doctor_profile_response_schema = DoctorProfileResponseSchema()
+_doctor_profile_response_many_schema = DoctorProfileResponseSchema(many=True)
+_doctor_profile_update_request_schema = DoctorProfileUpdateRequestSchema()
+
 
 @doctor_bp.route('/health', methods=['GET'])
 def health_check():
@@ -97,8 +103,7 @@ def create_doctor():
     """
     try:
         # STEP 1: Validate request data with schema
-        schema = DoctorProfileCreateRequestSchema()
-        data = schema.load(request.get_json())
+        data = fast_load(_doctor_profile_create_request_schema, request.get_json())
         
         # STEP 2: Check if account exists via SERVICE ✅
         account = account_service.get_account_by_id(data['account_id'])
@@ -114,8 +119,7 @@ def create_doctor():
         )
         
         # STEP 4: Serialize response with schema
-        response_schema = DoctorProfileResponseSchema()
-        return success_response(response_schema.dump(doctor), 'Doctor created successfully', 201)
+        return success_response(fast_dump(_doctor_profile_response_schema, doctor), 'Doctor created successfully', 201)
         
     except ValidationError as e:
         return validation_error_response(e.messages)
@@ -155,8 +159,7 @@ def get_doctor(doctor_id):
             return not_found_response('Doctor not found')
         
         # Serialize response with schema
-        schema = DoctorProfileResponseSchema()
-        return success_response(schema.dump(doctor))
+        return success_response(fast_dump(_doctor_profile_response_schema, doctor))
         
     except Exception as e:
         return error_response(f'Internal server error: {str(e)}', 500)
@@ -188,8 +191,7 @@ def get_doctor_by_account(account_id):
             return not_found_response('Doctor not found')
         
         # Serialize response with schema
-        schema = DoctorProfileResponseSchema()
-        return success_response(schema.dump(doctor))
+        return success_response(fast_dump(_doctor_profile_response_schema, doctor))
         
     except Exception as e:
         return error_response(f'Internal server error: {str(e)}', 500)
@@ -221,8 +223,7 @@ def get_doctor_by_license(license_number):
             return not_found_response('Doctor not found')
         
         # Serialize response with schema
-        schema = DoctorProfileResponseSchema()
-        return success_response(schema.dump(doctor))
+        return success_response(fast_dump(_doctor_profile_response_schema, doctor))
         
     except Exception as e:
         return error_response(f'Internal server error: {str(e)}', 500)
@@ -250,10 +251,9 @@ def get_doctors_by_specialization(specialization):
         doctors = doctor_service.search_by_specialization(specialization)
         
         # Serialize response with schema
-        schema = DoctorProfileResponseSchema(many=True)
         return success_response({
             'count': len(doctors),
-            'doctors': schema.dump(doctors)
+            'doctors': fast_dump(_doctor_profile_response_many_schema, doctors)
         })
         
     except Exception as e:
@@ -286,10 +286,9 @@ def search_doctors():
         doctors = doctor_service.search_doctors_by_name(name)
         
         # Serialize response with schema
-        schema = DoctorProfileResponseSchema(many=True)
         return success_response({
             'count': len(doctors),
-            'doctors': schema.dump(doctors)
+            'doctors': fast_dump(_doctor_profile_response_many_schema, doctors)
         })
         
     except Exception as e:
@@ -312,10 +311,9 @@ def get_all_doctors():
         doctors = doctor_service.list_all_doctors()
         
         # Serialize response with schema
-        schema = DoctorProfileResponseSchema(many=True)
         return success_response({
             'count': len(doctors),
-            'doctors': schema.dump(doctors)
+            'doctors': fast_dump(_doctor_profile_response_many_schema, doctors)
         })
         
     except Exception as e:
@@ -377,8 +375,7 @@ def update_doctor(doctor_id):
     """
     try:
         # Validate request data with schema
-        schema = DoctorProfileUpdateRequestSchema()
-        data = schema.load(request.get_json())
+        data = fast_load(_doctor_profile_update_request_schema, request.get_json())
         
         # Call SERVICE ✅
         doctor = doctor_service.update_doctor(doctor_id, **data)
@@ -386,8 +383,7 @@ def update_doctor(doctor_id):
             return not_found_response('Doctor not found')
         
         # Serialize response with schema
-        response_schema = DoctorProfileResponseSchema()
-        return success_response(response_schema.dump(doctor), 'Doctor updated successfully')
+        return success_response(fast_dump(_doctor_profile_response_schema, doctor), 'Doctor updated successfully')
         
     except ValidationError as e:
         return validation_error_response(e.messages)
@@ -8,7 +8,7 @@ from services.doctor_review_service import DoctorReviewService
 from services.ai_analysis_service import AiAnalysisService
 from services.doctor_profile_service import DoctorProfileService
 from api.responses import success_response, error_response, not_found_response, validation_error_response
-from api.schemas import DoctorReviewCreateRequestSchema, DoctorReviewUpdateRequestSchema, DoctorReviewResponseSchema
+from api.schemas import DoctorReviewCreateRequestSchema, DoctorReviewUpdateRequestSchema, DoctorReviewResponseSchema, fast_dump, fast_load
 from domain.exceptions import NotFoundException, ValidationException
 
 doctor_review_bp = Blueprint('doctor_review', __name__, url_prefix='/api/doctor-reviews')
@@ -23,6 +23,10 @@ review_service = DoctorReviewService(review_repo)
 analysis_service = AiAnalysisService(analysis_repo)
 doctor_service = DoctorProfileService(doctor_repo)
 
+# Initialize schemas once (reused across requests)
+_doctor_review_create_request_schema = DoctorReviewCreateRequestSchema()
+_doctor_review_response_schema = DoctorReviewResponseSchema()
+
 
 @doctor_review_bp.route('/health', methods=['GET'])
 def health_check():
@@ -88,8 +92,7 @@ def create_review():
         description: Invalid input
     """
     try:
-        schema = DoctorReviewCreateRequestSchema()
-        data = schema.load(request.get_json())
+        data = fast_load(_doctor_review_create_request_schema, request.get_json())
         
         analysis = analysis_service.get_analysis_by_id(data['analysis_id'])
         if not analysis:
@@ -106,8 +109,7 @@ def create_review():
             comment=data.get('comment')
         )
         
-        response_schema = DoctorReviewResponseSchema()
-        return success_response(response_schema.dump(review), 'Review created successfully', 201)
+        return success_response(fast_dump(_doctor_review_response_schema, review), 'Review created successfully', 201)
         
     except ValidationError as e:
         return validation_error_response(e.messages)
@@ -145,8 +147,7 @@ def get_review(review_id):
         if not review:
             return not_found_response('Review not found')
         
-        schema = DoctorReviewResponseSchema()
-        return success_response(schema.dump(review))
+        return success_response(fast_dump(_doctor_review_response_schema, review))
         
     except Exception as e:
         return error_response(f'Internal server error: {str(e)}', 500)
@@ -176,8 +177,7 @@ def get_review_by_analysis(analysis_id):
         if not review:
             return not_found_response('Review not found for this analysis')
         
-        schema = DoctorReviewResponseSchema()
-        return success_response(schema.dump(review))
+        return success_response(fast_dump(_doctor_review_response_schema, review))
         
     except Exception as e:
         return error_response(f'Internal server error: {str(e)}', 500)
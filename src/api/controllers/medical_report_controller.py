@@ -15,7 +15,7 @@ from services.ai_result_service import AiResultService
 from services.retinal_image_service import RetinalImageService
 from services.export_service import ExportService
 from api.responses import success_response, error_response, not_found_response, validation_error_response
-from api.schemas import MedicalReportCreateRequestSchema, MedicalReportUpdateRequestSchema, MedicalReportResponseSchema
+from api.schemas import MedicalReportCreateRequestSchema, MedicalReportUpdateRequestSchema, MedicalReportResponseSchema, fast_dump, fast_load
 from datetime import datetime
 
 medical_report_bp = Blueprint('medical_report', __name__, url_prefix='/api/medical-reports')
@@ -37,6 +37,10 @@ result_service = AiResultService(result_repo)
 image_service = RetinalImageService(image_repo)
 export_service = ExportService()
 
+# Initialize schemas once (reused across requests)
+_medical_report_create_request_schema = MedicalReportCreateRequestSchema()
+_medical_report_response_schema = MedicalReportResponseSchema()
+
 
 @medical_report_bp.route('/health', methods=['GET'])
 def health_check():
@@ -109,8 +113,7 @@ def create_report():
     """
     try:
         # STEP 1: Validate input data with Schema
-        schema = MedicalReportCreateRequestSchema()
-        data = schema.load(request.get_json())
+        data = fast_load(_medical_report_create_request_schema, request.get_json())
         
         # STEP 2: Validate dependencies (Patient, Doctor, Analysis exist) via SERVICES ✅
         patient = patient_service.get_patient_by_id(data['patient_id'])
@@ -134,8 +137,7 @@ def create_report():
         )
         
         # STEP 4: Format and return response
-        response_schema = MedicalReportResponseSchema()
-        return success_response(response_schema.dump(report), 'Medical report created successfully', 201)
+        return success_response(fast_dump(_medical_report_response_schema, report), 'Medical report created successfully', 201)
         
     except ValidationError as e:
         return validation_error_response(e.messages)
@@ -170,8 +172,7 @@ def get_report(report_id):
         if not report:
             return not_found_response('Report not found')
         
-        schema = MedicalReportResponseSchema()
-        return success_response(schema.dump(report))
+        return success_response(fast_dump(_medical_report_response_schema, report))
         
     except Exception as e:
         return error_response(f'Internal server error: {str(e)}', 500)
@@ -202,8 +203,7 @@ def get_report_by_analysis(analysis_id):
         if not report:
             return not_found_response('Report not found for this analysis')
         
-        schema = MedicalReportResponseSchema()
-        return success_response(schema.dump(report))
+        return success_response(fast_dump(_medical_report_response_schema, report))
         
     except Exception as e:
         return error_response(f'Internal server error: {str(e)}', 500)
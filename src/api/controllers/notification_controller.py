@@ -6,7 +6,8 @@ from infrastructure.databases.mssql import session
 from services.notification_service import NotificationService
 from services.account_service import AccountService
 from api.responses import success_response, error_response, not_found_response, validation_error_response
-from api.schemas import NotificationCreateRequestSchema, NotificationUpdateRequestSchema, NotificationResponseSchema
+from api.schemas import NotificationCreateRequestSchema, NotificationUpdateRequestSchema, NotificationResponseSchema, fast_dump, fast_load
+from api.requests import get_bool_arg
 
 notification_bp = Blueprint('notification', __name__, url_prefix='/api/notifications')
 
@@ -18,6 +19,10 @@ account_repo = AccountRepository(session)
 notification_service = NotificationService(notification_repo)
 account_service = AccountService(account_repo)
 
+# Initialize schemas once (reused across requests)
+_notification_create_request_schema = NotificationCreateRequestSchema()
+_notification_response_schema = NotificationResponseSchema()
+
 
 @notification_bp.route('/health', methods=['GET'])
 def health_check():
@@ -80,8 +85,7 @@ def send_notification():
     """
     try:
         # STEP 1: Validate request data
-        schema = NotificationCreateRequestSchema()
-        data = schema.load(request.get_json())
+        data = fast_load(_notification_create_request_schema, request.get_json())
         
         # STEP 2: Verify account exists via SERVICE ✅
         account = account_service.get_account_by_id(data['account_id'])
@@ -95,8 +99,7 @@ def send_notification():
             content=data['content']
         )
         
-        response_schema = NotificationResponseSchema()
-        return success_response(response_schema.dump(notification), 'Notification sent successfully', 201)
+        return success_response(fast_dump(_notification_response_schema, notification), 'Notification sent successfully', 201)
         
     except ValidationError as e:
         return validation_error_response(e.messages)
@@ -131,8 +134,7 @@ def get_notification(notification_id):
         if not notification:
             return not_found_response('Notification not found')
         
-        schema = NotificationResponseSchema()
-        return success_response(schema.dump(notification))
+        return success_response(fast_dump(_notification_response_schema, notification))
         
     except Exception as e:
         return error_response(f'Internal server error: {str(e)}', 500)
@@ -167,7 +169,7 @@ def get_notifications_by_account(account_id):
         description: List of notifications
     """
     try:
-        unread_only = request.args.get('unread_only', 'false').lower() == 'true'
+        unread_only = get_bool_arg('unread_only')
         notification_type = request.args.get('type')
         
         # Call SERVICE ✅
@@ -403,7 +405,7 @@ def delete_all_notifications(account_id):
         description: Notifications deleted successfully
     """
     try:
-        read_only = request.args.get('read_only', 'false').lower() == 'true'
+        read_only = get_bool_arg('read_only')
         
         # Call SERVICE ✅
         if read_only:
@@ -6,7 +6,7 @@ from infrastructure.databases.mssql import session
 from services.patient_profile_service import PatientProfileService
 from services.account_service import AccountService
 from api.responses import success_response, error_response, not_found_response, validation_error_response
-from api.schemas import PatientProfileCreateRequestSchema, PatientProfileUpdateRequestSchema, PatientProfileResponseSchema
+from api.schemas import PatientProfileCreateRequestSchema, PatientProfileUpdateRequestSchema, PatientProfileResponseSchema, fast_dump, fast_load
 from domain.exceptions import NotFoundException, ValidationException
 from datetime import date
 
@@ -20,6 +20,12 @@ account_repo = AccountRepository(session)
 patient_service = PatientProfileService(patient_repo)
 account_service = AccountService(account_repo)
 
+# Initialize schemas once (reused across requests)
+_patient_profile_create_request_schema = PatientProfileCreateRequestSchema()
+_patient_profile_response_schema = PatientProfileResponseSchema()
+_patient_profile_response_many_schema = PatientProfileResponseSchema(many=True)
+_patient_profile_update_request_schema = PatientProfileUpdateRequestSchema()
+
 
 @patient_bp.route('/health', methods=['GET'])
 def health_check():
@@ -89,8 +95,7 @@ def create_patient():
     """
     try:
         # STEP 1: Validate request data with schema
-        schema = PatientProfileCreateRequestSchema()
-        data = schema.load(request.get_json())
+        data = fast_load(_patient_profile_create_request_schema, request.get_json())
         
         # STEP 2: Check if account exists via SERVICE ✅
         account = account_service.get_account_by_id(data['account_id'])
@@ -107,8 +112,7 @@ def create_patient():
         )
         
         # STEP 4: Serialize response with schema
-        response_schema = PatientProfileResponseSchema()
-        return success_response(response_schema.dump(patient), 'Patient created successfully', 201)
+        return success_response(fast_dump(_patient_profile_response_schema, patient), 'Patient created successfully', 201)
         
     except ValidationError as e:
         return validation_error_response(e.messages)
@@ -148,8 +152,7 @@ def get_patient(patient_id):
             return not_found_response('Patient not found')
         
         # Serialize response with schema
-        schema = PatientProfileResponseSchema()
-        return success_response(schema.dump(patient))
+        return success_response(fast_dump(_patient_profile_response_schema, patient))
         
     except Exception as e:
         return error_response(f'Internal server error: {str(e)}', 500)
@@ -181,8 +184,7 @@ def get_patient_by_account(account_id):
             return not_found_response('Patient not found')
         
         # Serialize response with schema
-        schema = PatientProfileResponseSchema()
-        return success_response(schema.dump(patient))
+        return success_response(fast_dump(_patient_profile_response_schema, patient))
         
     except Exception as e:
         return error_response(f'Internal server error: {str(e)}', 500)
@@ -239,10 +241,9 @@ def search_patients():
         )
         
         # Serialize response with schema
-        schema = PatientProfileResponseSchema(many=True)
         return success_response({
             'count': len(patients),
-            'patients': schema.dump(patients)
+            'patients': fast_dump(_patient_profile_response_many_schema, patients)
         })
         
     except Exception as e:
@@ -271,11 +272,10 @@ def get_assigned_patients(clinic_id):
         patients = patient_service.get_assigned_patients_by_clinic(clinic_id)
         
         # Serialize response with schema
-        schema = PatientProfileResponseSchema(many=True)
         return success_response({
             'clinic_id': clinic_id,
             'count': len(patients),
-            'patients': schema.dump(patients)
+            'patients': fast_dump(_patient_profile_response_many_schema, patients)
         })
         
     except Exception as e:
@@ -298,10 +298,9 @@ def get_all_patients():
         patients = patient_service.list_all_patients()
         
         # Serialize response with schema
-        schema = PatientProfileResponseSchema(many=True)
         return success_response({
             'count': len(patients),
-            'patients': schema.dump(patients)
+            'patients': fast_dump(_patient_profile_response_many_schema, patients)
         })
         
     except Exception as e:
@@ -363,8 +362,7 @@ def update_patient(patient_id):
     """
     try:
         # Validate request data with schema
-        schema = PatientProfileUpdateRequestSchema()
-        data = schema.load(request.get_json())
+        data = fast_load(_patient_profile_update_request_schema, request.get_json())
         
         # Call SERVICE ✅
         patient = patient_service.update_patient(patient_id, **data)
@@ -372,8 +370,7 @@ def update_patient(patient_id):
             return not_found_response('Patient not found')
         
         # Serialize response with schema
-        response_schema = PatientProfileResponseSchema()
-        return success_response(response_schema.dump(patient), 'Patient updated successfully')
+        return success_response(fast_dump(_patient_profile_response_schema, patient), 'Patient updated successfully')
         
     except ValidationError as e:
         return validation_error_response(e.messages)
@@ -8,7 +8,7 @@ from services.payment_service import PaymentService
 from services.subscription_service import SubscriptionService
 from services.account_service import AccountService
 from api.responses import success_response, error_response, not_found_response, validation_error_response
-from api.schemas import PaymentCreateRequestSchema, PaymentUpdateRequestSchema, PaymentResponseSchema
+from api.schemas import PaymentCreateRequestSchema, PaymentUpdateRequestSchema, PaymentResponseSchema, fast_dump, fast_load
 from domain.exceptions import ValidationException
 from datetime import datetime
 
@@ -24,6 +24,11 @@ payment_service = PaymentService(payment_repo)
 subscription_service = SubscriptionService(subscription_repo)
 account_service = AccountService(account_repo)
 
+# Initialize schemas once (reused across requests)
+_payment_create_request_schema = PaymentCreateRequestSchema()
+_payment_response_schema = PaymentResponseSchema()
+_payment_response_many_schema = PaymentResponseSchema(many=True)
+
 
 @payment_bp.route('/health', methods=['GET'])
 def health_check():
@@ -93,8 +98,7 @@ def create_payment():
         description: Subscription not found
     """
     try:
-        schema = PaymentCreateRequestSchema()
-        data = schema.load(request.get_json())
+        data = fast_load(_payment_create_request_schema, request.get_json())
         
         subscription = subscription_service.get_subscription_by_id(data['subscription_id'])
         if not subscription:
@@ -107,8 +111,7 @@ def create_payment():
             status=data.get('status', 'pending')
         )
         
-        response_schema = PaymentResponseSchema()
-        return success_response(response_schema.dump(payment), 'Payment created successfully', 201)
+        return success_response(fast_dump(_payment_response_schema, payment), 'Payment created successfully', 201)
         
     except ValidationError as e:
         return validation_error_response(e.messages)
@@ -142,8 +145,7 @@ def get_payment(payment_id):
         if not payment:
             return not_found_response('Payment not found')
         
-        schema = PaymentResponseSchema()
-        return success_response(schema.dump(payment))
+        return success_response(fast_dump(_payment_response_schema, payment))
         
     except Exception as e:
         return error_response(f'Internal server error: {str(e)}', 500)
@@ -273,7 +275,6 @@ def get_payment_history(account_id):
         payments = payment_service.get_payment_history(account_id, limit=limit, offset=offset)
         
         # Serialize response with schema
-        schema = PaymentResponseSchema(many=True)
         
         return success_response({
             'account_id': account_id,
@@ -281,7 +282,7 @@ def get_payment_history(account_id):
             'total_count': len(payments),  # Note: This is the count for current page, not total
             'limit': limit,
             'offset': offset,
-            'payments': schema.dump(payments)
+            'payments': fast_dump(_payment_response_many_schema, payments)
         })
         
     except ValidationException as e:
@@ -722,6 +723,13 @@ def get_revenue():
         schema:
           type: string
           default: completed
+      - name: bucket
+        in: query
+        required: false
+        description: With start_date and end_date, return completed revenue per period instead of one total
+        schema:
+          type: string
+          enum: [day, month, year]
     responses:
       200:
         description: Revenue information
@@ -730,8 +738,23 @@ def get_revenue():
         start_date = request.args.get('start_date')
         end_date = request.args.get('end_date')
         status = request.args.get('status', 'completed')
+        bucket = request.args.get('bucket')
         
-        if start_date and end_date:
+        if start_date and end_date and bucket:
+            try:
+                start = datetime.fromisoformat(start_date)
+                end = datetime.fromisoformat(end_date)
+            except ValueError:
+                return validation_error_response({'date': 'Invalid date format. Use YYYY-MM-DD'})
+            revenue = payment_service.get_revenue_grouped(start, end, bucket)
+            
+            return success_response({
+                'start_date': start_date,
+                'end_date': end_date,
+                'bucket': bucket,
+                'revenue': [{'period_start': period_start, 'revenue': total} for period_start, total in revenue]
+            })
+        elif start_date and end_date:
             try:
                 start = datetime.fromisoformat(start_date)
                 end = datetime.fromisoformat(end_date)
@@ -752,6 +775,8 @@ def get_revenue():
                 'total_revenue': total_revenue
             })
         
+    except ValidationException as e:
+        return error_response(str(e), 400)
     except Exception as e:
         return error_response(f'Internal server error: {str(e)}', 500)
 
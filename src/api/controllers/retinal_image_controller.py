@@ -7,8 +7,9 @@ from infrastructure.databases.mssql import session
 from services.retinal_image_service import RetinalImageService
 from services.patient_profile_service import PatientProfileService
 from services.clinic_service import ClinicService
+from domain.exceptions import NotFoundException
 from api.responses import success_response, error_response, not_found_response, validation_error_response
-from api.schemas import RetinalImageCreateRequestSchema, RetinalImageUpdateRequestSchema, RetinalImageResponseSchema, RetinalImageBulkCreateRequestSchema
+from api.schemas import RetinalImageCreateRequestSchema, RetinalImageUpdateRequestSchema, RetinalImageResponseSchema, RetinalImageBulkCreateRequestSchema, fast_dump, fast_load
 
 retinal_image_bp = Blueprint('retinal_image', __name__, url_prefix='/api/retinal-images')
 
@@ -22,6 +23,21 @@ image_service = RetinalImageService(image_repo)
 patient_service = PatientProfileService(patient_repo)
 clinic_service = ClinicService(clinic_repo)
 
+# Initialize schemas once (reused across requests)
+_retinal_image_create_request_schema = RetinalImageCreateRequestSchema()
+_retinal_image_response_schema = RetinalImageResponseSchema()
+_retinal_image_bulk_create_request_schema = RetinalImageBulkCreateRequestSchema()
+_retinal_image_response_many_schema = RetinalImageResponseSchema(many=True)
+
+
+def _patient_exists(patient_id):
+    """get_patient_by_id raises for unknown IDs; bulk upload reports them per image instead"""
+    try:
+        patient_service.get_patient_by_id(patient_id)
+        return True
+    except NotFoundException:
+        return False
+
 
 @retinal_image_bp.route('/health', methods=['GET'])
 def health_check():
@@ -104,8 +120,7 @@ def upload_image():
     """
     try:
         # Validate request data with schema
-        schema = RetinalImageCreateRequestSchema()
-        data = schema.load(request.get_json())
+        data = fast_load(_retinal_image_create_request_schema, request.get_json())
         
         # Validate patient exists (via SERVICE) ✅
         patient = patient_service.get_patient_by_id(data['patient_id'])
@@ -129,8 +144,7 @@ def upload_image():
         )
         
         # Serialize response with schema
-        response_schema = RetinalImageResponseSchema()
-        return success_response(response_schema.dump(image), 'Image uploaded successfully', 201)
+        return success_response(fast_dump(_retinal_image_response_schema, image), 'Image uploaded successfully', 201)
         
     except ValidationError as e:
         return validation_error_response(e.messages)
@@ -260,42 +274,41 @@ def upload_bulk_images():
     """
     try:
         # Validate request data
-        schema = RetinalImageBulkCreateRequestSchema()
-        data = schema.load(request.get_json())
+        data = fast_load(_retinal_image_bulk_create_request_schema, request.get_json())
         
         if not data.get('images') or len(data['images']) == 0:
             return error_response('No images provided', 400)
         
         # Validate all patients and clinics exist before processing
+        # Each distinct ID is looked up once, however many images reference it
+        images = data['images']
+        known_patient_ids = {
+            patient_id for patient_id in {img['patient_id'] for img in images}
+            if _patient_exists(patient_id)
+        }
+        known_clinic_ids = {
+            clinic_id for clinic_id in {img['clinic_id'] for img in images if img['patient_id'] in known_patient_ids}
+            if clinic_service.get_clinic_by_id(clinic_id)
+        }
+        
         # Collect all validation errors and valid images separately
         validation_errors = []
         images_data = []
         
-        for idx, img in enumerate(data['images']):
+        for idx, img in enumerate(images):
             image_url = img.get("image_url", f"image_{idx + 1}")
-            is_valid = True
             
-            # Validate patient exists
-            patient = patient_service.get_patient_by_id(img['patient_id'])
-            if not patient:
+            if img['patient_id'] not in known_patient_ids:
                 validation_errors.append({
                     'image_url': image_url,
                     'error': f'Patient with ID {img["patient_id"]} not found'
                 })
-                is_valid = False
-            
-            # Validate clinic exists
-            if is_valid:
-                clinic = clinic_service.get_clinic_by_id(img['clinic_id'])
-                if not clinic:
-                    validation_errors.append({
-                        'image_url': image_url,
-                        'error': f'Clinic with ID {img["clinic_id"]} not found'
-                    })
-                    is_valid = False
-            
-            # Only add valid images to images_data
-            if is_valid:
+            elif img['clinic_id'] not in known_clinic_ids:
+                validation_errors.append({
+                    'image_url': image_url,
+                    'error': f'Clinic with ID {img["clinic_id"]} not found'
+                })
+            else:
                 images_data.append({
                     'patient_id': img['patient_id'],
                     'clinic_id': img['clinic_id'],
@@ -331,8 +344,7 @@ def upload_bulk_images():
                 all_errors.append({'error': str(service_error)})
         
         # Serialize successful uploads
-        response_schema = RetinalImageResponseSchema()
-        serialized_uploaded = [response_schema.dump(img) for img in result['uploaded']]
+        serialized_uploaded = [fast_dump(_retinal_image_response_schema, img) for img in result['uploaded']]
         
         # Calculate total counts including validation errors
         total_error_count = len(all_errors)
@@ -383,8 +395,7 @@ def get_image(image_id):
             return not_found_response('Image not found')
         
         # Serialize response with schema
-        schema = RetinalImageResponseSchema()
-        return success_response(schema.dump(image))
+        return success_response(fast_dump(_retinal_image_response_schema, image))
         
     except Exception as e:
         return error_response(f'Internal server error: {str(e)}', 500)
@@ -425,7 +436,7 @@ def get_images_by_patient(patient_id):
         
         return success_response({
             'count': len(images),
-            'images': RetinalImageResponseSchema(many=True).dump(images)
+            'images': fast_dump(_retinal_image_response_many_schema, images)
         })
         
     except Exception as e:
@@ -698,8 +709,7 @@ def update_image(image_id):
             return not_found_response('Image not found')
         
         # Use schema for response serialization
-        response_schema = RetinalImageResponseSchema()
-        return success_response(response_schema.dump(image), 'Image updated successfully')
+        return success_response(fast_dump(_retinal_image_response_schema, image), 'Image updated successfully')
         
     except ValueError as e:
         return error_response(str(e), 400)
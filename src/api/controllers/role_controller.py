@@ -1,12 +1,16 @@
+from threading import Lock
+from cachetools import TTLCache
 from flask import Blueprint, request, jsonify
-from marshmallow import ValidationError
 from infrastructure.repositories.role_repository import RoleRepository
 from infrastructure.databases.mssql import session
 from services.role_service import RoleService
-from api.responses import success_response, error_response, not_found_response, validation_error_response
-from api.schemas import RoleRequestSchema, RoleResponseSchema
+from api.responses import success_response, not_found_response
+from api.schemas import RoleRequestSchema, RoleResponseSchema, fast_dump, fast_load
+from api.middleware import register_api_error_handlers
 
 role_bp = Blueprint('role', __name__, url_prefix='/api/roles')
+# Exceptions from the views below map to API error responses in one place
+register_api_error_handlers(role_bp)
 
 # Initialize repository (only for service initialization)
 role_repo = RoleRepository(session)
@@ -14,6 +18,25 @@ role_repo = RoleRepository(session)
 # Initialize SERVICE (Business Logic Layer) ✅
 role_service = RoleService(role_repo)
 
+# Initialize schemas once (reused across requests)
+_role_request_schema = RoleRequestSchema()
+_role_response_schema = RoleResponseSchema()
+_role_response_many_schema = RoleResponseSchema(many=True)
+
+# Role-by-name lookups repeat often and roles rarely change: cache found roles
+# for 60s per process
+_role_by_name_cache = TTLCache(maxsize=256, ttl=60)
+# /stats is polled by dashboards; keep the total for 30s
+_role_stats_cache = TTLCache(maxsize=1, ttl=30)
+# TTLCache is not thread-safe
+_role_cache_lock = Lock()
+
+
+def _invalidate_role_cache():
+    with _role_cache_lock:
+        _role_by_name_cache.clear()
+        _role_stats_cache.clear()
+
 
 @role_bp.route('/health', methods=['GET'])
 def health_check():
@@ -66,24 +89,15 @@ def create_role():
       400:
         description: Invalid input
     """
-    try:
-        # STEP 1: Validate request data with schema
-        schema = RoleRequestSchema()
-        data = schema.load(request.get_json())
-        
-        # STEP 2: Call SERVICE to create role ✅ (Service handles duplicate check)
-        role = role_service.create_role(data['role_name'])
-        
-        # STEP 3: Serialize response with schema
-        response_schema = RoleResponseSchema()
-        return success_response(response_schema.dump(role), 'Role created successfully', 201)
-        
-    except ValidationError as e:
-        return validation_error_response(e.messages)
-    except ValueError as e:
-        return error_response(str(e), 400)
-    except Exception as e:
-        return error_response(f'Internal server error: {str(e)}', 500)
+    # STEP 1: Validate request data with schema
+    data = fast_load(_role_request_schema, request.get_json())
+    
+    # STEP 2: Call SERVICE to create role ✅ (Service handles duplicate check)
+    role = role_service.create_role(data['role_name'])
+    _invalidate_role_cache()
+    
+    # STEP 3: Serialize response with schema
+    return success_response(fast_dump(_role_response_schema, role), 'Role created successfully', 201)
 
 
 @role_bp.route('/<int:role_id>', methods=['GET'])
@@ -105,18 +119,13 @@ def get_role(role_id):
       404:
         description: Role not found
     """
-    try:
-        # Call SERVICE ✅
-        role = role_service.get_role_by_id(role_id)
-        if not role:
-            return not_found_response('Role not found')
-        
-        # Serialize response with schema
-        schema = RoleResponseSchema()
-        return success_response(schema.dump(role))
-        
-    except Exception as e:
-        return error_response(f'Internal server error: {str(e)}', 500)
+    # Call SERVICE ✅
+    role = role_service.get_role_by_id(role_id)
+    if not role:
+        return not_found_response('Role not found')
+    
+    # Serialize response with schema
+    return success_response(fast_dump(_role_response_schema, role))
 
 
 @role_bp.route('/name/<role_name>', methods=['GET'])
@@ -138,18 +147,20 @@ def get_role_by_name(role_name):
       404:
         description: Role not found
     """
-    try:
+    with _role_cache_lock:
+        role = _role_by_name_cache.get(role_name)
+    
+    if role is None:
         # Call SERVICE ✅
         role = role_service.get_role_by_name(role_name)
         if not role:
+            # Misses are not cached: a role created in another worker must be found right away
             return not_found_response('Role not found')
-        
-        # Serialize response with schema
-        schema = RoleResponseSchema()
-        return success_response(schema.dump(role))
-        
-    except Exception as e:
-        return error_response(f'Internal server error: {str(e)}', 500)
+        with _role_cache_lock:
+            _role_by_name_cache[role_name] = role
+    
+    # Serialize response with schema
+    return success_response(fast_dump(_role_response_schema, role))
 
 
 @role_bp.route('', methods=['GET'])
@@ -163,19 +174,14 @@ def get_all_roles():
       200:
         description: List of all roles
     """
-    try:
-        # Call SERVICE ✅
-        roles = role_service.list_all_roles()
-        
-        # Serialize response with schema
-        schema = RoleResponseSchema(many=True)
-        return success_response({
-            'count': len(roles),
-            'roles': schema.dump(roles)
-        })
-        
-    except Exception as e:
-        return error_response(f'Internal server error: {str(e)}', 500)
+    # Call SERVICE ✅
+    roles = role_service.list_all_roles()
+    
+    # Serialize response with schema
+    return success_response({
+        'count': len(roles),
+        'roles': fast_dump(_role_response_many_schema, roles)
+    })
 
 
 @role_bp.route('/<int:role_id>', methods=['PUT'])
@@ -227,26 +233,17 @@ def update_role(role_id):
       404:
         description: Role not found
     """
-    try:
-        # Validate request data with schema
-        schema = RoleRequestSchema()
-        data = schema.load(request.get_json())
-        
-        # Call SERVICE ✅
-        role = role_service.update_role(role_id, data['role_name'])
-        if not role:
-            return not_found_response('Role not found')
-        
-        # Serialize response with schema
-        response_schema = RoleResponseSchema()
-        return success_response(response_schema.dump(role), 'Role updated successfully')
-        
-    except ValidationError as e:
-        return validation_error_response(e.messages)
-    except ValueError as e:
-        return error_response(str(e), 400)
-    except Exception as e:
-        return error_response(f'Internal server error: {str(e)}', 500)
+    # Validate request data with schema
+    data = fast_load(_role_request_schema, request.get_json())
+    
+    # Call SERVICE ✅
+    role = role_service.update_role(role_id, data['role_name'])
+    if not role:
+        return not_found_response('Role not found')
+    _invalidate_role_cache()
+    
+    # Serialize response with schema
+    return success_response(fast_dump(_role_response_schema, role), 'Role updated successfully')
 
 
 @role_bp.route('/<int:role_id>', methods=['DELETE'])
@@ -268,18 +265,13 @@ def delete_role(role_id):
       404:
         description: Role not found
     """
-    try:
-        # Call SERVICE ✅
-        result = role_service.delete_role(role_id)
-        if not result:
-            return not_found_response('Role not found')
-        
-        return success_response(None, 'Role deleted successfully')
-        
-    except ValueError as e:
-        return error_response(str(e), 400)
-    except Exception as e:
-        return error_response(f'Internal server error: {str(e)}', 500)
+    # Call SERVICE ✅
+    result = role_service.delete_role(role_id)
+    if not result:
+        return not_found_response('Role not found')
+    _invalidate_role_cache()
+    
+    return success_response(None, 'Role deleted successfully')
 
 
 @role_bp.route('/check-exists', methods=['POST'])
@@ -319,23 +311,16 @@ def check_role_exists():
       400:
         description: Invalid input
     """
-    try:
-        # Validate request data with schema
-        schema = RoleRequestSchema()
-        data = schema.load(request.get_json())
-        
-        # Call SERVICE ✅
-        exists = role_service.check_role_exists(data['role_name'])
-        
-        return success_response({
-            'role_name': data['role_name'],
-            'exists': exists
-        })
-        
-    except ValidationError as e:
-        return validation_error_response(e.messages)
-    except Exception as e:
-        return error_response(f'Internal server error: {str(e)}', 500)
+    # Validate request data with schema
+    data = fast_load(_role_request_schema, request.get_json())
+    
+    # Call SERVICE ✅
+    exists = role_service.check_role_exists(data['role_name'])
+    
+    return success_response({
+        'role_name': data['role_name'],
+        'exists': exists
+    })
 
 
 @role_bp.route('/stats', methods=['GET'])
@@ -349,14 +334,16 @@ def get_stats():
       200:
         description: Role statistics
     """
-    try:
+    with _role_cache_lock:
+        total = _role_stats_cache.get('total_roles')
+    
+    if total is None:
         # Call SERVICE ✅
         total = role_service.count_roles()
-        
-        return success_response({
-            'total_roles': total
-        })
-        
-    except Exception as e:
-        return error_response(f'Internal server error: {str(e)}', 500)
+        with _role_cache_lock:
+            _role_stats_cache['total_roles'] = total
+    
+    return success_response({
+        'total_roles': total
+    })
 
@@ -4,7 +4,7 @@ from infrastructure.repositories.service_package_repository import ServicePackag
 from infrastructure.databases.mssql import session
 from services.service_package_service import ServicePackageService
 from api.responses import success_response, error_response, not_found_response, validation_error_response
-from api.schemas import ServicePackageCreateRequestSchema, ServicePackageUpdateRequestSchema, ServicePackageResponseSchema
+from api.schemas import ServicePackageCreateRequestSchema, ServicePackageUpdateRequestSchema, ServicePackageResponseSchema, fast_dump, fast_load
 
 service_package_bp = Blueprint('service_package', __name__, url_prefix='/api/service-packages')
 
@@ -14,6 +14,10 @@ package_repo = ServicePackageRepository(session)
 # Initialize SERVICE (Business Logic Layer) ✅
 package_service = ServicePackageService(package_repo)
 
+# Initialize schemas once (reused across requests)
+_service_package_create_request_schema = ServicePackageCreateRequestSchema()
+_service_package_response_schema = ServicePackageResponseSchema()
+
 
 @service_package_bp.route('/health', methods=['GET'])
 def health_check():
@@ -80,8 +84,7 @@ def create_package():
         description: Invalid input
     """
     try:
-        schema = ServicePackageCreateRequestSchema()
-        data = schema.load(request.get_json())
+        data = fast_load(_service_package_create_request_schema, request.get_json())
         
         # Check if name exists via SERVICE
         existing = package_service.get_package_by_name(data['name'])
@@ -95,8 +98,7 @@ def create_package():
             duration_days=int(data['duration_days'])
         )
         
-        response_schema = ServicePackageResponseSchema()
-        return success_response(response_schema.dump(package), 'Package created successfully', 201)
+        return success_response(fast_dump(_service_package_response_schema, package), 'Package created successfully', 201)
         
     except ValidationError as e:
         return validation_error_response(e.messages)
@@ -130,8 +132,7 @@ def get_package(package_id):
         if not package:
             return not_found_response('Package not found')
         
-        schema = ServicePackageResponseSchema()
-        return success_response(schema.dump(package))
+        return success_response(fast_dump(_service_package_response_schema, package))
         
     except Exception as e:
         return error_response(f'Internal server error: {str(e)}', 500)
@@ -161,8 +162,7 @@ def get_package_by_name(name):
         if not package:
             return not_found_response('Package not found')
         
-        schema = ServicePackageResponseSchema()
-        return success_response(schema.dump(package))
+        return success_response(fast_dump(_service_package_response_schema, package))
         
     except Exception as e:
         return error_response(f'Internal server error: {str(e)}', 500)
@@ -234,8 +234,7 @@ def get_cheapest():
         if not package:
             return not_found_response('No packages found')
         
-        schema = ServicePackageResponseSchema()
-        return success_response(schema.dump(package))
+        return success_response(fast_dump(_service_package_response_schema, package))
         
     except Exception as e:
         return error_response(f'Internal server error: {str(e)}', 500)
@@ -259,8 +258,7 @@ def get_most_expensive():
         if not package:
             return not_found_response('No packages found')
         
-        schema = ServicePackageResponseSchema()
-        return success_response(schema.dump(package))
+        return success_response(fast_dump(_service_package_response_schema, package))
         
     except Exception as e:
         return error_response(f'Internal server error: {str(e)}', 500)
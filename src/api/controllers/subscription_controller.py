@@ -1,27 +1,28 @@
 from flask import Blueprint, request, jsonify
 from marshmallow import ValidationError
 from infrastructure.repositories.subscription_repository import SubscriptionRepository
-from infrastructure.repositories.account_repository import AccountRepository
-from infrastructure.repositories.service_package_repository import ServicePackageRepository
 from infrastructure.databases.mssql import session
 from services.subscription_service import SubscriptionService
-from services.account_service import AccountService
-from services.service_package_service import ServicePackageService
 from api.responses import success_response, error_response, not_found_response, validation_error_response
-from api.schemas import SubscriptionCreateRequestSchema, SubscriptionUpdateRequestSchema, SubscriptionResponseSchema
+from domain.exceptions import NotFoundException, BusinessRuleException
+from api.schemas import SubscriptionCreateRequestSchema, SubscriptionUpdateRequestSchema, SubscriptionResponseSchema, fast_dump, fast_load
 from datetime import datetime, timedelta, date
 
 subscription_bp = Blueprint('subscription', __name__, url_prefix='/api/subscriptions')
 
 # Initialize repositories (only for service initialization)
 subscription_repo = SubscriptionRepository(session)
-account_repo = AccountRepository(session)
-package_repo = ServicePackageRepository(session)
 
 # Initialize SERVICES (Business Logic Layer) ✅
 subscription_service = SubscriptionService(subscription_repo)
-account_service = AccountService(account_repo)
-package_service = ServicePackageService(package_repo)
+
+# Initialize schemas once (reused across requests)
+_subscription_create_request_schema = SubscriptionCreateRequestSchema()
+_subscription_response_schema = SubscriptionResponseSchema()
+_subscription_response_many_schema = SubscriptionResponseSchema(many=True)
+
+# Body fields renew_subscription requires
+_RENEW_REQUIRED_FIELDS = ('duration_days', 'additional_credits')
 
 
 @subscription_bp.route('/health', methods=['GET'])
@@ -97,21 +98,10 @@ def create_subscription():
         description: Invalid input
     """
     try:
-        schema = SubscriptionCreateRequestSchema()
-        data = schema.load(request.get_json())
-        
-        account = account_service.get_account_by_id(data['account_id'])
-        if not account:
-            return not_found_response('Account not found')
-        
-        # Validate package exists and get package details
-        package = package_service.get_package_by_id(data['package_id'])
-        if not package:
-            return not_found_response('Service package not found')
+        data = fast_load(_subscription_create_request_schema, request.get_json())
         
-        # Validate package has duration_days
-        if not hasattr(package, 'duration_days') or package.duration_days is None:
-            return error_response('Service package missing duration_days information', 400)
+        # Validate account and package exist and get package duration (one query)
+        duration_days = subscription_service.get_package_duration_for_account(data['account_id'], data['package_id'])
         
         # Auto-calculate start_date and end_date from package duration
         start_date = data.get('start_date')
@@ -122,7 +112,6 @@ def create_subscription():
         if not end_date:
             # Calculate end_date from start_date + package duration_days
             # IMPORTANT: Use duration_days from the package (e.g., 30, 90, 180 days)
-            duration_days = package.duration_days
             if duration_days <= 0:
                 return error_response('Invalid package duration_days', 400)
             end_date = start_date + timedelta(days=duration_days)
@@ -136,11 +125,12 @@ def create_subscription():
             status=data.get('status', 'active')
         )
         
-        response_schema = SubscriptionResponseSchema()
-        return success_response(response_schema.dump(subscription), 'Subscription created successfully', 201)
+        return success_response(fast_dump(_subscription_response_schema, subscription), 'Subscription created successfully', 201)
         
     except ValidationError as e:
         return validation_error_response(e.messages)
+    except NotFoundException as e:
+        return not_found_response(str(e))
     except ValueError as e:
         return error_response(str(e), 400)
     except Exception as e:
@@ -171,8 +161,7 @@ def get_subscription(subscription_id):
         if not subscription:
             return not_found_response('Subscription not found')
         
-        schema = SubscriptionResponseSchema()
-        return success_response(schema.dump(subscription))
+        return success_response(fast_dump(_subscription_response_schema, subscription))
         
     except Exception as e:
         return error_response(f'Internal server error: {str(e)}', 500)
@@ -201,7 +190,7 @@ def get_subscriptions_by_account(account_id):
         return success_response({
             'account_id': account_id,
             'count': len(subscriptions),
-            'subscriptions': SubscriptionResponseSchema(many=True).dump(subscriptions)
+            'subscriptions': fast_dump(_subscription_response_many_schema, subscriptions)
         })
         
     except Exception as e:
@@ -232,8 +221,7 @@ def get_active_subscription(account_id):
         if not subscription:
             return not_found_response('No active subscription found')
         
-        schema = SubscriptionResponseSchema()
-        return success_response(schema.dump(subscription))
+        return success_response(fast_dump(_subscription_response_schema, subscription))
         
     except Exception as e:
         return error_response(f'Internal server error: {str(e)}', 500)
@@ -278,24 +266,11 @@ def get_account_credits(account_id):
         description: Account not found
     """
     try:
-        # Validate account exists
-        account = account_service.get_account_by_id(account_id)
-        if not account:
-            return not_found_response('Account not found')
-        
-        # Get remaining credits via SERVICE ✅
-        remaining_credits = subscription_service.get_remaining_credits(account_id)
-        
-        # Check if has active subscription
-        active_subscription = subscription_service.get_active_subscription(account_id)
-        has_active_subscription = active_subscription is not None
-        
-        return success_response({
-            'account_id': account_id,
-            'remaining_credits': remaining_credits,
-            'has_active_subscription': has_active_subscription
-        })
+        # Account check and active subscription credits in one query via SERVICE ✅
+        return success_response(subscription_service.get_account_credits(account_id))
         
+    except NotFoundException as e:
+        return not_found_response(str(e))
     except Exception as e:
         return error_response(f'Internal server error: {str(e)}', 500)
 
@@ -319,18 +294,19 @@ def get_subscriptions_by_status(status):
         description: List of subscriptions
     """
     try:
-        subscriptions = subscription_service.get_subscriptions_by_status(status)
+        # Listed columns only, end_date already formatted by the database
+        rows = subscription_service.get_subscriptions_by_status_summary(status)
         
         return success_response({
             'status': status,
-            'count': len(subscriptions),
+            'count': len(rows),
             'subscriptions': [{
-                'subscription_id': s.subscription_id,
-                'account_id': s.account_id,
-                'package_id': s.package_id,
-                'remaining_credits': s.remaining_credits,
-                'end_date': s.end_date.isoformat() if s.end_date else None
-            } for s in subscriptions]
+                'subscription_id': subscription_id,
+                'account_id': account_id,
+                'package_id': package_id,
+                'remaining_credits': remaining_credits,
+                'end_date': end_date
+            } for subscription_id, account_id, package_id, remaining_credits, end_date in rows]
         })
         
     except Exception as e:
@@ -357,17 +333,18 @@ def get_expiring_soon():
     """
     try:
         days = request.args.get('days', 7, type=int)
-        subscriptions = subscription_service.get_expiring_soon(days)
+        # Only the four listed columns are selected (end_date formatted by the database)
+        rows = subscription_service.get_expiring_soon_summary(days)
         
         return success_response({
             'days': days,
-            'count': len(subscriptions),
+            'count': len(rows),
             'subscriptions': [{
-                'subscription_id': s.subscription_id,
-                'account_id': s.account_id,
-                'end_date': s.end_date.isoformat() if s.end_date else None,
-                'remaining_credits': s.remaining_credits
-            } for s in subscriptions]
+                'subscription_id': subscription_id,
+                'account_id': account_id,
+                'end_date': end_date,
+                'remaining_credits': remaining_credits
+            } for subscription_id, account_id, end_date, remaining_credits in rows]
         })
         
     except Exception as e:
@@ -424,15 +401,18 @@ def deduct_credit(subscription_id):
         if not data.get('amount'):
             return validation_error_response({'amount': 'Amount is required'})
         
-        subscription = subscription_service.deduct_credits(subscription_id, data['amount'])
-        if not subscription:
-            return not_found_response('Subscription not found or insufficient credits')
+        # Single conditional UPDATE; insufficient credits or inactive subscription raise
+        subscription = subscription_service.deduct_credit(subscription_id, data['amount'])
         
         return success_response({
             'subscription_id': subscription.subscription_id,
             'remaining_credits': subscription.remaining_credits
         }, 'Credits deducted successfully')
         
+    except NotFoundException as e:
+        return not_found_response(str(e))
+    except BusinessRuleException as e:
+        return error_response(str(e), 400)
     except ValueError as e:
         return error_response(str(e), 400)
     except Exception as e:
@@ -489,15 +469,15 @@ def add_credit(subscription_id):
         if not data.get('amount'):
             return validation_error_response({'amount': 'Amount is required'})
         
-        subscription = subscription_service.add_credits(subscription_id, data['amount'])
-        if not subscription:
-            return not_found_response('Subscription not found')
+        subscription = subscription_service.add_credit(subscription_id, data['amount'])
         
         return success_response({
             'subscription_id': subscription.subscription_id,
             'remaining_credits': subscription.remaining_credits
         }, 'Credits added successfully')
         
+    except NotFoundException as e:
+        return not_found_response(str(e))
     except ValueError as e:
         return error_response(str(e), 400)
     except Exception as e:
@@ -609,9 +589,9 @@ def renew_subscription(subscription_id):
     try:
         data = request.get_json()
         
-        required_fields = ['duration_days', 'additional_credits']
-        missing_fields = [field for field in required_fields if not data.get(field)]
-        if missing_fields:
+        # Happy path is two dict lookups; the missing list is only built for the error
+        if not (data.get('duration_days') and data.get('additional_credits')):
+            missing_fields = [field for field in _RENEW_REQUIRED_FIELDS if not data.get(field)]
             return validation_error_response({'message': f'Missing required fields: {", ".join(missing_fields)}'})
         
         subscription = subscription_service.renew_subscription(
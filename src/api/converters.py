@@ -0,0 +1,17 @@
+# src/api/converters.py
+
+import re
+
+from werkzeug.routing import BaseConverter
+
+from services.message_service import VALID_SENDER_TYPES
+
+class SenderTypeConverter(BaseConverter):
+    """Match only known sender types in the URL (case-insensitive); anything else 404s at routing"""
+    regex = '(?i:' + '|'.join(re.escape(t) for t in VALID_SENDER_TYPES) + ')'
+
+    def to_python(self, value):
+        return value.lower()
+
+    def to_url(self, value):
+        return value.lower()
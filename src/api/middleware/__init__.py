@@ -6,13 +6,21 @@ from .auth_middleware import (
     jwt_required,
     get_current_user,
     get_current_user_role,
-    require_role
+    require_role,
+    register_jwt_error_handlers,
+    AuthorizationHeaderMiddleware
 )
+from .error_middleware import map_api_errors, error_to_response, register_api_error_handlers
 
 __all__ = [
     'jwt_required',
     'get_current_user',
     'get_current_user_role',
-    'require_role'
+    'require_role',
+    'register_jwt_error_handlers',
+    'AuthorizationHeaderMiddleware',
+    'map_api_errors',
+    'error_to_response',
+    'register_api_error_handlers'
 ]
 
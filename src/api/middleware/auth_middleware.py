@@ -3,55 +3,96 @@ Authentication Middleware for JWT token validation
 """
 
 from functools import wraps
-from flask import request, jsonify
-from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity, get_jwt
+from flask import request, jsonify, current_app, g
+from flask_jwt_extended import verify_jwt_in_request, get_jwt
 from api.responses import error_response
 
+_BEARER_PREFIX = 'Bearer '
+
+def _get_verified_claims():
+    """Verify the request's JWT once and reuse its claims for the rest of the request"""
+    claims = g.get('_jwt_claims')
+    if claims is None:
+        verify_jwt_in_request()
+        claims = g._jwt_claims = get_jwt()
+    return claims
+
 def jwt_required(f):
     """Decorator to require JWT authentication"""
     @wraps(f)
     def decorated_function(*args, **kwargs):
         try:
-            verify_jwt_in_request()
-            return f(*args, **kwargs)
-        except Exception as e:
+            _get_verified_claims()
+        except Exception:
             return error_response('Authentication required. Please provide a valid token.', 401)
+        return f(*args, **kwargs)
     return decorated_function
 
 def get_current_user():
     """Get current authenticated user ID from JWT token"""
     try:
-        verify_jwt_in_request()
-        return get_jwt_identity()
+        return _get_verified_claims().get(current_app.config['JWT_IDENTITY_CLAIM'])
     except Exception:
         return None
 
 def get_current_user_role():
     """Get current user's role from JWT token claims"""
     try:
-        verify_jwt_in_request()
-        claims = get_jwt()
-        return claims.get('role_id')
+        return _get_verified_claims().get('role_id')
     except Exception:
         return None
 
 def require_role(*allowed_roles):
     """Decorator to require specific role(s)"""
+    # Resolved once per decorated view; membership is a hash lookup per request
+    required_role_ids = frozenset(allowed_roles)
     def decorator(f):
         @wraps(f)
-        @jwt_required
         def decorated_function(*args, **kwargs):
+            # Verify once here instead of through a stacked jwt_required wrapper
             try:
-                verify_jwt_in_request()
-                claims = get_jwt()
-                user_role_id = claims.get('role_id')
-                
-                if user_role_id not in allowed_roles:
-                    return error_response('Insufficient permissions. Required role not found.', 403)
-                
-                return f(*args, **kwargs)
-            except Exception as e:
+                user_role_id = _get_verified_claims().get('role_id')
+            except Exception:
                 return error_response('Authentication required. Please provide a valid token.', 401)
+            
+            if user_role_id not in required_role_ids:
+                return error_response('Insufficient permissions. Required role not found.', 403)
+            
+            return f(*args, **kwargs)
         return decorated_function
     return decorator
 
+class AuthorizationHeaderMiddleware:
+    """WSGI middleware adding the missing 'Bearer ' prefix to raw JWT Authorization headers
+
+    Swagger UI and some clients send the bare token. Normalising it once at the
+    WSGI edge means no blueprint hook or decorator has to fix the header.
+    """
+
+    def __init__(self, wsgi_app):
+        self.wsgi_app = wsgi_app
+
+    def __call__(self, environ, start_response):
+        auth_header = environ.get('HTTP_AUTHORIZATION')
+        # Looks like a JWT token (starts with eyJ or is long enough) without the prefix
+        if auth_header and auth_header[:7] != _BEARER_PREFIX and (auth_header[:3] == 'eyJ' or len(auth_header) > 50):
+            environ['HTTP_AUTHORIZATION'] = _BEARER_PREFIX + auth_header
+        return self.wsgi_app(environ, start_response)
+
+def register_jwt_error_handlers(jwt):
+    """Return flask-jwt-extended failures as the API's standard 401 error response"""
+    def _authentication_failed(reason):
+        current_app.logger.warning("JWT verification failed: %s", reason)
+        return error_response(f'Authentication required. Please provide a valid token. Error: {reason}', 401)
+
+    @jwt.unauthorized_loader
+    def unauthorized_callback(reason):
+        return _authentication_failed(reason)
+
+    @jwt.invalid_token_loader
+    def invalid_token_callback(reason):
+        return _authentication_failed(reason)
+
+    @jwt.expired_token_loader
+    def expired_token_callback(jwt_header, jwt_payload):
+        return _authentication_failed('Token has expired')
@@ -0,0 +1,43 @@
+"""
+Error-mapping middleware: turns exceptions raised by handlers into API responses
+"""
+
+from functools import wraps
+from flask import current_app, request
+from marshmallow import ValidationError
+from api.responses import error_response, validation_error_response
+from domain.exceptions import NotFoundException, ValidationException, ConflictException, UnauthorizedException
+
+# Exception type -> response builder; looked up along the exception's MRO so
+# subclasses map like their closest registered base
+_ERROR_RESPONSES = {
+    ValidationError: lambda e: validation_error_response(e.messages),
+    ValidationException: lambda e: error_response(str(e), 400),
+    UnauthorizedException: lambda e: error_response(str(e), 401),
+    ConflictException: lambda e: error_response(str(e), 409),
+    NotFoundException: lambda e: error_response(str(e), 404),
+    ValueError: lambda e: error_response(str(e), 400),
+}
+
+def error_to_response(e):
+    """Build the API error response for an exception raised by a handler"""
+    for cls in type(e).__mro__:
+        build = _ERROR_RESPONSES.get(cls)
+        if build is not None:
+            return build(e)
+    current_app.logger.exception("Unhandled error in %s", request.endpoint)
+    return error_response(f'Internal server error: {str(e)}', 500)
+
+def map_api_errors(f):
+    """Decorator replacing per-handler try/except ladders with error_to_response"""
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        try:
+            return f(*args, **kwargs)
+        except Exception as e:
+            return error_to_response(e)
+    return decorated_function
+
+def register_api_error_handlers(blueprint):
+    """Map every exception escaping the blueprint's views through error_to_response"""
+    blueprint.register_error_handler(Exception, error_to_response)
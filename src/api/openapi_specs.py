@@ -0,0 +1,547 @@
+# src/api/openapi_specs.py
+
+"""
+OpenAPI (Swagger 2.0) specs for the auth and message endpoints.
+
+Kept as plain dicts and attached with flasgger's @swag_from so the YAML is
+not re-parsed out of view docstrings when the spec is built. The one-line
+view docstrings still provide each operation's summary.
+"""
+
+
+# Authentication endpoints
+
+AUTH_HEALTH_SPEC = {
+    'tags': ['Authentication'],
+    'responses': {
+        200: {
+            'description': 'Service is healthy',
+        },
+    },
+}
+
+REGISTER_SPEC = {
+    'tags': ['Authentication'],
+    'parameters': [
+        {
+            'in': 'body',
+            'name': 'body',
+            'required': True,
+            'schema': {
+                'type': 'object',
+                'required': ['email', 'password', 'role_id'],
+                'properties': {
+                    'email': {
+                        'type': 'string',
+                        'format': 'email',
+                        'example': 'user@example.com',
+                    },
+                    'password': {
+                        'type': 'string',
+                        'format': 'password',
+                        'minLength': 6,
+                        'example': 'password123',
+                    },
+                    'role_id': {
+                        'type': 'integer',
+                        'example': 3,
+                        'description': 'Role ID (1=Admin, 2=Doctor, 3=Patient, 4=ClinicManager)',
+                    },
+                    'clinic_id': {
+                        'type': 'integer',
+                        'example': 1,
+                    },
+                },
+            },
+        },
+    ],
+    'responses': {
+        201: {
+            'description': 'Account created successfully',
+            'schema': {
+                'type': 'object',
+                'properties': {
+                    'message': {
+                        'type': 'string',
+                    },
+                    'data': {
+                        'type': 'object',
+                        'properties': {
+                            'access_token': {
+                                'type': 'string',
+                            },
+                            'account_id': {
+                                'type': 'integer',
+                            },
+                            'email': {
+                                'type': 'string',
+                            },
+                            'role_id': {
+                                'type': 'integer',
+                            },
+                        },
+                    },
+                },
+            },
+        },
+        400: {
+            'description': 'Invalid input or email already exists',
+        },
+    },
+}
+
+LOGIN_SPEC = {
+    'tags': ['Authentication'],
+    'parameters': [
+        {
+            'in': 'body',
+            'name': 'body',
+            'required': True,
+            'schema': {
+                'type': 'object',
+                'required': ['email', 'password'],
+                'properties': {
+                    'email': {
+                        'type': 'string',
+                        'format': 'email',
+                        'example': 'user@example.com',
+                    },
+                    'password': {
+                        'type': 'string',
+                        'format': 'password',
+                        'example': 'password123',
+                    },
+                },
+            },
+        },
+    ],
+    'responses': {
+        200: {
+            'description': 'Login successful',
+            'schema': {
+                'type': 'object',
+                'properties': {
+                    'message': {
+                        'type': 'string',
+                    },
+                    'data': {
+                        'type': 'object',
+                        'properties': {
+                            'access_token': {
+                                'type': 'string',
+                            },
+                            'account_id': {
+                                'type': 'integer',
+                            },
+                            'email': {
+                                'type': 'string',
+                            },
+                            'role_id': {
+                                'type': 'integer',
+                            },
+                        },
+                    },
+                },
+            },
+        },
+        401: {
+            'description': 'Invalid credentials',
+        },
+        400: {
+            'description': 'Invalid input',
+        },
+    },
+}
+
+AUTH_ME_SPEC = {
+    'tags': ['Authentication'],
+    'security': [
+        {
+            'Bearer': [],
+        },
+    ],
+    'responses': {
+        200: {
+            'description': 'User information',
+            'schema': {
+                'type': 'object',
+                'properties': {
+                    'message': {
+                        'type': 'string',
+                    },
+                    'data': {
+                        'type': 'object',
+                        'properties': {
+                            'account_id': {
+                                'type': 'integer',
+                            },
+                            'email': {
+                                'type': 'string',
+                            },
+                            'role_id': {
+                                'type': 'integer',
+                            },
+                            'clinic_id': {
+                                'type': 'integer',
+                            },
+                            'status': {
+                                'type': 'string',
+                            },
+                        },
+                    },
+                },
+            },
+        },
+        401: {
+            'description': 'Authentication required',
+        },
+    },
+}
+
+
+# Message endpoints
+
+MESSAGE_HEALTH_SPEC = {
+    'tags': ['Message'],
+    'responses': {
+        200: {
+            'description': 'Service is healthy',
+        },
+    },
+}
+
+CREATE_MESSAGE_SPEC = {
+    'tags': ['Message'],
+    'consumes': ['application/json'],
+    'produces': ['application/json'],
+    'parameters': [
+        {
+            'in': 'body',
+            'name': 'body',
+            'required': True,
+            'schema': {
+                'type': 'object',
+                'required': [
+                    'conversation_id',
+                    'sender_type',
+                    'sender_name',
+                    'content',
+                ],
+                'properties': {
+                    'conversation_id': {
+                        'type': 'integer',
+                        'example': 1,
+                    },
+                    'sender_type': {
+                        'type': 'string',
+                        'enum': ['patient', 'doctor'],
+                        'example': 'patient',
+                    },
+                    'sender_name': {
+                        'type': 'string',
+                        'example': 'Nguyen Van A',
+                    },
+                    'content': {
+                        'type': 'string',
+                        'example': 'Hello doctor, I have a question about my test results',
+                    },
+                    'message_type': {
+                        'type': 'string',
+                        'enum': ['text', 'image', 'file'],
+                        'example': 'text',
+                    },
+                },
+            },
+        },
+    ],
+    'responses': {
+        201: {
+            'description': 'Message sent successfully',
+            'schema': {
+                'type': 'object',
+                'properties': {
+                    'message': {
+                        'type': 'string',
+                        'example': 'Message sent successfully',
+                    },
+                    'data': {
+                        'type': 'object',
+                    },
+                },
+            },
+        },
+        400: {
+            'description': 'Invalid input',
+        },
+    },
+}
+
+GET_MESSAGE_SPEC = {
+    'tags': ['Message'],
+    'parameters': [
+        {
+            'name': 'message_id',
+            'in': 'path',
+            'required': True,
+            'schema': {
+                'type': 'integer',
+            },
+        },
+    ],
+    'responses': {
+        200: {
+            'description': 'Message found',
+        },
+        404: {
+            'description': 'Message not found',
+        },
+    },
+}
+
+GET_MESSAGES_BY_CONVERSATION_SPEC = {
+    'tags': ['Message'],
+    'parameters': [
+        {
+            'name': 'conversation_id',
+            'in': 'path',
+            'required': True,
+            'schema': {
+                'type': 'integer',
+            },
+        },
+        {
+            'name': 'limit',
+            'in': 'query',
+            'required': False,
+            'schema': {
+                'type': 'integer',
+                'default': 50,
+            },
+        },
+    ],
+    'responses': {
+        200: {
+            'description': 'List of messages',
+        },
+    },
+}
+
+GET_RECENT_MESSAGES_SPEC = {
+    'tags': ['Message'],
+    'parameters': [
+        {
+            'name': 'conversation_id',
+            'in': 'path',
+            'required': True,
+            'schema': {
+                'type': 'integer',
+            },
+        },
+        {
+            'name': 'limit',
+            'in': 'query',
+            'required': False,
+            'schema': {
+                'type': 'integer',
+                'default': 20,
+            },
+        },
+    ],
+    'responses': {
+        200: {
+            'description': 'List of recent messages',
+        },
+    },
+}
+
+GET_LAST_MESSAGE_SPEC = {
+    'tags': ['Message'],
+    'parameters': [
+        {
+            'name': 'conversation_id',
+            'in': 'path',
+            'required': True,
+            'schema': {
+                'type': 'integer',
+            },
+        },
+    ],
+    'responses': {
+        200: {
+            'description': 'Last message',
+        },
+        404: {
+            'description': 'No messages found',
+        },
+    },
+}
+
+GET_MESSAGES_BY_SENDER_SPEC = {
+    'tags': ['Message'],
+    'parameters': [
+        {
+            'name': 'conversation_id',
+            'in': 'path',
+            'required': True,
+            'schema': {
+                'type': 'integer',
+            },
+        },
+        {
+            'name': 'sender_type',
+            'in': 'path',
+            'required': True,
+            'schema': {
+                'type': 'string',
+                'enum': ['patient', 'doctor'],
+            },
+        },
+    ],
+    'responses': {
+        200: {
+            'description': 'List of messages',
+        },
+    },
+}
+
+SEARCH_MESSAGES_SPEC = {
+    'tags': ['Message'],
+    'parameters': [
+        {
+            'name': 'conversation_id',
+            'in': 'path',
+            'required': True,
+            'schema': {
+                'type': 'integer',
+            },
+        },
+        {
+            'name': 'query',
+            'in': 'query',
+            'required': True,
+            'schema': {
+                'type': 'string',
+            },
+        },
+    ],
+    'responses': {
+        200: {
+            'description': 'Search results',
+        },
+    },
+}
+
+UPDATE_MESSAGE_SPEC = {
+    'tags': ['Message'],
+    'parameters': [
+        {
+            'name': 'message_id',
+            'in': 'path',
+            'required': True,
+            'schema': {
+                'type': 'integer',
+                'example': 1,
+            },
+        },
+        {
+            'in': 'body',
+            'name': 'body',
+            'required': True,
+            'schema': {
+                'type': 'object',
+                'required': ['content'],
+                'properties': {
+                    'content': {
+                        'type': 'string',
+                        'example': 'Updated message content',
+                    },
+                },
+            },
+        },
+    ],
+    'consumes': ['application/json'],
+    'produces': ['application/json'],
+    'responses': {
+        200: {
+            'description': 'Message updated successfully',
+            'schema': {
+                'type': 'object',
+                'properties': {
+                    'message': {
+                        'type': 'string',
+                        'example': 'Message updated successfully',
+                    },
+                    'data': {
+                        'type': 'object',
+                    },
+                },
+            },
+        },
+        400: {
+            'description': 'Content is required',
+        },
+        404: {
+            'description': 'Message not found',
+        },
+    },
+}
+
+DELETE_MESSAGE_SPEC = {
+    'tags': ['Message'],
+    'parameters': [
+        {
+            'name': 'message_id',
+            'in': 'path',
+            'required': True,
+            'schema': {
+                'type': 'integer',
+            },
+        },
+    ],
+    'responses': {
+        200: {
+            'description': 'Message deleted successfully',
+        },
+        404: {
+            'description': 'Message not found',
+        },
+    },
+}
+
+DELETE_ALL_MESSAGES_SPEC = {
+    'tags': ['Message'],
+    'parameters': [
+        {
+            'name': 'conversation_id',
+            'in': 'path',
+            'required': True,
+            'schema': {
+                'type': 'integer',
+            },
+        },
+    ],
+    'responses': {
+        200: {
+            'description': 'Messages deleted successfully',
+        },
+    },
+}
+
+GET_STATS_SPEC = {
+    'tags': ['Message'],
+    'parameters': [
+        {
+            'name': 'conversation_id',
+            'in': 'query',
+            'required': False,
+            'schema': {
+                'type': 'integer',
+            },
+        },
+    ],
+    'responses': {
+        200: {
+            'description': 'Message statistics',
+        },
+    },
+}
@@ -9,6 +9,13 @@ def get_request_data():
         return jsonify({"error": "No data provided"}), 400
     return data
 
+def get_bool_arg(name, default=False):
+    """Reads a 'true'/'false' query argument (case-insensitive; anything else is False)."""
+    raw = request.args.get(name)
+    if raw is None:
+        return default
+    return raw.lower() == 'true'
+
 def validate_request_schema(schema):
     """Validates the incoming request data against the provided schema."""
     data = get_request_data()
@@ -1,15 +1,67 @@
 # src/api/responses.py
 
-from flask import jsonify
+from decimal import Decimal
+from itertools import islice
+
+import orjson
+from flask import Response, current_app, stream_with_context
+
+def _json_default(obj):
+    """Serialize types orjson does not handle natively (mirrors Flask's provider)"""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _dumps(payload):
+    # OPT_NON_STR_KEYS: marshmallow error dicts use int keys for list indexes
+    return orjson.dumps(payload, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+
+def success_body(data, message="Success"):
+    """Serialize a success payload; constant payloads can be built once at import"""
+    return _dumps({"message": message, "data": data})
+
+def json_bytes_response(body, status_code=200):
+    return Response(body, mimetype="application/json"), status_code
 
 def success_response(data, message="Success", status_code=200):
-    return jsonify({"message": message, "data": data}), status_code
+    return json_bytes_response(success_body(data, message), status_code)
+
+# Items serialized per chunk when streaming a list response
+_STREAM_BATCH_SIZE = 100
+
+def stream_list_response(key, items, dump_many, message="Success", status_code=200):
+    """Stream {"message", "data": {key: [...], "count"}} from an iterator in batches
+
+    Only worth it for lazy iterators (e.g. a repository's iter_all); already
+    loaded lists should go through success_response. The first batch is read
+    and dumped before returning so its errors still reach the view's error
+    handling. A later failure is logged and aborts the stream, so clients see
+    a broken transfer rather than a truncated body that parses as complete.
+    """
+    items = iter(items)
+    first_batch = list(islice(items, _STREAM_BATCH_SIZE))
+    first_chunk = _dumps(dump_many(first_batch))
+
+    def generate():
+        yield (b'{"message":' + orjson.dumps(message) + b',"data":{' + orjson.dumps(key) + b':['
+               + first_chunk[1:-1])
+        count = len(first_batch)
+        try:
+            for batch in iter(lambda: list(islice(items, _STREAM_BATCH_SIZE)), []):
+                # Drop the batch's own brackets so batches join into one array
+                yield b',' + _dumps(dump_many(batch))[1:-1]
+                count += len(batch)
+        except Exception:
+            current_app.logger.exception("Streaming '%s' failed after %d items", key, count)
+            raise
+        yield b'],"count":' + str(count).encode() + b'}}'
+    return Response(stream_with_context(generate()), mimetype="application/json"), status_code
 
 def error_response(message="An error occurred", status_code=400):
-    return jsonify({"message": message}), status_code
+    return json_bytes_response(_dumps({"message": message}), status_code)
 
 def not_found_response(message="Resource not found"):
-    return jsonify({"message": message}), 404
+    return json_bytes_response(_dumps({"message": message}), 404)
 
 def validation_error_response(errors):
-    return jsonify({"message": "Validation errors", "errors": errors}), 422
\ No newline at end of file
+    return json_bytes_response(_dumps({"message": "Validation errors", "errors": errors}), 422)
\ No newline at end of file
@@ -1,3 +1,6 @@
+import sys
+from marshmallow import Schema
+from api.schemas import precompile_dump, precompile_load
 from api.controllers.auth_controller import auth_bp
 from api.controllers.role_controller import role_bp
 from api.controllers.account_controller import account_bp
@@ -47,3 +50,13 @@ def register_routes(app):
     app.register_blueprint(service_package_bp)
     app.register_blueprint(subscription_bp)
     app.register_blueprint(payment_bp)
+
+def warm_up_schemas():
+    """Generate fast load/dump code for the controllers' module-level schemas before the first request"""
+    for module_name, module in list(sys.modules.items()):
+        if not module_name.startswith('api.controllers.'):
+            continue
+        for value in vars(module).values():
+            if isinstance(value, Schema):
+                precompile_load(value)
+                precompile_dump(value)
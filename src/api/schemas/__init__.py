@@ -121,6 +121,10 @@ from .payment_schema import (
     PaymentResponseSchema
 )
 
+# Serialization helpers
+from .fast_dump import fast_dump, precompile_dump
+from .fast_load import fast_load, precompile_load
+
 __all__ = [
     # Authentication
     'LoginRequestSchema',
@@ -186,5 +190,11 @@ __all__ = [
     'PaymentCreateRequestSchema',
     'PaymentUpdateRequestSchema',
     'PaymentResponseSchema',
+    
+    # Serialization helpers
+    'fast_dump',
+    'fast_load',
+    'precompile_dump',
+    'precompile_load',
 ]
 
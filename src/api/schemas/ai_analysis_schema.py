@@ -3,13 +3,16 @@ from marshmallow import Schema, fields, validate
 # Valid status values for AI Analysis
 VALID_STATUSES = ['pending', 'processing', 'completed', 'failed']
 
+# Shared by the create and update schemas
+_status_validator = validate.OneOf(VALID_STATUSES)
+
 class AiAnalysisCreateRequestSchema(Schema):
     """Schema for creating an AI Analysis"""
     image_id = fields.Int(required=True, metadata={'description': "Retinal image ID"})
     ai_model_version_id = fields.Int(required=True, metadata={'description': "AI model version ID"})
     status = fields.Str(
         load_default="pending", 
-        validate=validate.OneOf(VALID_STATUSES),
+        validate=_status_validator,
         metadata={
             'description': "Analysis status",
             'enum': VALID_STATUSES,
@@ -22,7 +25,7 @@ class AiAnalysisUpdateRequestSchema(Schema):
     """Schema for updating an AI Analysis"""
     processing_time = fields.Int(metadata={'description': "Processing time in seconds"})
     status = fields.Str(
-        validate=validate.OneOf(VALID_STATUSES),
+        validate=_status_validator,
         metadata={
             'description': "Analysis status",
             'enum': VALID_STATUSES,
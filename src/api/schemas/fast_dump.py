@@ -0,0 +1,97 @@
+"""
+Fast dump path for flat response schemas
+
+Schema.dump() goes through per-field serialize()/get_value() dispatch on every
+object. For schemas made only of plain scalar fields, a straight-line dump
+function is generated once per schema instance and applied directly.
+Anything the generated code cannot reproduce exactly falls back to schema.dump().
+"""
+
+import datetime as dt
+from collections.abc import Mapping
+from weakref import WeakKeyDictionary
+from marshmallow import fields, missing
+from config import Config
+
+# Exact field classes whose serialization is "None stays None, else convert"
+_SCALAR_CONVERTERS = {
+    fields.Integer: 'int({})',
+    fields.String: 'str({})',
+    fields.Email: 'str({})',
+    fields.Float: 'float({})',
+}
+
+# Formats for which marshmallow emits the plain isoformat() string
+_ISO_FORMATS = (None, 'iso', 'iso8601')
+
+# Generated dump function per schema instance; None means the schema needs the full marshmallow path
+_dumpers = WeakKeyDictionary()
+
+def _field_expression(field, key, namespace):
+    """Return the expression serializing a non-None value ``v``, or None if unsupported"""
+    field_type = type(field)
+    if field_type in _SCALAR_CONVERTERS:
+        if getattr(field, 'as_string', False):
+            return None
+        return _SCALAR_CONVERTERS[field_type].format('v')
+    if field_type is fields.DateTime and field.format in _ISO_FORMATS:
+        return 'v.isoformat()'
+    if field_type is fields.Date and field.format in _ISO_FORMATS:
+        namespace['_date_isoformat'] = dt.date.isoformat
+        return '_date_isoformat(v)'
+    if field_type is fields.Boolean:
+        # Truthy/falsy set lookups stay in marshmallow; the bound method is passed in
+        serializer = f'_serialize_{len(namespace)}'
+        namespace[serializer] = field._serialize
+        return f'v if v.__class__ is bool else {serializer}(v, {key!r}, o)'
+    return None
+
+def _build_dumper(schema):
+    if any(schema._hooks.values()):
+        return None
+    namespace = {'_missing': missing}
+    lines = ['def _dump(o):', '    d = {}']
+    for name, field in schema.dump_fields.items():
+        attribute = field.attribute or name
+        if field.dump_default is not missing or '.' in attribute:
+            return None
+        key = field.data_key or name
+        expression = _field_expression(field, name, namespace)
+        if expression is None:
+            return None
+        lines += [
+            f'    v = getattr(o, {attribute!r}, _missing)',
+            '    if v is not _missing:',
+            f'        d[{key!r}] = None if v is None else {expression}',
+        ]
+    lines.append('    return d')
+    code = compile('\n'.join(lines), f'<fast_dump {type(schema).__name__}>', 'exec')
+    exec(code, namespace)
+    return namespace['_dump']
+
+def _get_dumper(schema):
+    try:
+        return _dumpers[schema]
+    except KeyError:
+        dumper = _dumpers[schema] = _build_dumper(schema)
+        return dumper
+
+def precompile_dump(schema):
+    """Generate the dump function for schema now instead of on its first fast_dump call"""
+    if Config.FAST_SCHEMA_DUMP:
+        _get_dumper(schema)
+
+def fast_dump(schema, obj):
+    """Dump obj with schema, skipping marshmallow's field dispatch for flat scalar schemas"""
+    if not Config.FAST_SCHEMA_DUMP:
+        return schema.dump(obj)
+    dumper = _get_dumper(schema)
+    if dumper is None:
+        return schema.dump(obj)
+    if schema.many:
+        if any(isinstance(item, Mapping) for item in obj):
+            return schema.dump(obj)
+        return [dumper(item) for item in obj]
+    if isinstance(obj, Mapping):
+        return schema.dump(obj)
+    return dumper(obj)
@@ -0,0 +1,177 @@
+"""
+Fast load path for request schemas
+
+Schema.load() builds an error store and dispatches through per-field getters
+on every request. For schemas without hooks, a straight-line load function is
+generated once per schema instance: exact int/str values are checked inline
+(Length/Range bounds included), ISO dates go through date.fromisoformat,
+lists of nested schemas reuse the nested schema's generated loader per item,
+and other fields call their bound Field.deserialize directly. Any input the
+generated code does not accept as-is (missing required key, unknown key, bad
+type, failed validator) is handed to schema.load(), so errors keep
+marshmallow's exact messages.
+"""
+
+import datetime as dt
+from weakref import WeakKeyDictionary
+from marshmallow import fields, validate, missing, RAISE, EXCLUDE, ValidationError
+from config import Config
+
+# Exact field classes whose load of an exact-type value is "validate, keep as is"
+_PASSTHROUGH_TYPES = {
+    fields.Integer: 'int',
+    fields.String: 'str',
+    fields.Email: 'str',
+}
+
+# Formats for which marshmallow parses dates with its ISO 8601 regex
+_ISO_FORMATS = (None, 'iso', 'iso8601')
+
+# Returned by generated loaders when the input needs the full marshmallow path
+_FALLBACK = object()
+
+# Generated load function per schema instance; None means the schema needs the full marshmallow path
+_loaders = WeakKeyDictionary()
+
+def _parse_iso_date(value):
+    """Parse a YYYY-MM-DD string with the C date parser; other input goes to marshmallow"""
+    try:
+        return dt.date.fromisoformat(value)
+    except ValueError:
+        return _FALLBACK
+
+def _inline_conditions(exact_type, validators):
+    """Return failure conditions on ``v`` replacing the validators, or None if one can't be inlined"""
+    conditions = []
+    for validator in validators:
+        validator_type = type(validator)
+        if validator_type is validate.Length and exact_type == 'str':
+            if validator.equal is not None:
+                conditions.append(f'len(v) != {validator.equal!r}')
+                continue
+            if validator.min is not None:
+                conditions.append(f'len(v) < {validator.min!r}')
+            if validator.max is not None:
+                conditions.append(f'len(v) > {validator.max!r}')
+        elif validator_type is validate.Range and exact_type == 'int':
+            for bound in (validator.min, validator.max):
+                if bound is not None and type(bound) is not int:
+                    return None
+            if validator.min is not None:
+                conditions.append(f'v {"<" if validator.min_inclusive else "<="} {validator.min!r}')
+            if validator.max is not None:
+                conditions.append(f'v {">" if validator.max_inclusive else ">="} {validator.max!r}')
+        else:
+            return None
+    return conditions
+
+def _nested_list_loader(field):
+    """Return the generated loader for the items of a List(Nested(...)) field, or None"""
+    if type(field) is not fields.List:
+        return None
+    inner = field.inner
+    if type(inner) is not fields.Nested or inner.many or inner.validators or inner.unknown is not None:
+        return None
+    return _get_loader(inner.schema)
+
+def _field_lines(index, key, attribute, field, namespace):
+    namespace[f'_deserialize_{index}'] = field.deserialize
+    lines = [f'    v = data.get({key!r}, _missing)', '    if v is _missing:']
+    if field.required:
+        lines.append('        return _FALLBACK')
+    elif field.load_default is not missing:
+        lines.append(f'        out[{attribute!r}] = _deserialize_{index}(_missing, {key!r}, data)')
+    else:
+        lines.append('        pass')
+    exact_type = _PASSTHROUGH_TYPES.get(type(field))
+    if exact_type:
+        lines.append(f'    elif v.__class__ is {exact_type}:')
+        conditions = _inline_conditions(exact_type, field.validators)
+        if conditions:
+            # A failing bound goes to schema.load() for marshmallow's error message
+            lines += [f'        if {" or ".join(conditions)}:', '            return _FALLBACK']
+        elif conditions is None:
+            namespace[f'_validate_{index}'] = field._validate
+            lines.append(f'        _validate_{index}(v)')
+        lines.append(f'        out[{attribute!r}] = v')
+    if type(field) is fields.Date and field.format in _ISO_FORMATS:
+        namespace['_parse_iso_date'] = _parse_iso_date
+        lines += [
+            "    elif v.__class__ is str and len(v) == 10 and v[4] == '-' and v[7] == '-':",
+            '        v = _parse_iso_date(v)',
+            '        if v is _FALLBACK:',
+            '            return _FALLBACK',
+        ]
+        if field.validators:
+            namespace[f'_validate_{index}'] = field._validate
+            lines.append(f'        _validate_{index}(v)')
+        lines.append(f'        out[{attribute!r}] = v')
+    item_loader = _nested_list_loader(field)
+    if item_loader:
+        namespace[f'_load_item_{index}'] = item_loader
+        lines += [
+            '    elif v.__class__ is list:',
+            f'        items = [_load_item_{index}(item) for item in v]',
+            '        if any(item is _FALLBACK for item in items):',
+            '            return _FALLBACK',
+        ]
+        if field.validators:
+            namespace[f'_validate_{index}'] = field._validate
+            lines.append(f'        _validate_{index}(items)')
+        lines.append(f'        out[{attribute!r}] = items')
+    lines += [
+        '    else:',
+        f'        out[{attribute!r}] = _deserialize_{index}(v, {key!r}, data)',
+    ]
+    return lines
+
+def _build_loader(schema):
+    if schema.many or any(schema._hooks.values()) or schema.unknown not in (RAISE, EXCLUDE):
+        return None
+    namespace = {'_missing': missing, '_FALLBACK': _FALLBACK}
+    lines = ['def _load(data):']
+    known_keys = []
+    body = []
+    for index, (name, field) in enumerate(schema.load_fields.items()):
+        attribute = field.attribute or name
+        if '.' in attribute:
+            return None
+        key = field.data_key or name
+        known_keys.append(key)
+        body += _field_lines(index, key, attribute, field, namespace)
+    namespace['_known_keys'] = frozenset(known_keys)
+    if schema.unknown == RAISE:
+        lines += ['    if data.__class__ is not dict or not data.keys() <= _known_keys:', '        return _FALLBACK']
+    else:
+        lines += ['    if data.__class__ is not dict:', '        return _FALLBACK']
+    lines.append('    out = {}')
+    lines += body
+    lines.append('    return out')
+    code = compile('\n'.join(lines), f'<fast_load {type(schema).__name__}>', 'exec')
+    exec(code, namespace)
+    return namespace['_load']
+
+def _get_loader(schema):
+    try:
+        return _loaders[schema]
+    except KeyError:
+        loader = _loaders[schema] = _build_loader(schema)
+        return loader
+
+def precompile_load(schema):
+    """Generate the load function for schema now instead of on its first fast_load call"""
+    if Config.FAST_SCHEMA_LOAD:
+        _get_loader(schema)
+
+def fast_load(schema, data):
+    """Load data with schema, skipping marshmallow's per-field dispatch when the input is valid"""
+    if not Config.FAST_SCHEMA_LOAD:
+        return schema.load(data)
+    loader = _get_loader(schema)
+    if loader is None:
+        return schema.load(data)
+    try:
+        result = loader(data)
+    except ValidationError:
+        result = _FALLBACK
+    return schema.load(data) if result is _FALLBACK else result
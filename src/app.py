@@ -1,17 +1,44 @@
-from flask import Flask, jsonify
+from flask import Flask, Response, current_app, jsonify
 from flasgger import Swagger
 from flask_jwt_extended import JWTManager
 from infrastructure.databases import init_db
-from api.routes import register_routes
+from api.routes import register_routes, warm_up_schemas
+from api.middleware import register_jwt_error_handlers, AuthorizationHeaderMiddleware
+from api.json_provider import OrjsonProvider
 from config import Config, SwaggerConfig
 
+def _cache_json_body(view):
+    """Build the view's JSON body on the first successful call and serve those bytes afterwards
+
+    Debug mode can be switched on after create_app (app.run(debug=True)), so it
+    is checked per request and keeps the view's per-request rebuild.
+    """
+    body = None
+
+    def cached_view(*args, **kwargs):
+        nonlocal body
+        if current_app.debug:
+            return view(*args, **kwargs)
+        if body is None:
+            response = view(*args, **kwargs)
+            if response.status_code != 200:
+                return response
+            body = response.get_data()
+        return Response(body, mimetype="application/json")
+
+    return cached_view
+
 def create_app():
     """Create and configure Flask application"""
     app = Flask(__name__)
     app.config.from_object(Config)
+    app.json = OrjsonProvider(app)
+    # Add the missing 'Bearer ' prefix to raw tokens once, before any view runs
+    app.wsgi_app = AuthorizationHeaderMiddleware(app.wsgi_app)
     
     # 1. Initialize JWT
     jwt = JWTManager(app)
+    register_jwt_error_handlers(jwt)
     print("✅ JWT Authentication initialized")
     
     # 2. Cấu hình Swagger/Flasgger cho API Documentation
@@ -32,6 +59,9 @@ def create_app():
     except Exception as e:
         print(f"❌ Error registering routes: {e}")
     
+    # Controllers build their schemas at import; generate their load/dump code now, not on first request
+    warm_up_schemas()
+    
     # 4. Root endpoint - API Information
     @app.route("/")
     def index():
@@ -91,6 +121,9 @@ def create_app():
             "documentation": "/docs"
         })
     
+    # 7. Routes are fixed from here on: encode the Swagger spec once instead of on every /apispec.json hit
+    app.view_functions['flasgger.apispec'] = _cache_json_body(app.view_functions['flasgger.apispec'])
+    
     return app
 
 if __name__ == '__main__':
@@ -2,6 +2,9 @@ from datetime import datetime
 from typing import Optional
 
 class AiAnalysis:
+    __slots__ = ('analysis_id', 'image_id', 'ai_model_version_id', 'analysis_time',
+                 'processing_time', 'status')
+
     def __init__(self, analysis_id: int, image_id: int, ai_model_version_id: int, 
                  analysis_time: datetime, processing_time: Optional[int], status: str):
         self.analysis_id = analysis_id
@@ -1,6 +1,8 @@
 from datetime import datetime
 
 class Conversation:
+    __slots__ = ('conversation_id', 'patient_id', 'doctor_id', 'created_at', 'status')
+
     def __init__(self, conversation_id: int, patient_id: int, doctor_id: int, 
                  created_at: datetime, status: str):
         self.conversation_id = conversation_id
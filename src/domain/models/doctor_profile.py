@@ -1,4 +1,6 @@
 class DoctorProfile:
+    __slots__ = ('doctor_id', 'account_id', 'doctor_name', 'specialization', 'license_number')
+
     def __init__(self, doctor_id: int, account_id: int, doctor_name: str, 
                  specialization: str, license_number: str):
         self.doctor_id = doctor_id
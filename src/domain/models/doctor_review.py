@@ -2,6 +2,9 @@ from datetime import datetime
 from typing import Optional
 
 class DoctorReview:
+    __slots__ = ('review_id', 'analysis_id', 'doctor_id', 'validation_status', 'comment',
+                 'reviewed_at')
+
     def __init__(self, review_id: int, analysis_id: int, doctor_id: int, 
                  validation_status: str, comment: Optional[str], reviewed_at: datetime):
         self.review_id = review_id
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from .account import Account
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 
 class IAccountRepository(ABC):
@@ -61,3 +61,8 @@ class IAccountRepository(ABC):
     def get_by_clinic(self, clinic_id: int) -> List[Account]:
         """Get all accounts in a clinic"""
         pass
+
+    @abstractmethod
+    def check_references_exist(self, role_id: int, clinic_id: Optional[int]) -> Tuple[bool, bool]:
+        """Return (role_exists, clinic_exists); clinic_exists is True when no clinic is given"""
+        pass
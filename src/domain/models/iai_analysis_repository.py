@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from .ai_analysis import AiAnalysis
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime, date
 
 class IAiAnalysisRepository(ABC):
@@ -57,6 +57,11 @@ class IAiAnalysisRepository(ABC):
     def count_by_status(self, status: str) -> int:
         pass
 
+    @abstractmethod
+    def count_grouped_by_status(self) -> Dict[str, int]:
+        """Count analyses per status with one GROUP BY query; statuses with no rows are absent"""
+        pass
+
     @abstractmethod
     def get_average_processing_time(self) -> float:
         pass
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from .conversation import Conversation
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 class IConversationRepository(ABC):
@@ -57,10 +57,20 @@ class IConversationRepository(ABC):
     def count_by_patient(self, patient_id: int) -> int:
         pass
 
+    @abstractmethod
+    def count_by_patients(self, patient_ids: List[int]) -> Dict[int, int]:
+        """Count conversations for several patients with one grouped query; every id is present (0 if none)"""
+        pass
+
     @abstractmethod
     def count_by_doctor(self, doctor_id: int) -> int:
         pass
 
+    @abstractmethod
+    def count_by_doctors(self, doctor_ids: List[int]) -> Dict[int, int]:
+        """Count conversations for several doctors with one grouped query; every id is present (0 if none)"""
+        pass
+
     @abstractmethod
     def count_active(self) -> int:
         pass
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from .doctor_review import DoctorReview
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 class IDoctorReviewRepository(ABC):
@@ -57,3 +57,8 @@ class IDoctorReviewRepository(ABC):
     def count_by_status(self, validation_status: str) -> int:
         pass
 
+    @abstractmethod
+    def count_grouped_by_status(self) -> Dict[str, int]:
+        """Count reviews per status with one GROUP BY query; statuses with no rows are absent"""
+        pass
+
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from .medical_report import MedicalReport
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
 from datetime import datetime, date
 
 class IMedicalReportRepository(ABC):
@@ -13,10 +13,20 @@ class IMedicalReportRepository(ABC):
     def get_by_id(self, report_id: int) -> Optional[MedicalReport]:
         pass
 
+    @abstractmethod
+    def get_by_ids(self, report_ids: List[int]) -> List[MedicalReport]:
+        """Fetch several rows with one IN query; ids without a row are skipped"""
+        pass
+
     @abstractmethod
     def get_by_analysis_id(self, analysis_id: int) -> Optional[MedicalReport]:
         pass
 
+    @abstractmethod
+    def get_by_analysis_ids(self, analysis_ids: List[int]) -> Dict[int, MedicalReport]:
+        """Map each analysis id to its report; ids without a report are absent"""
+        pass
+
     @abstractmethod
     def get_by_patient(self, patient_id: int) -> List[MedicalReport]:
         pass
@@ -25,6 +35,11 @@ class IMedicalReportRepository(ABC):
     def get_recent_by_patient(self, patient_id: int, limit: int) -> List[MedicalReport]:
         pass
 
+    @abstractmethod
+    def get_recent_by_patients(self, patient_ids: List[int], limit_per_patient: int) -> Dict[int, List[MedicalReport]]:
+        """Map each patient id to its newest reports (newest first); every id is present"""
+        pass
+
     @abstractmethod
     def get_by_doctor(self, doctor_id: int) -> List[MedicalReport]:
         pass
@@ -37,6 +52,16 @@ class IMedicalReportRepository(ABC):
     def get_by_date_range(self, start_date: date, end_date: date) -> List[MedicalReport]:
         pass
 
+    @abstractmethod
+    def iter_all(self, batch_size: int = 1000) -> Iterator[MedicalReport]:
+        """Stream all reports with a server-side cursor, batch_size rows per fetch; prefer over get_all for exports"""
+        pass
+
+    @abstractmethod
+    def iter_by_date_range(self, start_date: date, end_date: date, batch_size: int = 1000) -> Iterator[MedicalReport]:
+        """Stream reports created in the date range with a server-side cursor"""
+        pass
+
     @abstractmethod
     def update_report_url(self, report_id: int, report_url: str) -> Optional[MedicalReport]:
         pass
@@ -49,7 +74,17 @@ class IMedicalReportRepository(ABC):
     def count_by_patient(self, patient_id: int) -> int:
         pass
 
+    @abstractmethod
+    def count_by_patients(self, patient_ids: List[int]) -> Dict[int, int]:
+        """Count reports for several patients with one grouped query; every id is present (0 if none)"""
+        pass
+
     @abstractmethod
     def count_by_doctor(self, doctor_id: int) -> int:
         pass
 
+    @abstractmethod
+    def count_by_doctors(self, doctor_ids: List[int]) -> Dict[int, int]:
+        """Count reports for several doctors with one grouped query; every id is present (0 if none)"""
+        pass
+
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from .message import Message
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 class IMessageRepository(ABC):
@@ -9,18 +9,37 @@ class IMessageRepository(ABC):
             content: str, message_type: str, sent_at: datetime) -> Message:
         pass
 
+    @abstractmethod
+    def add_many(self, items: List[dict]) -> List[Message]:
+        """Insert several messages (add keyword dicts) in one transaction"""
+        pass
+
     @abstractmethod
     def get_by_id(self, message_id: int) -> Optional[Message]:
         pass
 
+    @abstractmethod
+    def get_by_ids(self, message_ids: List[int]) -> List[Message]:
+        """Fetch several rows with one IN query; ids without a row are skipped"""
+        pass
+
     @abstractmethod
     def get_by_conversation(self, conversation_id: int) -> List[Message]:
         pass
 
+    @abstractmethod
+    def get_recent_by_conversation(self, conversation_id: int, limit: int) -> List[Message]:
+        pass
+
     @abstractmethod
     def get_last_message(self, conversation_id: int) -> Optional[Message]:
         pass
 
+    @abstractmethod
+    def get_last_messages(self, conversation_ids: List[int]) -> Dict[int, Message]:
+        """Map each conversation id to its latest message; conversations without messages are absent"""
+        pass
+
     @abstractmethod
     def get_by_sender(self, conversation_id: int, sender_type: str) -> List[Message]:
         pass
@@ -38,13 +57,18 @@ class IMessageRepository(ABC):
         pass
 
     @abstractmethod
-    def delete_all_by_conversation(self, conversation_id: int) -> bool:
+    def delete_all_by_conversation(self, conversation_id: int) -> int:
         pass
 
     @abstractmethod
     def count_by_conversation(self, conversation_id: int) -> int:
         pass
 
+    @abstractmethod
+    def count_by_conversations(self, conversation_ids: List[int]) -> Dict[int, int]:
+        """Count messages for several conversations with one grouped query; every id is present (0 if none)"""
+        pass
+
     @abstractmethod
     def count_by_sender(self, conversation_id: int, sender_type: str) -> int:
         pass
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from .notification import Notification
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 class INotificationRepository(ABC):
@@ -9,10 +9,20 @@ class INotificationRepository(ABC):
                          content: str, created_at: datetime) -> Notification:
         pass
 
+    @abstractmethod
+    def add_many(self, items: List[dict]) -> List[Notification]:
+        """Insert several notifications (send_notification keyword dicts) in one transaction"""
+        pass
+
     @abstractmethod
     def get_by_id(self, notification_id: int) -> Optional[Notification]:
         pass
 
+    @abstractmethod
+    def get_by_ids(self, notification_ids: List[int]) -> List[Notification]:
+        """Fetch several rows with one IN query; ids without a row are skipped"""
+        pass
+
     @abstractmethod
     def get_by_account(self, account_id: int) -> List[Notification]:
         pass
@@ -45,6 +55,11 @@ class INotificationRepository(ABC):
     def count_unread(self, account_id: int) -> int:
         pass
 
+    @abstractmethod
+    def get_unread_counts_for_accounts(self, account_ids: List[int]) -> Dict[int, int]:
+        """Count unread notifications for several accounts with one grouped query; every id is present (0 if none)"""
+        pass
+
     @abstractmethod
     def count_by_type(self, account_id: int, notification_type: str) -> int:
         pass
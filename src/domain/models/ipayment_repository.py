@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from .payment import Payment
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime, date
 from decimal import Decimal
 
@@ -14,6 +14,11 @@ class IPaymentRepository(ABC):
     def get_by_id(self, payment_id: int) -> Optional[Payment]:
         pass
 
+    @abstractmethod
+    def get_by_ids(self, payment_ids: List[int]) -> List[Payment]:
+        """Fetch several rows with one IN query; ids without a row are skipped"""
+        pass
+
     @abstractmethod
     def get_by_subscription(self, subscription_id: int) -> List[Payment]:
         pass
@@ -30,6 +35,11 @@ class IPaymentRepository(ABC):
     def get_all(self) -> List[Payment]:
         pass
 
+    @abstractmethod
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Payment]:
+        """Stream all payments with a server-side cursor, batch_size rows per fetch; prefer over get_all for exports"""
+        pass
+
     @abstractmethod
     def mark_as_completed(self, payment_id: int) -> Optional[Payment]:
         pass
@@ -54,7 +64,17 @@ class IPaymentRepository(ABC):
     def get_revenue_by_date_range(self, start_date: date, end_date: date) -> Decimal:
         pass
 
+    @abstractmethod
+    def get_revenue_grouped(self, start_date: date, end_date: date, bucket: str) -> List[Tuple[date, Decimal]]:
+        """Completed revenue per day/month/year bucket in one grouped query, oldest first; empty buckets are absent"""
+        pass
+
     @abstractmethod
     def count_by_status(self, status: str) -> int:
         pass
 
+    @abstractmethod
+    def count_grouped_by_status(self) -> Dict[str, int]:
+        """Count payments per status with one GROUP BY query; statuses with no rows are absent"""
+        pass
+
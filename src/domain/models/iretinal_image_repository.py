@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from .retinal_image import RetinalImage
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
 from datetime import datetime
 
 class IRetinalImageRepository(ABC):
@@ -14,6 +14,11 @@ class IRetinalImageRepository(ABC):
     def get_by_id(self, image_id: int) -> Optional[RetinalImage]:
         pass
 
+    @abstractmethod
+    def get_by_ids(self, image_ids: List[int]) -> List[RetinalImage]:
+        """Fetch several rows with one IN query; ids without a row are skipped"""
+        pass
+
     @abstractmethod
     def get_by_patient(self, patient_id: int) -> List[RetinalImage]:
         pass
@@ -26,6 +31,11 @@ class IRetinalImageRepository(ABC):
     def get_all(self) -> List[RetinalImage]:
         pass
 
+    @abstractmethod
+    def iter_all(self, batch_size: int = 1000) -> Iterator[RetinalImage]:
+        """Stream all images with a server-side cursor, batch_size rows per fetch; prefer over get_all for exports"""
+        pass
+
     @abstractmethod
     def get_by_status(self, status: str) -> List[RetinalImage]:
         pass
@@ -46,6 +56,11 @@ class IRetinalImageRepository(ABC):
     def mark_as_error(self, image_id: int) -> Optional[RetinalImage]:
         pass
 
+    @abstractmethod
+    def mark_many_as(self, status: str, image_ids: List[int]) -> int:
+        """Set status on several images in one transaction; returns the number of rows updated"""
+        pass
+
     @abstractmethod
     def update(self, image_id: int, **kwargs) -> Optional[RetinalImage]:
         pass
@@ -58,3 +73,8 @@ class IRetinalImageRepository(ABC):
     def count_by_status(self, status: str) -> int:
         pass
 
+    @abstractmethod
+    def count_grouped_by_status(self) -> Dict[str, int]:
+        """Count images per status with one GROUP BY query; statuses with no rows are absent"""
+        pass
+
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from .subscription import Subscription
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import date
 
 class ISubscriptionRepository(ABC):
@@ -9,6 +9,16 @@ class ISubscriptionRepository(ABC):
             end_date: date, remaining_credits: int, status: str) -> Subscription:
         pass
 
+    @abstractmethod
+    def get_account_and_package(self, account_id: int, package_id: int) -> Tuple[bool, Optional[int]]:
+        """Return (account_exists, package duration_days); duration is None when the package is missing"""
+        pass
+
+    @abstractmethod
+    def get_account_active_credits(self, account_id: int) -> Tuple[bool, Optional[int]]:
+        """Return (account_exists, active subscription remaining_credits); credits are None without one"""
+        pass
+
     @abstractmethod
     def get_by_id(self, subscription_id: int) -> Optional[Subscription]:
         pass
@@ -33,8 +43,23 @@ class ISubscriptionRepository(ABC):
     def get_expiring_soon(self, days: int) -> List[Subscription]:
         pass
 
+    @abstractmethod
+    def get_by_status_summary(self, status: str) -> List[Tuple[int, int, int, int, str]]:
+        """Return (subscription_id, account_id, package_id, remaining_credits, end_date ISO string) by status"""
+        pass
+
+    @abstractmethod
+    def get_expiring_soon_summary(self, days: int) -> List[Tuple[int, int, str, int]]:
+        """Return (subscription_id, account_id, end_date ISO string, remaining_credits) for subscriptions expiring soon"""
+        pass
+
     @abstractmethod
     def deduct_credit(self, subscription_id: int, amount: int) -> Optional[Subscription]:
+        """Deduct credits if the subscription is active and has enough; None otherwise"""
+        pass
+
+    @abstractmethod
+    def add_credit(self, subscription_id: int, amount: int) -> Optional[Subscription]:
         pass
 
     @abstractmethod
@@ -58,3 +83,7 @@ class ISubscriptionRepository(ABC):
     def count_by_status(self, status: str) -> int:
         pass
 
+    @abstractmethod
+    def get_statistics(self, expiring_days: int) -> dict:
+        """Return total_subscriptions, active, expired, cancelled and expiring_soon counts"""
+        pass
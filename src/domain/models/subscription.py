@@ -1,6 +1,9 @@
 from datetime import date
 
 class Subscription:
+    __slots__ = ('subscription_id', 'account_id', 'package_id', 'start_date',
+                 'end_date', 'remaining_credits', 'status')
+
     def __init__(self, subscription_id: int, account_id: int, package_id: int, 
                  start_date: date, end_date: date, remaining_credits: int, status: str):
         self.subscription_id = subscription_id
@@ -7,6 +7,12 @@ from datetime import datetime, date
 from typing import Optional
 from domain.exceptions import ValidationException, BusinessRuleException
 
+# Allowed values, built once instead of per validation call
+VALID_GENDERS = ('male', 'female', 'other', 'prefer_not_to_say')
+VALID_IMAGE_TYPES = ('fundus', 'oct', 'fluorescein', 'angiography')
+VALID_EYE_SIDES = ('left', 'right', 'both')
+VALID_PAYMENT_METHODS = ('credit_card', 'debit_card', 'bank_transfer', 'paypal', 'other')
+
 
 class AccountValidator:
     """Validator for Account domain entity"""
@@ -59,9 +65,8 @@ class PatientValidator:
         if gender is None:
             return  # Optional field
         
-        valid_genders = ['male', 'female', 'other', 'prefer_not_to_say']
-        if gender.lower() not in valid_genders:
-            raise ValidationException(f"Gender must be one of: {', '.join(valid_genders)}")
+        if gender.lower() not in VALID_GENDERS:
+            raise ValidationException(f"Gender must be one of: {', '.join(VALID_GENDERS)}")
     
     @staticmethod
     def validate_patient_name(name: str) -> None:
@@ -82,16 +87,14 @@ class RetinalImageValidator:
     @staticmethod
     def validate_image_type(image_type: str) -> None:
         """Validate image type"""
-        valid_types = ['fundus', 'oct', 'fluorescein', 'angiography']
-        if image_type.lower() not in valid_types:
-            raise ValidationException(f"Image type must be one of: {', '.join(valid_types)}")
+        if image_type.lower() not in VALID_IMAGE_TYPES:
+            raise ValidationException(f"Image type must be one of: {', '.join(VALID_IMAGE_TYPES)}")
     
     @staticmethod
     def validate_eye_side(eye_side: str) -> None:
         """Validate eye side"""
-        valid_sides = ['left', 'right', 'both']
-        if eye_side.lower() not in valid_sides:
-            raise ValidationException(f"Eye side must be one of: {', '.join(valid_sides)}")
+        if eye_side.lower() not in VALID_EYE_SIDES:
+            raise ValidationException(f"Eye side must be one of: {', '.join(VALID_EYE_SIDES)}")
     
     @staticmethod
     def validate_image_url(image_url: str) -> None:
@@ -144,7 +147,6 @@ class PaymentValidator:
     @staticmethod
     def validate_payment_method(method: str) -> None:
         """Validate payment method"""
-        valid_methods = ['credit_card', 'debit_card', 'bank_transfer', 'paypal', 'other']
-        if method.lower() not in valid_methods:
-            raise ValidationException(f"Payment method must be one of: {', '.join(valid_methods)}")
+        if method.lower() not in VALID_PAYMENT_METHODS:
+            raise ValidationException(f"Payment method must be one of: {', '.join(VALID_PAYMENT_METHODS)}")
 
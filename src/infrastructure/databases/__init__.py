@@ -1,4 +1,4 @@
-from infrastructure.databases.mssql import init_mssql
+from infrastructure.databases.mssql import init_mssql, remove_session
 
 # Import AURA System models (Retinal Health Screening)
 from infrastructure.models.role_model import RoleModel
@@ -27,6 +27,7 @@ from infrastructure.models.billing.subscription_model import SubscriptionModel
 from infrastructure.models.billing.payment_model import PaymentModel
 
 def init_db(app):
+    app.teardown_appcontext(remove_session)
     init_mssql(app)
     
 # Migration Entities -> tables
@@ -0,0 +1,19 @@
+"""
+Batching helpers for IN (...) queries
+SQL Server accepts at most 2100 parameters per statement, so id lists are
+split into fixed-size chunks and queried one chunk at a time.
+"""
+
+from typing import Iterable, Iterator, List, TypeVar
+
+T = TypeVar('T')
+
+# Ids bound per IN clause, well under SQL Server's 2100-parameter limit
+IN_CLAUSE_CHUNK_SIZE = 1000
+
+
+def chunked(values: Iterable[T], size: int = IN_CLAUSE_CHUNK_SIZE) -> Iterator[List[T]]:
+    """Yield distinct values in lists of at most ``size``, preserving first-seen order"""
+    unique = list(dict.fromkeys(values))
+    for start in range(0, len(unique), size):
+        yield unique[start:start + size]
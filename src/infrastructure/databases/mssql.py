@@ -1,5 +1,5 @@
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, scoped_session
 from config import Config
 from infrastructure.databases.base import Base
 
@@ -7,9 +7,21 @@ from infrastructure.databases.base import Base
 DATABASE_URI = Config.DATABASE_URI
 print(f">>> Connecting to database: {DATABASE_URI}")
 
-engine = create_engine(DATABASE_URI, echo=True)  # echo=True để xem SQL queries
+engine = create_engine(
+    DATABASE_URI,
+    echo=True,  # echo=True để xem SQL queries
+    pool_size=Config.DB_POOL_SIZE,
+    max_overflow=Config.DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-session = SessionLocal()
+# Thread-local session registry: each request thread gets its own Session,
+# so concurrent requests no longer share one connection/transaction
+session = scoped_session(SessionLocal)
+
+def remove_session(exception=None):
+    """Release the current thread's session at the end of the app context"""
+    session.remove()
 
 def init_mssql(app):
     try:
@@ -0,0 +1,25 @@
+"""
+Streaming helper for large result sets
+Rows are fetched through a server-side cursor a batch at a time, so callers
+can iterate whole tables without materializing them in memory.
+"""
+
+from typing import Callable, Iterator, TypeVar
+from sqlalchemy.orm import Query, Session
+
+T = TypeVar('T')
+
+
+def stream_query(session: Session, build_query: Callable[[Session], Query],
+                 convert: Callable[[object], T], batch_size: int, error_message: str) -> Iterator[T]:
+    """Yield convert(model) for each row of build_query(...), fetching batch_size rows at a time"""
+    # Own session: the shared one is closed by every other repository call,
+    # which would cut the stream off mid-iteration
+    stream_session = Session(bind=session.get_bind())
+    try:
+        for model in build_query(stream_session).yield_per(batch_size):
+            yield convert(model)
+    except Exception as e:
+        raise ValueError(f'{error_message}: {str(e)}')
+    finally:
+        stream_session.close()
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Index
 from infrastructure.databases.base import Base
 
 class AiModelVersionModel(Base):
@@ -15,3 +15,6 @@ class AiModelVersionModel(Base):
     def __repr__(self):
         return f"<AiModelVersionModel(ai_model_version_id={self.ai_model_version_id}, model_name='{self.model_name}', version='{self.version}')>"
 
+
+# Active model lookup (get_active_model) without scanning every version
+Index('IX_ai_model_versions_active', AiModelVersionModel.active_flag)
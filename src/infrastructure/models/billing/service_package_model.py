@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DECIMAL
+from sqlalchemy import Column, Integer, String, DECIMAL, Index
 from infrastructure.databases.base import Base
 
 class ServicePackageModel(Base):
@@ -14,3 +14,6 @@ class ServicePackageModel(Base):
     def __repr__(self):
         return f"<ServicePackageModel(package_id={self.package_id}, name='{self.name}', price={self.price})>"
 
+
+# Package lookup by name (get_by_name)
+Index('IX_service_packages_name', ServicePackageModel.name)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, BigInteger, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, ForeignKey, Index
 from infrastructure.databases.base import Base
 
 class MessageModel(Base):
@@ -16,3 +16,10 @@ class MessageModel(Base):
     def __repr__(self):
         return f"<MessageModel(message_id={self.message_id}, sender_name='{self.sender_name}', sender_type='{self.sender_type}')>"
 
+
+# Newest-first per conversation: serves "last message" (TOP 1) directly and the
+# ascending history queries via a backward scan
+Index('IX_messages_conversation_sent', MessageModel.conversation_id, MessageModel.sent_at.desc())
+
+# Sender filter/count within a conversation (get_by_sender, count_by_sender)
+Index('IX_messages_conversation_sender', MessageModel.conversation_id, MessageModel.sender_type)
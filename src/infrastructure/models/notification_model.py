@@ -1,4 +1,4 @@
-from sqlalchemy import Column, BigInteger, String, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, BigInteger, String, DateTime, Boolean, ForeignKey, Index
 from infrastructure.databases.base import Base
 
 class NotificationModel(Base):
@@ -15,3 +15,6 @@ class NotificationModel(Base):
     def __repr__(self):
         return f"<NotificationModel(notification_id={self.notification_id}, account_id={self.account_id}, type='{self.type}')>"
 
+
+# Unread lookups per account (count_unread, get_unread_counts_for_accounts)
+Index('IX_notifications_account_read', NotificationModel.account_id, NotificationModel.is_read)
@@ -1,8 +1,11 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from datetime import datetime
 from infrastructure.databases.mssql import session
 from infrastructure.models.account_model import AccountModel
+from infrastructure.models.role_model import RoleModel
+from infrastructure.models.clinic_model import ClinicModel
 from domain.models.account import Account
 from domain.models.iaccount_repository import IAccountRepository
 
@@ -205,4 +208,19 @@ class AccountRepository(IAccountRepository):
         except Exception as e:
             raise ValueError(f'Error getting accounts by clinic: {str(e)}')
         finally:
-            self.session.close()
\ No newline at end of file
+            self.session.close()
+    
+    def check_references_exist(self, role_id: int, clinic_id: Optional[int]) -> Tuple[bool, bool]:
+        """Check that role (and clinic, if given) exist in a single round trip"""
+        try:
+            columns = [select(RoleModel.role_id).where(RoleModel.role_id == role_id).scalar_subquery()]
+            if clinic_id:
+                columns.append(select(ClinicModel.clinic_id).where(ClinicModel.clinic_id == clinic_id).scalar_subquery())
+            row = self.session.execute(select(*columns)).one()
+            role_exists = row[0] is not None
+            clinic_exists = not clinic_id or row[1] is not None
+            return role_exists, clinic_exists
+        except Exception as e:
+            raise ValueError(f'Error checking account references: {str(e)}')
+        finally:
+            self.session.close()
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 from sqlalchemy.orm import Session
 from sqlalchemy import func
@@ -148,6 +148,19 @@ class AiAnalysisRepository(IAiAnalysisRepository):
         finally:
             self.session.close()
     
+    def count_grouped_by_status(self) -> Dict[str, int]:
+        try:
+            rows = (
+                self.session.query(AiAnalysisModel.status, func.count())
+                .group_by(AiAnalysisModel.status)
+                .all()
+            )
+            return dict(rows)
+        except Exception as e:
+            raise ValueError(f'Error counting analyses by status: {str(e)}')
+        finally:
+            self.session.close()
+    
     def get_average_processing_time(self) -> float:
         try:
             avg_time = self.session.query(func.avg(AiAnalysisModel.processing_time)).filter(
@@ -1,5 +1,6 @@
 from typing import List, Optional
 from datetime import datetime
+from sqlalchemy import update, case
 from sqlalchemy.orm import Session
 from infrastructure.databases.mssql import session
 from infrastructure.models.ai.ai_model_version_model import AiModelVersionModel
@@ -73,13 +74,19 @@ class AiModelVersionRepository(IAiModelVersionRepository):
     
     def set_active(self, ai_model_version_id: int) -> Optional[AiModelVersion]:
         try:
-            # Deactivate all models
-            self.session.query(AiModelVersionModel).update({AiModelVersionModel.active_flag: False})
-            # Activate target model
             model_ver = self.session.query(AiModelVersionModel).filter_by(ai_model_version_id=ai_model_version_id).first()
             if not model_ver:
                 return None
-            model_ver.active_flag = True
+            # Activate target model and deactivate all others in a single UPDATE
+            self.session.execute(
+                update(AiModelVersionModel).values(
+                    active_flag=case(
+                        (AiModelVersionModel.ai_model_version_id == ai_model_version_id, True),
+                        else_=False
+                    )
+                ),
+                execution_options={'synchronize_session': False}
+            )
             self.session.commit()
             self.session.refresh(model_ver)
             return self._to_domain(model_ver)
@@ -1,7 +1,9 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from infrastructure.databases.mssql import session
+from infrastructure.databases.batching import chunked
 from infrastructure.models.messaging.conversation_model import ConversationModel
 from domain.models.conversation import Conversation
 from domain.models.iconversation_repository import IConversationRepository
@@ -175,6 +177,22 @@ class ConversationRepository(IConversationRepository):
         finally:
             self.session.close()
     
+    def count_by_patients(self, patient_ids: List[int]) -> Dict[int, int]:
+        try:
+            counts = dict.fromkeys(patient_ids, 0)
+            for chunk in chunked(patient_ids):
+                counts.update(
+                    self.session.query(ConversationModel.patient_id, func.count())
+                    .filter(ConversationModel.patient_id.in_(chunk))
+                    .group_by(ConversationModel.patient_id)
+                    .all()
+                )
+            return counts
+        except Exception as e:
+            raise ValueError(f'Error counting conversations by patients: {str(e)}')
+        finally:
+            self.session.close()
+    
     def count_by_doctor(self, doctor_id: int) -> int:
         try:
             return self.session.query(ConversationModel).filter_by(doctor_id=doctor_id).count()
@@ -183,6 +201,22 @@ class ConversationRepository(IConversationRepository):
         finally:
             self.session.close()
     
+    def count_by_doctors(self, doctor_ids: List[int]) -> Dict[int, int]:
+        try:
+            counts = dict.fromkeys(doctor_ids, 0)
+            for chunk in chunked(doctor_ids):
+                counts.update(
+                    self.session.query(ConversationModel.doctor_id, func.count())
+                    .filter(ConversationModel.doctor_id.in_(chunk))
+                    .group_by(ConversationModel.doctor_id)
+                    .all()
+                )
+            return counts
+        except Exception as e:
+            raise ValueError(f'Error counting conversations by doctors: {str(e)}')
+        finally:
+            self.session.close()
+    
     def count_active(self) -> int:
         try:
             return self.session.query(ConversationModel).filter_by(status='active').count()
@@ -1,5 +1,6 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from infrastructure.databases.mssql import session
 from infrastructure.models.medical.doctor_review_model import DoctorReviewModel
@@ -161,3 +162,16 @@ class DoctorReviewRepository(IDoctorReviewRepository):
             raise ValueError(f'Error counting reviews by status: {str(e)}')
         finally:
             self.session.close()
+    
+    def count_grouped_by_status(self) -> Dict[str, int]:
+        try:
+            rows = (
+                self.session.query(DoctorReviewModel.validation_status, func.count())
+                .group_by(DoctorReviewModel.validation_status)
+                .all()
+            )
+            return dict(rows)
+        except Exception as e:
+            raise ValueError(f'Error counting reviews by status: {str(e)}')
+        finally:
+            self.session.close()
@@ -1,7 +1,10 @@
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
 from datetime import datetime, date
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, aliased
 from infrastructure.databases.mssql import session
+from infrastructure.databases.batching import chunked
+from infrastructure.databases.streaming import stream_query
 from infrastructure.models.medical.medical_report_model import MedicalReportModel
 from domain.models.medical_report import MedicalReport
 from domain.models.imedical_report_repository import IMedicalReportRepository
@@ -42,6 +45,17 @@ class MedicalReportRepository(IMedicalReportRepository):
         finally:
             self.session.close()
     
+    def get_by_ids(self, report_ids: List[int]) -> List[MedicalReport]:
+        try:
+            report_models = []
+            for chunk in chunked(report_ids):
+                report_models += self.session.query(MedicalReportModel).filter(MedicalReportModel.report_id.in_(chunk)).all()
+            return [self._to_domain(model) for model in report_models]
+        except Exception as e:
+            raise ValueError(f'Error getting medical reports: {str(e)}')
+        finally:
+            self.session.close()
+    
     def get_by_analysis_id(self, analysis_id: int) -> Optional[MedicalReport]:
         try:
             report_model = self.session.query(MedicalReportModel).filter_by(analysis_id=analysis_id).first()
@@ -51,6 +65,18 @@ class MedicalReportRepository(IMedicalReportRepository):
         finally:
             self.session.close()
     
+    def get_by_analysis_ids(self, analysis_ids: List[int]) -> Dict[int, MedicalReport]:
+        try:
+            reports = {}
+            for chunk in chunked(analysis_ids):
+                report_models = self.session.query(MedicalReportModel).filter(MedicalReportModel.analysis_id.in_(chunk)).all()
+                reports.update((model.analysis_id, self._to_domain(model)) for model in report_models)
+            return reports
+        except Exception as e:
+            raise ValueError(f'Error getting reports by analyses: {str(e)}')
+        finally:
+            self.session.close()
+    
     def get_by_patient(self, patient_id: int) -> List[MedicalReport]:
         try:
             report_models = self.session.query(MedicalReportModel).filter_by(patient_id=patient_id).all()
@@ -71,6 +97,30 @@ class MedicalReportRepository(IMedicalReportRepository):
         finally:
             self.session.close()
     
+    def get_recent_by_patients(self, patient_ids: List[int], limit_per_patient: int) -> Dict[int, List[MedicalReport]]:
+        try:
+            recent_reports = {patient_id: [] for patient_id in patient_ids}
+            for chunk in chunked(patient_ids):
+                # Rank reports per patient newest first and keep the top ones (one query per chunk)
+                ranked = select(
+                    MedicalReportModel,
+                    func.row_number().over(
+                        partition_by=MedicalReportModel.patient_id,
+                        order_by=(MedicalReportModel.created_at.desc(), MedicalReportModel.report_id.desc())
+                    ).label('rn')
+                ).where(MedicalReportModel.patient_id.in_(chunk)).subquery()
+                recent = aliased(MedicalReportModel, ranked)
+                report_models = self.session.query(recent).filter(
+                    ranked.c.rn <= limit_per_patient
+                ).order_by(ranked.c.patient_id, ranked.c.rn).all()
+                for model in report_models:
+                    recent_reports[model.patient_id].append(self._to_domain(model))
+            return recent_reports
+        except Exception as e:
+            raise ValueError(f'Error getting recent reports: {str(e)}')
+        finally:
+            self.session.close()
+    
     def get_by_doctor(self, doctor_id: int) -> List[MedicalReport]:
         try:
             report_models = self.session.query(MedicalReportModel).filter_by(doctor_id=doctor_id).all()
@@ -101,6 +151,22 @@ class MedicalReportRepository(IMedicalReportRepository):
         finally:
             self.session.close()
     
+    def iter_all(self, batch_size: int = 1000) -> Iterator[MedicalReport]:
+        return stream_query(
+            self.session, lambda stream_session: stream_session.query(MedicalReportModel),
+            self._to_domain, batch_size, 'Error streaming all reports'
+        )
+    
+    def iter_by_date_range(self, start_date: date, end_date: date, batch_size: int = 1000) -> Iterator[MedicalReport]:
+        return stream_query(
+            self.session,
+            lambda stream_session: stream_session.query(MedicalReportModel).filter(
+                MedicalReportModel.created_at >= start_date,
+                MedicalReportModel.created_at <= end_date
+            ),
+            self._to_domain, batch_size, 'Error streaming reports by date range'
+        )
+    
     def update_report_url(self, report_id: int, report_url: str) -> Optional[MedicalReport]:
         try:
             report_model = self.session.query(MedicalReportModel).filter_by(report_id=report_id).first()
@@ -138,6 +204,22 @@ class MedicalReportRepository(IMedicalReportRepository):
         finally:
             self.session.close()
     
+    def count_by_patients(self, patient_ids: List[int]) -> Dict[int, int]:
+        try:
+            counts = dict.fromkeys(patient_ids, 0)
+            for chunk in chunked(patient_ids):
+                counts.update(
+                    self.session.query(MedicalReportModel.patient_id, func.count())
+                    .filter(MedicalReportModel.patient_id.in_(chunk))
+                    .group_by(MedicalReportModel.patient_id)
+                    .all()
+                )
+            return counts
+        except Exception as e:
+            raise ValueError(f'Error counting reports by patients: {str(e)}')
+        finally:
+            self.session.close()
+    
     def count_by_doctor(self, doctor_id: int) -> int:
         try:
             return self.session.query(MedicalReportModel).filter_by(doctor_id=doctor_id).count()
@@ -145,3 +227,19 @@ class MedicalReportRepository(IMedicalReportRepository):
             raise ValueError(f'Error counting reports by doctor: {str(e)}')
         finally:
             self.session.close()
+    
+    def count_by_doctors(self, doctor_ids: List[int]) -> Dict[int, int]:
+        try:
+            counts = dict.fromkeys(doctor_ids, 0)
+            for chunk in chunked(doctor_ids):
+                counts.update(
+                    self.session.query(MedicalReportModel.doctor_id, func.count())
+                    .filter(MedicalReportModel.doctor_id.in_(chunk))
+                    .group_by(MedicalReportModel.doctor_id)
+                    .all()
+                )
+            return counts
+        except Exception as e:
+            raise ValueError(f'Error counting reports by doctors: {str(e)}')
+        finally:
+            self.session.close()
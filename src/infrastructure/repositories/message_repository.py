@@ -1,7 +1,10 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy import func, text, select, insert
+from sqlalchemy.orm import Session, aliased
+from config import Config
 from infrastructure.databases.mssql import session
+from infrastructure.databases.batching import chunked
 from infrastructure.models.messaging.message_model import MessageModel
 from domain.models.message import Message
 from domain.models.imessage_repository import IMessageRepository
@@ -35,6 +38,23 @@ class MessageRepository(IMessageRepository):
         finally:
             self.session.close()
     
+    def add_many(self, items: List[dict]) -> List[Message]:
+        try:
+            msg_models = []
+            batch_size = Config.BULK_INSERT_BATCH_SIZE
+            for start in range(0, len(items), batch_size):
+                msg_models += self.session.scalars(
+                    insert(MessageModel).returning(MessageModel, sort_by_parameter_order=True),
+                    items[start:start + batch_size]
+                ).all()
+            self.session.commit()
+            return [self._to_domain(model) for model in msg_models]
+        except Exception as e:
+            self.session.rollback()
+            raise ValueError(f'Error creating messages: {str(e)}')
+        finally:
+            self.session.close()
+    
     def get_by_id(self, message_id: int) -> Optional[Message]:
         try:
             msg_model = self.session.query(MessageModel).filter_by(message_id=message_id).first()
@@ -44,6 +64,17 @@ class MessageRepository(IMessageRepository):
         finally:
             self.session.close()
     
+    def get_by_ids(self, message_ids: List[int]) -> List[Message]:
+        try:
+            msg_models = []
+            for chunk in chunked(message_ids):
+                msg_models += self.session.query(MessageModel).filter(MessageModel.message_id.in_(chunk)).all()
+            return [self._to_domain(model) for model in msg_models]
+        except Exception as e:
+            raise ValueError(f'Error getting messages: {str(e)}')
+        finally:
+            self.session.close()
+    
     def get_by_conversation(self, conversation_id: int) -> List[Message]:
         try:
             msg_models = self.session.query(MessageModel).filter_by(
@@ -55,17 +86,50 @@ class MessageRepository(IMessageRepository):
         finally:
             self.session.close()
     
+    def get_recent_by_conversation(self, conversation_id: int, limit: int) -> List[Message]:
+        try:
+            msg_models = self.session.query(MessageModel).filter_by(
+                conversation_id=conversation_id
+            ).order_by(MessageModel.sent_at.desc()).limit(limit).all()
+            # Newest rows come back first; return them in chronological order
+            return [self._to_domain(model) for model in reversed(msg_models)]
+        except Exception as e:
+            raise ValueError(f'Error getting recent messages: {str(e)}')
+        finally:
+            self.session.close()
+    
     def get_last_message(self, conversation_id: int) -> Optional[Message]:
         try:
             msg_model = self.session.query(MessageModel).filter_by(
                 conversation_id=conversation_id
-            ).order_by(MessageModel.sent_at.desc()).first()
+            ).order_by(MessageModel.sent_at.desc(), MessageModel.message_id.desc()).first()
             return self._to_domain(msg_model) if msg_model else None
         except Exception as e:
             raise ValueError(f'Error getting last message: {str(e)}')
         finally:
             self.session.close()
     
+    def get_last_messages(self, conversation_ids: List[int]) -> Dict[int, Message]:
+        try:
+            last_messages = {}
+            for chunk in chunked(conversation_ids):
+                # Rank messages per conversation newest first and keep rank 1 (one query per chunk)
+                ranked = select(
+                    MessageModel,
+                    func.row_number().over(
+                        partition_by=MessageModel.conversation_id,
+                        order_by=(MessageModel.sent_at.desc(), MessageModel.message_id.desc())
+                    ).label('rn')
+                ).where(MessageModel.conversation_id.in_(chunk)).subquery()
+                latest = aliased(MessageModel, ranked)
+                msg_models = self.session.query(latest).filter(ranked.c.rn == 1).all()
+                last_messages.update((model.conversation_id, self._to_domain(model)) for model in msg_models)
+            return last_messages
+        except Exception as e:
+            raise ValueError(f'Error getting last messages: {str(e)}')
+        finally:
+            self.session.close()
+    
     def get_by_sender(self, conversation_id: int, sender_type: str) -> List[Message]:
         try:
             msg_models = self.session.query(MessageModel).filter_by(
@@ -79,9 +143,17 @@ class MessageRepository(IMessageRepository):
     
     def search_messages(self, conversation_id: int, search_term: str) -> List[Message]:
         try:
+            if Config.MESSAGE_FULLTEXT_SEARCH:
+                # Full-text index seek; prefix term so "hel" still matches "hello"
+                escaped = search_term.replace('"', '""')
+                content_filter = text('CONTAINS(messages.content, :search_term)').bindparams(
+                    search_term=f'"{escaped}*"'
+                )
+            else:
+                content_filter = MessageModel.content.like(f'%{search_term}%')
             msg_models = self.session.query(MessageModel).filter(
                 MessageModel.conversation_id == conversation_id,
-                MessageModel.content.like(f'%{search_term}%')
+                content_filter
             ).all()
             return [self._to_domain(model) for model in msg_models]
         except Exception as e:
@@ -120,11 +192,14 @@ class MessageRepository(IMessageRepository):
         finally:
             self.session.close()
     
-    def delete_all_by_conversation(self, conversation_id: int) -> bool:
+    def delete_all_by_conversation(self, conversation_id: int) -> int:
         try:
-            self.session.query(MessageModel).filter_by(conversation_id=conversation_id).delete()
+            # Single DELETE ... WHERE; nothing is loaded into the session
+            deleted = self.session.query(MessageModel).filter_by(
+                conversation_id=conversation_id
+            ).delete(synchronize_session=False)
             self.session.commit()
-            return True
+            return deleted
         except Exception as e:
             self.session.rollback()
             raise ValueError(f'Error deleting all messages: {str(e)}')
@@ -133,17 +208,35 @@ class MessageRepository(IMessageRepository):
     
     def count_by_conversation(self, conversation_id: int) -> int:
         try:
-            return self.session.query(MessageModel).filter_by(conversation_id=conversation_id).count()
+            return self.session.query(func.count(MessageModel.message_id)).filter_by(
+                conversation_id=conversation_id
+            ).scalar()
         except Exception as e:
             raise ValueError(f'Error counting messages: {str(e)}')
         finally:
             self.session.close()
     
+    def count_by_conversations(self, conversation_ids: List[int]) -> Dict[int, int]:
+        try:
+            counts = dict.fromkeys(conversation_ids, 0)
+            for chunk in chunked(conversation_ids):
+                counts.update(
+                    self.session.query(MessageModel.conversation_id, func.count())
+                    .filter(MessageModel.conversation_id.in_(chunk))
+                    .group_by(MessageModel.conversation_id)
+                    .all()
+                )
+            return counts
+        except Exception as e:
+            raise ValueError(f'Error counting messages by conversations: {str(e)}')
+        finally:
+            self.session.close()
+    
     def count_by_sender(self, conversation_id: int, sender_type: str) -> int:
         try:
-            return self.session.query(MessageModel).filter_by(
+            return self.session.query(func.count(MessageModel.message_id)).filter_by(
                 conversation_id=conversation_id, sender_type=sender_type
-            ).count()
+            ).scalar()
         except Exception as e:
             raise ValueError(f'Error counting messages by sender: {str(e)}')
         finally:
@@ -1,7 +1,10 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
+from sqlalchemy import func, insert
 from sqlalchemy.orm import Session
+from config import Config
 from infrastructure.databases.mssql import session
+from infrastructure.databases.batching import chunked
 from infrastructure.models.notification_model import NotificationModel
 from domain.models.notification import Notification
 from domain.models.inotification_repository import INotificationRepository
@@ -41,6 +44,30 @@ class NotificationRepository(INotificationRepository):
         finally:
             self.session.close()
     
+    def add_many(self, items: List[dict]) -> List[Notification]:
+        try:
+            rows = [{
+                'account_id': item['account_id'],
+                'type': item['notification_type'],
+                'content': item['content'],
+                'is_read': False,
+                'created_at': item['created_at']
+            } for item in items]
+            notif_models = []
+            batch_size = Config.BULK_INSERT_BATCH_SIZE
+            for start in range(0, len(rows), batch_size):
+                notif_models += self.session.scalars(
+                    insert(NotificationModel).returning(NotificationModel, sort_by_parameter_order=True),
+                    rows[start:start + batch_size]
+                ).all()
+            self.session.commit()
+            return [self._to_domain(model) for model in notif_models]
+        except Exception as e:
+            self.session.rollback()
+            raise ValueError(f'Error creating notifications: {str(e)}')
+        finally:
+            self.session.close()
+    
     def get_by_id(self, notification_id: int) -> Optional[Notification]:
         try:
             notif_model = self.session.query(NotificationModel).filter_by(notification_id=notification_id).first()
@@ -50,6 +77,17 @@ class NotificationRepository(INotificationRepository):
         finally:
             self.session.close()
     
+    def get_by_ids(self, notification_ids: List[int]) -> List[Notification]:
+        try:
+            notif_models = []
+            for chunk in chunked(notification_ids):
+                notif_models += self.session.query(NotificationModel).filter(NotificationModel.notification_id.in_(chunk)).all()
+            return [self._to_domain(model) for model in notif_models]
+        except Exception as e:
+            raise ValueError(f'Error getting notifications: {str(e)}')
+        finally:
+            self.session.close()
+    
     def get_by_account(self, account_id: int) -> List[Notification]:
         try:
             notif_models = self.session.query(NotificationModel).filter_by(
@@ -144,6 +182,23 @@ class NotificationRepository(INotificationRepository):
         finally:
             self.session.close()
     
+    def get_unread_counts_for_accounts(self, account_ids: List[int]) -> Dict[int, int]:
+        try:
+            counts = dict.fromkeys(account_ids, 0)
+            for chunk in chunked(account_ids):
+                counts.update(
+                    self.session.query(NotificationModel.account_id, func.count())
+                    .filter(NotificationModel.account_id.in_(chunk))
+                    .filter_by(is_read=False)
+                    .group_by(NotificationModel.account_id)
+                    .all()
+                )
+            return counts
+        except Exception as e:
+            raise ValueError(f'Error counting unread notifications: {str(e)}')
+        finally:
+            self.session.close()
+    
     def count_by_type(self, account_id: int, notification_type: str) -> int:
         try:
             return self.session.query(NotificationModel).filter_by(account_id=account_id, type=notification_type).count()
@@ -1,9 +1,11 @@
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime, date
 from decimal import Decimal
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import DATE, cast, func, literal_column
 from infrastructure.databases.mssql import session
+from infrastructure.databases.batching import chunked
+from infrastructure.databases.streaming import stream_query
 from infrastructure.models.billing.payment_model import PaymentModel
 from domain.models.payment import Payment
 from domain.models.ipayment_repository import IPaymentRepository
@@ -46,6 +48,17 @@ class PaymentRepository(IPaymentRepository):
         finally:
             self.session.close()
     
+    def get_by_ids(self, payment_ids: List[int]) -> List[Payment]:
+        try:
+            payment_models = []
+            for chunk in chunked(payment_ids):
+                payment_models += self.session.query(PaymentModel).filter(PaymentModel.payment_id.in_(chunk)).all()
+            return [self._to_domain(model) for model in payment_models]
+        except Exception as e:
+            raise ValueError(f'Error getting payments: {str(e)}')
+        finally:
+            self.session.close()
+    
     def get_by_subscription(self, subscription_id: int) -> List[Payment]:
         try:
             payment_models = self.session.query(PaymentModel).filter_by(subscription_id=subscription_id).all()
@@ -76,6 +89,12 @@ class PaymentRepository(IPaymentRepository):
         finally:
             self.session.close()
     
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Payment]:
+        return stream_query(
+            self.session, lambda stream_session: stream_session.query(PaymentModel),
+            self._to_domain, batch_size, 'Error streaming all payments'
+        )
+    
     def mark_as_completed(self, payment_id: int) -> Optional[Payment]:
         try:
             payment_model = self.session.query(PaymentModel).filter_by(payment_id=payment_id).first()
@@ -159,6 +178,34 @@ class PaymentRepository(IPaymentRepository):
         finally:
             self.session.close()
     
+    def _revenue_bucket(self, bucket: str):
+        """SQL expression truncating payment_time to the first date of its bucket"""
+        # Constants are inlined: SQL Server only matches the SELECT expression
+        # against GROUP BY when neither contains bound parameters
+        payment_time = PaymentModel.payment_time
+        first = literal_column('1')
+        if bucket == 'day':
+            return cast(payment_time, DATE)
+        if bucket == 'month':
+            return func.datefromparts(func.year(payment_time), func.month(payment_time), first)
+        if bucket == 'year':
+            return func.datefromparts(func.year(payment_time), first, first)
+        raise ValueError(f'Unknown revenue bucket: {bucket}')
+    
+    def get_revenue_grouped(self, start_date: date, end_date: date, bucket: str) -> List[Tuple[date, Decimal]]:
+        try:
+            bucket_start = self._revenue_bucket(bucket)
+            rows = self.session.query(bucket_start, func.sum(PaymentModel.amount)).filter(
+                PaymentModel.payment_time >= start_date,
+                PaymentModel.payment_time <= end_date,
+                PaymentModel.status == 'completed'
+            ).group_by(bucket_start).order_by(bucket_start).all()
+            return [(bucket_date, Decimal(total)) for bucket_date, total in rows]
+        except Exception as e:
+            raise ValueError(f'Error getting grouped revenue: {str(e)}')
+        finally:
+            self.session.close()
+    
     def count_by_status(self, status: str) -> int:
         try:
             return self.session.query(PaymentModel).filter_by(status=status).count()
@@ -166,3 +213,16 @@ class PaymentRepository(IPaymentRepository):
             raise ValueError(f'Error counting payments by status: {str(e)}')
         finally:
             self.session.close()
+    
+    def count_grouped_by_status(self) -> Dict[str, int]:
+        try:
+            rows = (
+                self.session.query(PaymentModel.status, func.count())
+                .group_by(PaymentModel.status)
+                .all()
+            )
+            return dict(rows)
+        except Exception as e:
+            raise ValueError(f'Error counting payments by status: {str(e)}')
+        finally:
+            self.session.close()
@@ -1,8 +1,10 @@
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
 from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, func
 from infrastructure.databases.mssql import session
+from infrastructure.databases.batching import chunked
+from infrastructure.databases.streaming import stream_query
 from infrastructure.models.imaging.retinal_image_model import RetinalImageModel
 from infrastructure.models.ai.ai_analysis_model import AiAnalysisModel
 from domain.models.retinal_image import RetinalImage
@@ -47,6 +49,17 @@ class RetinalImageRepository(IRetinalImageRepository):
         finally:
             self.session.close()
     
+    def get_by_ids(self, image_ids: List[int]) -> List[RetinalImage]:
+        try:
+            image_models = []
+            for chunk in chunked(image_ids):
+                image_models += self.session.query(RetinalImageModel).filter(RetinalImageModel.image_id.in_(chunk)).all()
+            return [self._to_domain(model) for model in image_models]
+        except Exception as e:
+            raise ValueError(f'Error getting retinal images: {str(e)}')
+        finally:
+            self.session.close()
+    
     def get_by_patient(self, patient_id: int) -> List[RetinalImage]:
         try:
             image_models = self.session.query(RetinalImageModel).filter_by(patient_id=patient_id).all()
@@ -74,6 +87,12 @@ class RetinalImageRepository(IRetinalImageRepository):
         finally:
             self.session.close()
     
+    def iter_all(self, batch_size: int = 1000) -> Iterator[RetinalImage]:
+        return stream_query(
+            self.session, lambda stream_session: stream_session.query(RetinalImageModel),
+            self._to_domain, batch_size, 'Error streaming all images'
+        )
+    
     def get_by_status(self, status: str) -> List[RetinalImage]:
         try:
             image_models = self.session.query(RetinalImageModel).filter_by(status=status).all()
@@ -146,6 +165,21 @@ class RetinalImageRepository(IRetinalImageRepository):
         finally:
             self.session.close()
     
+    def mark_many_as(self, status: str, image_ids: List[int]) -> int:
+        try:
+            updated = 0
+            for chunk in chunked(image_ids):
+                updated += self.session.query(RetinalImageModel).filter(
+                    RetinalImageModel.image_id.in_(chunk)
+                ).update({'status': status}, synchronize_session=False)
+            self.session.commit()
+            return updated
+        except Exception as e:
+            self.session.rollback()
+            raise ValueError(f'Error updating image statuses: {str(e)}')
+        finally:
+            self.session.close()
+    
     def update(self, image_id: int, **kwargs) -> Optional[RetinalImage]:
         try:
             image_model = self.session.query(RetinalImageModel).filter_by(image_id=image_id).first()
@@ -184,3 +218,16 @@ class RetinalImageRepository(IRetinalImageRepository):
             raise ValueError(f'Error counting images by status: {str(e)}')
         finally:
             self.session.close()
+    
+    def count_grouped_by_status(self) -> Dict[str, int]:
+        try:
+            rows = (
+                self.session.query(RetinalImageModel.status, func.count())
+                .group_by(RetinalImageModel.status)
+                .all()
+            )
+            return dict(rows)
+        except Exception as e:
+            raise ValueError(f'Error counting images by status: {str(e)}')
+        finally:
+            self.session.close()
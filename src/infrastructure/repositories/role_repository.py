@@ -1,4 +1,5 @@
 from typing import List, Optional
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from infrastructure.databases.mssql import session
 from infrastructure.models.role_model import RoleModel
@@ -97,7 +98,7 @@ class RoleRepository(IRoleRepository):
     def count(self) -> int:
         """Count total roles"""
         try:
-            return self.session.query(RoleModel).count()
+            return self.session.query(func.count(RoleModel.role_id)).scalar()
         except Exception as e:
             raise ValueError(f'Error counting roles: {str(e)}')
         finally:
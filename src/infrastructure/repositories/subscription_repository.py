@@ -1,11 +1,21 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import date, timedelta
+from sqlalchemy import select, update, func, case, cast, String
 from sqlalchemy.orm import Session
 from infrastructure.databases.mssql import session
 from infrastructure.models.billing.subscription_model import SubscriptionModel
+from infrastructure.models.billing.service_package_model import ServicePackageModel
+from infrastructure.models.account_model import AccountModel
 from domain.models.subscription import Subscription
 from domain.models.isubscription_repository import ISubscriptionRepository
 
+# Read-only lookups select from the table directly: plain rows, no identity map
+_subscriptions = SubscriptionModel.__table__
+
+# end_date rendered as 'YYYY-MM-DD' by the database for list summaries
+# (CAST of a DATE to VARCHAR is ISO 8601 on SQL Server)
+_end_date_iso = cast(SubscriptionModel.end_date, String(10)).label('end_date')
+
 
 class SubscriptionRepository(ISubscriptionRepository):
     def __init__(self, db_session: Session = session):
@@ -35,10 +45,43 @@ class SubscriptionRepository(ISubscriptionRepository):
         finally:
             self.session.close()
     
+    def get_account_and_package(self, account_id: int, package_id: int) -> Tuple[bool, Optional[int]]:
+        """Check the account and fetch the package duration in a single round trip"""
+        try:
+            row = self.session.execute(select(
+                select(AccountModel.account_id).where(AccountModel.account_id == account_id).scalar_subquery(),
+                select(ServicePackageModel.duration_days).where(ServicePackageModel.package_id == package_id).scalar_subquery()
+            )).one()
+            return row[0] is not None, row[1]
+        except Exception as e:
+            raise ValueError(f'Error checking subscription references: {str(e)}')
+        finally:
+            self.session.close()
+    
+    def get_account_active_credits(self, account_id: int) -> Tuple[bool, Optional[int]]:
+        """Check the account and fetch its active subscription's credits in a single round trip"""
+        try:
+            row = self.session.execute(
+                select(AccountModel.account_id, SubscriptionModel.remaining_credits)
+                .outerjoin(SubscriptionModel, (SubscriptionModel.account_id == AccountModel.account_id)
+                           & (SubscriptionModel.status == 'active'))
+                .where(AccountModel.account_id == account_id)
+                .limit(1)
+            ).first()
+            if row is None:
+                return False, None
+            return True, row.remaining_credits
+        except Exception as e:
+            raise ValueError(f'Error getting account credits: {str(e)}')
+        finally:
+            self.session.close()
+    
     def get_by_id(self, subscription_id: int) -> Optional[Subscription]:
         try:
-            sub_model = self.session.query(SubscriptionModel).filter_by(subscription_id=subscription_id).first()
-            return self._to_domain(sub_model) if sub_model else None
+            row = self.session.execute(
+                select(_subscriptions).where(_subscriptions.c.subscription_id == subscription_id)
+            ).first()
+            return self._to_domain(row) if row else None
         except Exception as e:
             raise ValueError(f'Error getting subscription: {str(e)}')
         finally:
@@ -46,8 +89,10 @@ class SubscriptionRepository(ISubscriptionRepository):
     
     def get_by_account(self, account_id: int) -> List[Subscription]:
         try:
-            sub_models = self.session.query(SubscriptionModel).filter_by(account_id=account_id).all()
-            return [self._to_domain(model) for model in sub_models]
+            rows = self.session.execute(
+                select(_subscriptions).where(_subscriptions.c.account_id == account_id)
+            ).all()
+            return [self._to_domain(row) for row in rows]
         except Exception as e:
             raise ValueError(f'Error getting subscriptions by account: {str(e)}')
         finally:
@@ -55,10 +100,11 @@ class SubscriptionRepository(ISubscriptionRepository):
     
     def get_active_by_account(self, account_id: int) -> Optional[Subscription]:
         try:
-            sub_model = self.session.query(SubscriptionModel).filter_by(
-                account_id=account_id, status='active'
+            row = self.session.execute(
+                select(_subscriptions).where(_subscriptions.c.account_id == account_id,
+                                             _subscriptions.c.status == 'active')
             ).first()
-            return self._to_domain(sub_model) if sub_model else None
+            return self._to_domain(row) if row else None
         except Exception as e:
             raise ValueError(f'Error getting active subscription: {str(e)}')
         finally:
@@ -96,21 +142,74 @@ class SubscriptionRepository(ISubscriptionRepository):
         finally:
             self.session.close()
     
+    def get_by_status_summary(self, status: str) -> List[Tuple[int, int, int, int, str]]:
+        """(subscription_id, account_id, package_id, remaining_credits, end_date ISO string) rows"""
+        try:
+            rows = self.session.execute(
+                select(SubscriptionModel.subscription_id, SubscriptionModel.account_id,
+                       SubscriptionModel.package_id, SubscriptionModel.remaining_credits, _end_date_iso)
+                .where(SubscriptionModel.status == status)
+            ).all()
+            return [tuple(row) for row in rows]
+        except Exception as e:
+            raise ValueError(f'Error getting subscriptions by status: {str(e)}')
+        finally:
+            self.session.close()
+    
+    def get_expiring_soon_summary(self, days: int) -> List[Tuple[int, int, str, int]]:
+        """(subscription_id, account_id, end_date ISO string, remaining_credits) rows, without ORM hydration"""
+        try:
+            today = date.today()
+            rows = self.session.execute(
+                select(SubscriptionModel.subscription_id, SubscriptionModel.account_id,
+                       _end_date_iso, SubscriptionModel.remaining_credits)
+                .where(SubscriptionModel.status == 'active',
+                       SubscriptionModel.end_date <= today + timedelta(days=days),
+                       SubscriptionModel.end_date >= today)
+            ).all()
+            return [tuple(row) for row in rows]
+        except Exception as e:
+            raise ValueError(f'Error getting expiring subscriptions: {str(e)}')
+        finally:
+            self.session.close()
+    
     def deduct_credit(self, subscription_id: int, amount: int) -> Optional[Subscription]:
+        """Atomically deduct credits from an active subscription; None if missing, inactive or insufficient"""
         try:
-            sub_model = self.session.query(SubscriptionModel).filter_by(subscription_id=subscription_id).first()
-            if not sub_model:
-                return None
-            sub_model.remaining_credits -= amount
+            # Check and update in one statement: no race between reading and writing the balance
+            row = self.session.execute(
+                update(_subscriptions)
+                .where(_subscriptions.c.subscription_id == subscription_id,
+                       _subscriptions.c.status == 'active',
+                       _subscriptions.c.remaining_credits >= amount)
+                .values(remaining_credits=_subscriptions.c.remaining_credits - amount)
+                .returning(*_subscriptions.c)
+            ).first()
             self.session.commit()
-            self.session.refresh(sub_model)
-            return self._to_domain(sub_model)
+            return self._to_domain(row) if row else None
         except Exception as e:
             self.session.rollback()
             raise ValueError(f'Error deducting credit: {str(e)}')
         finally:
             self.session.close()
     
+    def add_credit(self, subscription_id: int, amount: int) -> Optional[Subscription]:
+        """Atomically add credits to a subscription; None if missing"""
+        try:
+            row = self.session.execute(
+                update(_subscriptions)
+                .where(_subscriptions.c.subscription_id == subscription_id)
+                .values(remaining_credits=_subscriptions.c.remaining_credits + amount)
+                .returning(*_subscriptions.c)
+            ).first()
+            self.session.commit()
+            return self._to_domain(row) if row else None
+        except Exception as e:
+            self.session.rollback()
+            raise ValueError(f'Error adding credit: {str(e)}')
+        finally:
+            self.session.close()
+    
     def renew_subscription(self, subscription_id: int, new_end_date: date, additional_credits: int) -> Optional[Subscription]:
         try:
             sub_model = self.session.query(SubscriptionModel).filter_by(subscription_id=subscription_id).first()
@@ -181,3 +280,24 @@ class SubscriptionRepository(ISubscriptionRepository):
             raise ValueError(f'Error counting subscriptions by status: {str(e)}')
         finally:
             self.session.close()
+    
+    def get_statistics(self, expiring_days: int) -> dict:
+        """Total, per-status and expiring-soon counts in a single aggregate query"""
+        try:
+            today = date.today()
+            def count_where(condition):
+                return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+            row = self.session.execute(select(
+                func.count(SubscriptionModel.subscription_id).label('total_subscriptions'),
+                count_where(SubscriptionModel.status == 'active').label('active'),
+                count_where(SubscriptionModel.status == 'expired').label('expired'),
+                count_where(SubscriptionModel.status == 'cancelled').label('cancelled'),
+                count_where((SubscriptionModel.status == 'active')
+                            & (SubscriptionModel.end_date <= today + timedelta(days=expiring_days))
+                            & (SubscriptionModel.end_date >= today)).label('expiring_soon')
+            )).one()
+            return dict(row._mapping)
+        except Exception as e:
+            raise ValueError(f'Error getting subscription statistics: {str(e)}')
+        finally:
+            self.session.close()
@@ -6,25 +6,49 @@ Handles account management and authentication
 from typing import List, Optional
 from datetime import datetime
 import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError, InvalidHashError
 from domain.models.account import Account
 from domain.models.iaccount_repository import IAccountRepository
-from domain.exceptions import NotFoundException, ValidationException, ConflictException
+from domain.exceptions import NotFoundException, ValidationException, ConflictException, UnauthorizedException
 from domain.validators import AccountValidator
 
+# Argon2id tuned to roughly 100-150ms per hash on a single core
+_password_hasher = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=1)
+
+# Prefixes of hashes created before the switch to Argon2id (bcrypt.gensalt())
+_LEGACY_BCRYPT_PREFIXES = ('$2a$', '$2b$', '$2y$')
+
+# Argon2id hash of a random throwaway secret (same parameters as above).
+# Verified against when an email is unknown so that failed logins take the
+# same time whether or not the account exists. This only evens out timing
+# against Argon2id accounts: a legacy bcrypt account still verifies slower
+# until its first successful login rehashes it.
+_DUMMY_PASSWORD_HASH = '$argon2id$v=19$m=65536,t=2,p=1$9xwzn0Pa2N7s18K18NTEhA$dnxvnghXW7vYLNp50mcNTcn4Zl34gPmJA4tIEIXbpTI'
+
 
 class AccountService:
     def __init__(self, repository: IAccountRepository):
         self.repository = repository
     
     def _hash_password(self, password: str) -> str:
-        """Hash password using bcrypt (business logic)"""
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-        return hashed.decode('utf-8')
+        """Hash password using Argon2id (business logic)"""
+        return _password_hasher.hash(password)
     
     def _verify_password(self, password: str, password_hash: str) -> bool:
-        """Verify password against hash"""
-        return bcrypt.checkpw(password.encode('utf-8'), password_hash.encode('utf-8'))
+        """Verify password against an Argon2id or legacy bcrypt hash (both compare in constant time)"""
+        if password_hash.startswith(_LEGACY_BCRYPT_PREFIXES):
+            return bcrypt.checkpw(password.encode('utf-8'), password_hash.encode('utf-8'))
+        try:
+            return _password_hasher.verify(password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+    
+    def _needs_rehash(self, password_hash: str) -> bool:
+        """Check if a stored hash is bcrypt or uses outdated Argon2 parameters"""
+        if password_hash.startswith(_LEGACY_BCRYPT_PREFIXES):
+            return True
+        return _password_hasher.check_needs_rehash(password_hash)
     
     def register_account(self, email: str, password: str, role_id: int, 
                         clinic_id: Optional[int] = None, status: str = 'active') -> Account:
@@ -83,21 +107,28 @@ class AccountService:
             Account: Authenticated account domain model
             
         Raises:
-            ValidationException: If credentials are invalid
-            NotFoundException: If account not found
+            UnauthorizedException: If the email is unknown or the password is wrong
+                (same message for both, so the response doesn't reveal which emails exist)
+            ValidationException: If the account is not active
         """
         # 1. Get account by email
         account = self.repository.get_by_email(email)
         if not account:
-            raise NotFoundException("Invalid email or password")
+            # Burn the same hashing work as a real check to avoid leaking which emails exist
+            self._verify_password(password, _DUMMY_PASSWORD_HASH)
+            raise UnauthorizedException("Invalid email or password")
+        
+        # 2. Verify password (business logic - moved from controller)
+        if not self._verify_password(password, account.password_hash):
+            raise UnauthorizedException("Invalid email or password")
         
-        # 2. Check account status
+        # 3. Check account status (only after the password, so it can't be used to probe emails)
         if account.status != 'active':
             raise ValidationException("Account is not active. Please contact administrator.")
         
-        # 3. Verify password (business logic - moved from controller)
-        if not self._verify_password(password, account.password_hash):
-            raise ValidationException("Invalid email or password")
+        # 4. Upgrade legacy bcrypt hashes to Argon2id while the plain password is at hand
+        if self._needs_rehash(account.password_hash):
+            self.repository.update_password(account.account_id, self._hash_password(password))
         
         return account
     
@@ -161,6 +192,19 @@ class AccountService:
         """Check if email already exists"""
         return self.repository.check_email_exists(email)
     
+    def validate_account_references(self, role_id: int, clinic_id: Optional[int] = None) -> None:
+        """
+        Ensure the role and optional clinic referenced by an account exist
+        
+        Raises:
+            NotFoundException: If role or clinic not found
+        """
+        role_exists, clinic_exists = self.repository.check_references_exist(role_id, clinic_id)
+        if not role_exists:
+            raise NotFoundException("Role not found")
+        if not clinic_exists:
+            raise NotFoundException("Clinic not found")
+    
     def create_account(self, email: str, password: str, role_id: int,
                       clinic_id: Optional[int] = None, status: str = 'active') -> Account:
         """
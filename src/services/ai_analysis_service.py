@@ -9,6 +9,8 @@ from domain.models.ai_analysis import AiAnalysis
 from domain.models.iai_analysis_repository import IAiAnalysisRepository
 from domain.exceptions import NotFoundException, ValidationException
 
+VALID_ANALYSIS_STATUSES = ('pending', 'processing', 'completed', 'failed')
+
 
 class AiAnalysisService:
     def __init__(self, repository: IAiAnalysisRepository):
@@ -29,9 +31,8 @@ class AiAnalysisService:
             ValidationException: If status is invalid
         """
         # Validate status
-        valid_statuses = ['pending', 'processing', 'completed', 'failed']
-        if status not in valid_statuses:
-            raise ValidationException(f"Invalid status '{status}'. Must be one of: {', '.join(valid_statuses)}")
+        if status not in VALID_ANALYSIS_STATUSES:
+            raise ValidationException(f"Invalid status '{status}'. Must be one of: {', '.join(VALID_ANALYSIS_STATUSES)}")
         
         return self.repository.add(
             image_id=image_id,
@@ -137,12 +138,13 @@ class AiAnalysisService:
     
     def get_analysis_statistics(self) -> dict:
         """Get analysis statistics"""
+        status_counts = self.repository.count_grouped_by_status()
         return {
-            'total_analyses': len(self.repository.get_all()),
-            'pending': self.repository.count_by_status('pending'),
-            'processing': self.repository.count_by_status('processing'),
-            'completed': self.repository.count_by_status('completed'),
-            'failed': self.repository.count_by_status('failed'),
+            'total_analyses': sum(status_counts.values()),
+            'pending': status_counts.get('pending', 0),
+            'processing': status_counts.get('processing', 0),
+            'completed': status_counts.get('completed', 0),
+            'failed': status_counts.get('failed', 0),
             'avg_processing_time': self.repository.get_average_processing_time()
         }
     
@@ -9,6 +9,8 @@ from domain.models.doctor_review import DoctorReview
 from domain.models.idoctor_review_repository import IDoctorReviewRepository
 from domain.exceptions import NotFoundException, ValidationException
 
+VALID_REVIEW_STATUSES = ('pending', 'approved', 'rejected', 'needs_revision')
+
 
 class DoctorReviewService:
     def __init__(self, repository: IDoctorReviewRepository):
@@ -32,9 +34,8 @@ class DoctorReviewService:
             ValidationException: If validation fails
         """
         # Validate status
-        valid_statuses = ['pending', 'approved', 'rejected', 'needs_revision']
-        if validation_status.lower() not in valid_statuses:
-            raise ValidationException(f"Invalid validation status. Must be one of: {valid_statuses}")
+        if validation_status.lower() not in VALID_REVIEW_STATUSES:
+            raise ValidationException(f"Invalid validation status. Must be one of: {list(VALID_REVIEW_STATUSES)}")
         
         review = self.repository.add(
             analysis_id=analysis_id,
@@ -123,25 +124,17 @@ class DoctorReviewService:
     
     def get_review_statistics(self) -> dict:
         """
-        Get review statistics (optimized - uses count queries instead of get_all)
+        Get review statistics (optimized - one grouped count query instead of get_all)
         
         Returns:
             dict: Review statistics
         """
-        # Optimized: Use count queries instead of loading all reviews
-        total = sum([
-            self.repository.count_by_status('pending'),
-            self.repository.count_by_status('approved'),
-            self.repository.count_by_status('rejected'),
-            self.repository.count_by_status('needs_revision')
-        ])
+        status_counts = self.repository.count_grouped_by_status()
+        counts = {status: status_counts.get(status, 0) for status in VALID_REVIEW_STATUSES}
         
         return {
-            'total_reviews': total,
-            'pending': self.repository.count_by_status('pending'),
-            'approved': self.repository.count_by_status('approved'),
-            'rejected': self.repository.count_by_status('rejected'),
-            'needs_revision': self.repository.count_by_status('needs_revision')
+            'total_reviews': sum(counts.values()),
+            **counts
         }
     
     def get_feedback_aggregation(self, doctor_id: Optional[int] = None) -> dict:
@@ -3,7 +3,7 @@ Medical Report Service - Business Logic Layer
 Handles medical report generation and management
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime, date
 from domain.models.medical_report import MedicalReport
 from domain.models.imedical_report_repository import IMedicalReportRepository
@@ -32,6 +32,10 @@ class MedicalReportService:
         """Get report by analysis ID"""
         return self.repository.get_by_analysis_id(analysis_id)
     
+    def get_reports_by_analyses(self, analysis_ids: List[int]) -> Dict[int, MedicalReport]:
+        """Get reports for several analyses at once, keyed by analysis ID"""
+        return self.repository.get_by_analysis_ids(analysis_ids)
+    
     def get_reports_by_patient(self, patient_id: int) -> List[MedicalReport]:
         """Get all reports for a patient"""
         return self.repository.get_by_patient(patient_id)
@@ -40,6 +44,10 @@ class MedicalReportService:
         """Get recent reports for a patient"""
         return self.repository.get_recent_by_patient(patient_id, limit)
     
+    def get_recent_reports_by_patients(self, patient_ids: List[int], limit: int = 5) -> Dict[int, List[MedicalReport]]:
+        """Get recent reports for several patients at once, keyed by patient ID"""
+        return self.repository.get_recent_by_patients(patient_ids, limit)
+    
     def get_reports_by_doctor(self, doctor_id: int) -> List[MedicalReport]:
         """Get all reports by a doctor"""
         return self.repository.get_by_doctor(doctor_id)
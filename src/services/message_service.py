@@ -3,17 +3,43 @@ Message Service - Business Logic Layer
 Handles message management in conversations
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 from domain.models.message import Message
 from domain.models.imessage_repository import IMessageRepository
 from domain.exceptions import NotFoundException, ValidationException
 
+# Sender types are stored lowercase; anything else can never match a row
+VALID_SENDER_TYPES = ('patient', 'doctor')
+
 
 class MessageService:
     def __init__(self, repository: IMessageRepository):
         self.repository = repository
     
+    def _normalize_sender_type(self, sender_type: str) -> str:
+        """Lowercase sender type and reject unknown values"""
+        normalized = sender_type.lower()
+        if normalized not in VALID_SENDER_TYPES:
+            raise ValidationException(f"Invalid sender type. Must be one of: {list(VALID_SENDER_TYPES)}")
+        return normalized
+    
+    def _validate_message(self, sender_type: str, content: str, message_type: str):
+        """Validate a message and return the normalized (sender_type, message_type)"""
+        # Validate sender type
+        sender_type = self._normalize_sender_type(sender_type)
+        
+        # Validate message type
+        valid_message_types = ['text', 'image', 'file']
+        if message_type.lower() not in valid_message_types:
+            raise ValidationException(f"Invalid message type. Must be one of: {valid_message_types}")
+        
+        # Validate content
+        if not content or not content.strip():
+            raise ValidationException("Message content is required")
+        
+        return sender_type, message_type.lower()
+    
     def send_message(self, conversation_id: int, sender_type: str, 
                     sender_name: str, content: str, 
                     message_type: str = 'text') -> Message:
@@ -33,26 +59,14 @@ class MessageService:
         Raises:
             ValidationException: If validation fails
         """
-        # Validate sender type
-        valid_sender_types = ['patient', 'doctor']
-        if sender_type.lower() not in valid_sender_types:
-            raise ValidationException(f"Invalid sender type. Must be one of: {valid_sender_types}")
-        
-        # Validate message type
-        valid_message_types = ['text', 'image', 'file']
-        if message_type.lower() not in valid_message_types:
-            raise ValidationException(f"Invalid message type. Must be one of: {valid_message_types}")
-        
-        # Validate content
-        if not content or not content.strip():
-            raise ValidationException("Message content is required")
+        sender_type, message_type = self._validate_message(sender_type, content, message_type)
         
         message = self.repository.add(
             conversation_id=conversation_id,
-            sender_type=sender_type.lower(),
+            sender_type=sender_type,
             sender_name=sender_name,
             content=content,
-            message_type=message_type.lower(),
+            message_type=message_type,
             sent_at=datetime.now()
         )
         
@@ -63,13 +77,21 @@ class MessageService:
     
     def send_batch_messages(self, conversation_ids: List[int], sender_type: str,
                            sender_name: str, content: str) -> List[Message]:
-        """Send message to multiple conversations"""
-        messages = []
-        for conv_id in conversation_ids:
-            message = self.send_message(conv_id, sender_type, sender_name, content)
-            if message:
-                messages.append(message)
-        return messages
+        """Send message to multiple conversations (batched INSERTs)"""
+        sender_type, message_type = self._validate_message(sender_type, content, 'text')
+        
+        sent_at = datetime.now()
+        return self.repository.add_many([
+            {
+                'conversation_id': conv_id,
+                'sender_type': sender_type,
+                'sender_name': sender_name,
+                'content': content,
+                'message_type': message_type,
+                'sent_at': sent_at
+            }
+            for conv_id in conversation_ids
+        ])
     
     def get_message_by_id(self, message_id: int) -> Message:
         """
@@ -87,12 +109,26 @@ class MessageService:
         """Get all messages in a conversation"""
         return self.repository.get_by_conversation(conversation_id)
     
+    def get_recent_messages(self, conversation_id: int, limit: int) -> List[Message]:
+        """Get the most recent messages in a conversation (oldest first)"""
+        return self.repository.get_recent_by_conversation(conversation_id, limit)
+    
+    def get_last_messages(self, conversation_ids: List[int]) -> Dict[int, Message]:
+        """Get the latest message of several conversations at once, keyed by conversation ID"""
+        return self.repository.get_last_messages(conversation_ids)
+    
     def get_last_message(self, conversation_id: int) -> Optional[Message]:
         """Get last message in conversation"""
         return self.repository.get_last_message(conversation_id)
     
     def get_messages_by_sender(self, conversation_id: int, sender_type: str) -> List[Message]:
-        """Get messages by sender type"""
+        """
+        Get messages by sender type
+        
+        Raises:
+            ValidationException: If sender type is not 'patient' or 'doctor'
+        """
+        sender_type = self._normalize_sender_type(sender_type)
         return self.repository.get_by_sender(conversation_id, sender_type)
     
     def search_messages(self, conversation_id: int, search_term: str) -> List[Message]:
@@ -107,8 +143,8 @@ class MessageService:
         """Delete message"""
         return self.repository.delete(message_id)
     
-    def delete_all_by_conversation(self, conversation_id: int) -> bool:
-        """Delete all messages in a conversation"""
+    def delete_all_by_conversation(self, conversation_id: int) -> int:
+        """Delete all messages in a conversation, returning how many were removed"""
         return self.repository.delete_all_by_conversation(conversation_id)
     
     def count_messages(self, conversation_id: int) -> int:
@@ -117,6 +153,7 @@ class MessageService:
     
     def count_by_sender(self, conversation_id: int, sender_type: str) -> int:
         """Count messages by sender"""
+        sender_type = self._normalize_sender_type(sender_type)
         return self.repository.count_by_sender(conversation_id, sender_type)
     
     def get_message_statistics(self, conversation_id: int) -> dict:
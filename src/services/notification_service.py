@@ -3,7 +3,7 @@ Notification Service - Business Logic Layer
 Handles notification management
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 from domain.models.notification import Notification
 from domain.models.inotification_repository import INotificationRepository
@@ -92,13 +92,20 @@ class NotificationService:
 
     def broadcast_notification(self, account_ids: List[int], notification_type: str, 
                               content: str) -> List[Notification]:
-        """Broadcast notification to multiple users"""
-        notifications = []
-        for account_id in account_ids:
-            notification = self.send_notification(account_id, notification_type, content)
-            if notification:
-                notifications.append(notification)
-        return notifications
+        """Broadcast notification to multiple users (batched INSERTs)"""
+        if not content:
+            raise ValidationException("Notification content is required")
+        
+        created_at = datetime.now()
+        return self.repository.add_many([
+            {
+                'account_id': account_id,
+                'notification_type': notification_type,
+                'content': content,
+                'created_at': created_at
+            }
+            for account_id in account_ids
+        ])
     
     def get_notification_by_id(self, notification_id: int) -> Notification:
         """
@@ -144,6 +151,10 @@ class NotificationService:
         """Count unread notifications"""
         return self.repository.count_unread(account_id)
     
+    def get_unread_counts_for_accounts(self, account_ids: List[int]) -> Dict[int, int]:
+        """Count unread notifications for several accounts at once"""
+        return self.repository.get_unread_counts_for_accounts(account_ids)
+    
     def count_by_type(self, account_id: int, notification_type: str) -> int:
         """Count notifications by type"""
         return self.repository.count_by_type(account_id, notification_type)
@@ -3,7 +3,7 @@ Payment Service - Business Logic Layer
 Handles payment processing and management
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime, date
 from decimal import Decimal
 from domain.models.payment import Payment
@@ -11,6 +11,9 @@ from domain.models.ipayment_repository import IPaymentRepository
 from domain.exceptions import NotFoundException, ValidationException
 from domain.validators import PaymentValidator
 
+# Period sizes accepted by get_revenue_grouped
+REVENUE_BUCKETS = ('day', 'month', 'year')
+
 
 class PaymentService:
     def __init__(self, repository: IPaymentRepository):
@@ -161,19 +164,25 @@ class PaymentService:
         """Get revenue by date range"""
         return self.repository.get_revenue_by_date_range(start_date, end_date)
     
+    def get_revenue_grouped(self, start_date: date, end_date: date, bucket: str = 'month') -> List[Tuple[date, Decimal]]:
+        """Get completed revenue per day, month or year within a date range"""
+        if bucket not in REVENUE_BUCKETS:
+            raise ValidationException(f"Invalid bucket. Must be one of: {list(REVENUE_BUCKETS)}")
+        return self.repository.get_revenue_grouped(start_date, end_date, bucket)
+    
     def count_by_status(self, status: str) -> int:
         """Count payments by status"""
         return self.repository.count_by_status(status)
     
     def get_payment_statistics(self) -> dict:
         """Get payment statistics"""
-        all_payments = self.repository.get_all()
+        status_counts = self.repository.count_grouped_by_status()
         return {
-            'total_payments': len(all_payments),
-            'pending': self.repository.count_by_status('pending'),
-            'completed': self.repository.count_by_status('completed'),
-            'failed': self.repository.count_by_status('failed'),
-            'refunded': self.repository.count_by_status('refunded'),
+            'total_payments': sum(status_counts.values()),
+            'pending': status_counts.get('pending', 0),
+            'completed': status_counts.get('completed', 0),
+            'failed': status_counts.get('failed', 0),
+            'refunded': status_counts.get('refunded', 0),
             'total_revenue': float(self.repository.get_total_revenue('completed')),
             'today_revenue': float(self.repository.get_revenue_by_date_range(date.today(), date.today()))
         }
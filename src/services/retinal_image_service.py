@@ -8,7 +8,11 @@ from datetime import datetime
 from domain.models.retinal_image import RetinalImage
 from domain.models.iretinal_image_repository import IRetinalImageRepository
 from domain.exceptions import NotFoundException, ValidationException
-from domain.validators import RetinalImageValidator
+from domain.validators import RetinalImageValidator, VALID_EYE_SIDES
+
+VALID_IMAGE_STATUSES = ('uploaded', 'processing', 'analyzed', 'error')
+# Bulk upload accepts a narrower set of image types than single uploads
+BULK_IMAGE_TYPES = ('fundus', 'oct', 'angiography')
 
 
 class RetinalImageService:
@@ -42,9 +46,8 @@ class RetinalImageService:
         RetinalImageValidator.validate_image_url(image_url)
         
         # Business rule: Validate status
-        valid_statuses = ['uploaded', 'processing', 'analyzed', 'error']
-        if status not in valid_statuses:
-            raise ValidationException(f"Invalid status. Must be one of: {valid_statuses}")
+        if status not in VALID_IMAGE_STATUSES:
+            raise ValidationException(f"Invalid status. Must be one of: {list(VALID_IMAGE_STATUSES)}")
         
         image = self.repository.add(
             patient_id=patient_id,
@@ -102,6 +105,20 @@ class RetinalImageService:
         """Mark image as error"""
         return self.repository.mark_as_error(image_id)
     
+    def mark_many_as(self, status: str, image_ids: List[int]) -> int:
+        """
+        Set the status of a batch of images with one UPDATE per 1000 IDs
+        
+        Returns:
+            int: Number of images updated (unknown IDs are ignored)
+            
+        Raises:
+            ValidationException: If status is invalid
+        """
+        if status not in VALID_IMAGE_STATUSES:
+            raise ValidationException(f"Invalid status. Must be one of: {list(VALID_IMAGE_STATUSES)}")
+        return self.repository.mark_many_as(status, image_ids)
+    
     def update_image(self, image_id: int, **kwargs) -> Optional[RetinalImage]:
         """Update image information"""
         return self.repository.update(image_id, **kwargs)
@@ -116,12 +133,13 @@ class RetinalImageService:
     
     def get_image_statistics(self) -> dict:
         """Get image statistics"""
+        status_counts = self.repository.count_grouped_by_status()
         return {
-            'total_images': len(self.repository.get_all()),
-            'uploaded': self.repository.count_by_status('uploaded'),
-            'processing': self.repository.count_by_status('processing'),
-            'analyzed': self.repository.count_by_status('analyzed'),
-            'error': self.repository.count_by_status('error')
+            'total_images': sum(status_counts.values()),
+            'uploaded': status_counts.get('uploaded', 0),
+            'processing': status_counts.get('processing', 0),
+            'analyzed': status_counts.get('analyzed', 0),
+            'error': status_counts.get('error', 0)
         }
     
     def upload_bulk_images(self, images_data: List[dict]) -> Dict[str, Any]:
@@ -132,8 +150,7 @@ class RetinalImageService:
         for img_data in images_data:
             try:
                 # Validate image type
-                valid_types = ['fundus', 'oct', 'angiography']
-                if img_data.get('image_type') not in valid_types:
+                if img_data.get('image_type') not in BULK_IMAGE_TYPES:
                     errors.append({
                         'index': len(uploaded_images) + len(errors),
                         'error': f"Invalid image type: {img_data.get('image_type')}"
@@ -141,8 +158,7 @@ class RetinalImageService:
                     continue
                 
                 # Validate eye side
-                valid_sides = ['left', 'right', 'both']
-                if img_data.get('eye_side') not in valid_sides:
+                if img_data.get('eye_side') not in VALID_EYE_SIDES:
                     errors.append({
                         'index': len(uploaded_images) + len(errors),
                         'error': f"Invalid eye side: {img_data.get('eye_side')}"
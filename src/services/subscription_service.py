@@ -53,6 +53,23 @@ class SubscriptionService:
         
         return subscription
     
+    def get_package_duration_for_account(self, account_id: int, package_id: int) -> int:
+        """
+        Validate the account and package of a new subscription in one query
+        
+        Returns:
+            int: Package duration_days
+            
+        Raises:
+            NotFoundException: If account or package not found
+        """
+        account_exists, duration_days = self.repository.get_account_and_package(account_id, package_id)
+        if not account_exists:
+            raise NotFoundException("Account not found")
+        if duration_days is None:
+            raise NotFoundException("Service package not found")
+        return duration_days
+    
     def get_subscription_by_id(self, subscription_id: int) -> Subscription:
         """
         Get subscription by ID
@@ -89,6 +106,22 @@ class SubscriptionService:
         
         return subscription.remaining_credits
     
+    def get_account_credits(self, account_id: int) -> dict:
+        """
+        Get remaining credits and active subscription flag for an account (FR-12)
+        
+        Raises:
+            NotFoundException: If account not found
+        """
+        account_exists, remaining_credits = self.repository.get_account_active_credits(account_id)
+        if not account_exists:
+            raise NotFoundException("Account not found")
+        return {
+            'account_id': account_id,
+            'remaining_credits': remaining_credits or 0,
+            'has_active_subscription': remaining_credits is not None
+        }
+    
     def get_subscriptions_by_status(self, status: str) -> List[Subscription]:
         """Get subscriptions by status"""
         return self.repository.get_by_status(status)
@@ -97,6 +130,14 @@ class SubscriptionService:
         """Get subscriptions expiring soon"""
         return self.repository.get_expiring_soon(days)
     
+    def get_subscriptions_by_status_summary(self, status: str) -> List[tuple]:
+        """Get (subscription_id, account_id, package_id, remaining_credits, end_date) rows by status"""
+        return self.repository.get_by_status_summary(status)
+    
+    def get_expiring_soon_summary(self, days: int = 7) -> List[tuple]:
+        """Get (subscription_id, account_id, end_date, remaining_credits) for subscriptions expiring soon"""
+        return self.repository.get_expiring_soon_summary(days)
+    
     def deduct_credit(self, subscription_id: int, amount: int = 1) -> Subscription:
         """
         Deduct credit from subscription with validation
@@ -112,18 +153,26 @@ class SubscriptionService:
             NotFoundException: If subscription not found
             BusinessRuleException: If insufficient credits or subscription not active
         """
-        subscription = self.get_subscription_by_id(subscription_id)
+        updated = self.repository.deduct_credit(subscription_id, amount)
+        if updated:
+            return updated
         
+        # The conditional UPDATE matched nothing: find out why for the error message
+        subscription = self.get_subscription_by_id(subscription_id)
         if subscription.status != 'active':
             raise BusinessRuleException("Subscription is not active")
+        raise BusinessRuleException(f"Insufficient credits. Available: {subscription.remaining_credits}, Required: {amount}")
+    
+    def add_credit(self, subscription_id: int, amount: int) -> Subscription:
+        """
+        Add credits to a subscription
         
-        if subscription.remaining_credits < amount:
-            raise BusinessRuleException(f"Insufficient credits. Available: {subscription.remaining_credits}, Required: {amount}")
-        
-        updated = self.repository.deduct_credit(subscription_id, amount)
+        Raises:
+            NotFoundException: If subscription not found
+        """
+        updated = self.repository.add_credit(subscription_id, amount)
         if not updated:
             raise NotFoundException(f"Subscription {subscription_id} not found")
-        
         return updated
     
     def renew_subscription(self, subscription_id: int, new_end_date: date, 
@@ -169,11 +218,4 @@ class SubscriptionService:
     
     def get_subscription_statistics(self) -> dict:
         """Get subscription statistics"""
-        all_subs = self.repository.get_all()
-        return {
-            'total_subscriptions': len(all_subs),
-            'active': self.repository.count_by_status('active'),
-            'expired': self.repository.count_by_status('expired'),
-            'cancelled': self.repository.count_by_status('cancelled'),
-            'expiring_soon': len(self.repository.get_expiring_soon(7))
-        }
+        return self.repository.get_statistics(expiring_days=7)